@@ -8,6 +8,9 @@ extends Node
 
 var current_track: AudioStreamPlayer = null
 const CONFIG_PATH: String = "user://settings.cfg"
+const MUSIC_ROOT: String = "res://assets/audio/music/"
+## Preferred first: seamless loop renders are OGG/WAV (MP3 pads the loop point); composed tracks ship as MP3
+const MUSIC_EXTENSIONS: Array[String] = ["ogg", "wav", "mp3"]
 
 var master_volume: float = 80.0  # 0-100
 var music_volume: float = 70.0  # 0-100
@@ -17,9 +20,8 @@ func _ready() -> void:
 	# Create title music player
 	title_player = AudioStreamPlayer.new()
 	title_player.name = "TitlePlayer"
-	var title_stream = load("res://assets/audio/music/title_menu_music.mp3")
+	var title_stream = _load_track("title_menu_music")
 	if title_stream:
-		title_stream.loop = true
 		title_player.stream = title_stream
 		title_player.autoplay = false
 		add_child(title_player)
@@ -27,10 +29,8 @@ func _ready() -> void:
 	# Create navigation music player
 	navigation_player = AudioStreamPlayer.new()
 	navigation_player.name = "NavigationPlayer"
-	var nav_stream = load("res://assets/audio/music/navigation_system_music.mp3")
+	var nav_stream = _load_track("navigation_system_music")
 	if nav_stream:
-		# Enable looping for continuous playback
-		nav_stream.loop = true
 		navigation_player.stream = nav_stream
 		navigation_player.autoplay = false
 		add_child(navigation_player)
@@ -38,10 +38,8 @@ func _ready() -> void:
 	# Create tactical mission music player
 	tactical_player = AudioStreamPlayer.new()
 	tactical_player.name = "TacticalPlayer"
-	var tactical_stream = load("res://assets/audio/music/tactical_mission_music.mp3")
+	var tactical_stream = _load_track("tactical_mission_music")
 	if tactical_stream:
-		# Enable looping for continuous playback
-		tactical_stream.loop = true
 		tactical_player.stream = tactical_stream
 		tactical_player.autoplay = false
 		add_child(tactical_player)
@@ -51,6 +49,46 @@ func _ready() -> void:
 	_update_volume()
 
 
+## Load a music track (first of MUSIC_EXTENSIONS present) and set it up to loop
+func _load_track(track_name: String) -> AudioStream:
+	for extension in MUSIC_EXTENSIONS:
+		var path = "%s%s.%s" % [MUSIC_ROOT, track_name, extension]
+		if not ResourceLoader.exists(path):
+			continue
+		var stream = load(path) as AudioStream
+		if stream:
+			_apply_loop_points(stream, _read_loop_metadata(track_name, path.get_file()))
+			return stream
+	push_warning("MusicManager: No music file found for %s" % track_name)
+	return null
+
+
+## Loop metadata written next to a seamless loop render (<track>.loop.json), if it describes this file
+func _read_loop_metadata(track_name: String, file_name: String) -> Dictionary:
+	var path = "%s%s.loop.json" % [MUSIC_ROOT, track_name]
+	if not ResourceLoader.exists(path):
+		return {}
+	var metadata = load(path) as JSON
+	if not metadata or not (metadata.data is Dictionary):
+		push_warning("MusicManager: Failed to read loop metadata: %s" % path)
+		return {}
+	# A render in another format leaves metadata that does not apply to this file
+	if metadata.data.get("file", "") != file_name:
+		return {}
+	return metadata.data
+
+
+## Loop the whole stream, or between the rendered loop points (in samples) when there is metadata
+func _apply_loop_points(stream: AudioStream, loop_info: Dictionary) -> void:
+	if stream is AudioStreamWAV:
+		stream.loop_mode = AudioStreamWAV.LOOP_FORWARD
+		stream.loop_begin = int(loop_info.get("loop_start", 0))
+		stream.loop_end = int(loop_info.get("loop_end", roundi(stream.get_length() * stream.mix_rate)))
+	elif stream is AudioStreamOggVorbis or stream is AudioStreamMP3:
+		stream.loop = true
+		stream.loop_offset = float(loop_info.get("loop_start", 0)) / float(loop_info.get("sample_rate", 44100))
+
+
 ## Play title music
 func play_title_music() -> void:
 	if current_track == title_player:
@@ -1,9 +1,14 @@
 extends Node
 ## SFX Manager - Handles sound effects playback with volume control
 ## Manages a pool of AudioStreamPlayer nodes for concurrent SFX playback
+## Streams are cached by "category/name" so only the first play of a sound hits the loader
+## Sounds with a pre-rendered variant bank play its variants round-robin
 
 const POOL_SIZE: int = 16  # Number of AudioStreamPlayer nodes in the pool
 const CONFIG_PATH: String = "user://settings.cfg"
+const SFX_MANIFEST_PATH: String = "res://assets/audio/sfx/sfx_manifest.json"  # Written by tools/build_sfx_manifest.py
+const SFX_ROOT: String = "res://assets/audio/sfx/"
+const SCENE_CACHE_SIZE: int = 6  # Scene SFX streams kept after playing (least recently used are evicted)
 
 var audio_pool: Array[AudioStreamPlayer] = []
 var pool_index: int = 0
@@ -15,6 +20,15 @@ var scene_volume: float = 100.0  # 0-100 (Separate channel for narrative scene S
 
 var scene_player: AudioStreamPlayer = null
 
+var sfx_paths: Dictionary = {}  # "category/name" -> res:// path (from the SFX manifest)
+var path_keys: Dictionary = {}  # res:// path -> "category/name"
+var stream_cache: Dictionary = {}  # "category/name" -> AudioStream (gameplay and UI SFX, never evicted; null = failed to load)
+var scene_cache: Dictionary = {}  # "category/name" -> AudioStream (scene SFX, bounded)
+var scene_cache_order: Array[String] = []  # Scene cache keys, least recently used first
+var variant_paths: Dictionary = {}  # "category/name" -> Array of res:// variant paths (from the SFX manifest)
+var variant_streams: Dictionary = {}  # "category/name" -> Array of loaded variant AudioStreams
+var variant_index: Dictionary = {}  # "category/name" -> next variant to play
+
 
 func _ready() -> void:
 	# Create pool of AudioStreamPlayer nodes
@@ -31,6 +45,9 @@ func _ready() -> void:
 	scene_player.bus = "Master"
 	add_child(scene_player)
 	
+	# Load the SFX manifest and preload gameplay/UI streams
+	_load_sfx_manifest()
+	
 	# Load volume settings
 	_load_volume_settings()
 	_update_volume()
@@ -62,6 +79,123 @@ func _load_volume_settings() -> void:
 	scene_volume = config.get_value("audio", "scene", 100.0)
 
 
+## Read the SFX manifest and preload every stream in its "preload" categories
+func _load_sfx_manifest() -> void:
+	if not ResourceLoader.exists(SFX_MANIFEST_PATH):
+		push_warning("SFXManager: SFX manifest not found, streams will be loaded on first play: %s" % SFX_MANIFEST_PATH)
+		return
+	
+	var manifest = load(SFX_MANIFEST_PATH) as JSON
+	if not manifest or not (manifest.data is Dictionary):
+		push_warning("SFXManager: Failed to read SFX manifest: %s" % SFX_MANIFEST_PATH)
+		return
+	
+	var categories: Dictionary = manifest.data.get("categories", {})
+	for category in categories:
+		for sfx_name in categories[category]:
+			var key = "%s/%s" % [category, sfx_name]
+			var path: String = categories[category][sfx_name]
+			sfx_paths[key] = path
+			path_keys[path] = key
+	
+	var variants: Dictionary = manifest.data.get("variants", {})
+	for key in variants:
+		variant_paths[key] = variants[key]
+	
+	for category in manifest.data.get("preload", []):
+		for sfx_name in categories.get(category, {}):
+			var key = "%s/%s" % [category, sfx_name]
+			_get_stream(key)
+			if variant_paths.has(key):
+				_load_variants(key)
+
+
+## Key ("category/name") for a path under the SFX root, e.g. "scenes/common_scene/beam"
+func _key_for_path(path: String) -> String:
+	if path_keys.has(path):
+		return path_keys[path]
+	
+	var key = path.trim_prefix(SFX_ROOT).get_basename()
+	path_keys[path] = key
+	if not sfx_paths.has(key):
+		sfx_paths[key] = path
+	return key
+
+
+## Cached stream for a key, loading it on first use; scene SFX go through the bounded scene cache.
+## A failed load is cached as null (for scene SFX too) so it is only attempted and reported once.
+func _get_stream(key: String) -> AudioStream:
+	if stream_cache.has(key):
+		return stream_cache[key]
+	
+	var is_scene = key.begins_with("scenes/")
+	if is_scene and scene_cache.has(key):
+		scene_cache_order.erase(key)
+		scene_cache_order.append(key)
+		return scene_cache[key]
+	
+	var path: String = sfx_paths.get(key, "%s%s.mp3" % [SFX_ROOT, key])
+	var stream = load(path) as AudioStream
+	if not stream:
+		push_warning("SFXManager: Failed to load %saudio file: %s" % ["scene " if is_scene else "", path])
+		stream_cache[key] = null
+		return null
+	
+	if is_scene:
+		scene_cache[key] = stream
+		scene_cache_order.append(key)
+		_evict_scene_streams(SCENE_CACHE_SIZE)
+	else:
+		stream_cache[key] = stream
+	return stream
+
+
+## Load every variant of a sound into its round-robin bank
+func _load_variants(key: String) -> void:
+	var bank: Array[AudioStream] = []
+	for path in variant_paths[key]:
+		var stream = load(path) as AudioStream
+		if stream:
+			bank.append(stream)
+		else:
+			push_warning("SFXManager: Failed to load SFX variant: %s" % path)
+	variant_streams[key] = bank
+	variant_index[key] = 0
+
+
+## Next variant of a sound (round-robin), or null if it has no variant bank
+func _next_variant(key: String) -> AudioStream:
+	if not variant_streams.has(key):
+		if not variant_paths.has(key):
+			return null
+		_load_variants(key)
+	
+	var bank: Array[AudioStream] = variant_streams[key]
+	if bank.is_empty():
+		return null
+	var index: int = variant_index[key]
+	variant_index[key] = (index + 1) % bank.size()
+	return bank[index]
+
+
+## Drop least recently used scene SFX streams until at most max_count remain
+func _evict_scene_streams(max_count: int) -> void:
+	while scene_cache_order.size() > max_count:
+		var key = scene_cache_order.pop_front()
+		# Never evict the stream that is still playing
+		if scene_player and scene_player.playing and scene_player.stream == scene_cache[key]:
+			scene_cache_order.append(key)
+			if scene_cache_order.size() <= 1:
+				return
+			continue
+		scene_cache.erase(key)
+
+
+## Release cached scene SFX streams (e.g. when leaving a dialog-heavy screen)
+func clear_scene_cache() -> void:
+	_evict_scene_streams(0)
+
+
 ## Update volume for all SFX players
 func _update_volume() -> void:
 	var volume_db = _calculate_volume_db()
@@ -133,30 +267,35 @@ func play_sfx(path: String, pitch_scale: float = 1.0) -> void:
 	if path.is_empty():
 		return
 	
+	_play_pooled(_key_for_path(path), pitch_scale)
+
+
+## Play a sound effect by category and name
+## category: "combat", "ui", "interactions"
+## name: Name of the sound file without extension (e.g., "shoot", "click")
+func play_sfx_by_name(category: String, name: String, pitch_scale: float = 1.0) -> void:
+	_play_pooled(category + "/" + name, pitch_scale)
+
+
+## Play a cached stream (by "category/name" key) on the next pooled player
+func _play_pooled(key: String, pitch_scale: float) -> void:
 	# Get next available player from pool
 	var player = _get_available_player()
 	if not player:
 		return  # All players busy, skip this sound
 	
-	# Load and play the sound
-	var stream = load(path)
+	# Prefer the next pre-rendered variant, else the cached stream (loaded on first play)
+	var stream = _next_variant(key)
 	if not stream:
-		push_warning("SFXManager: Failed to load audio file: %s" % path)
-		return
+		stream = _get_stream(key)
+	if not stream:
+		return  # Missing file, already reported by _get_stream
 	
 	player.stream = stream
 	player.pitch_scale = pitch_scale
 	player.play()
 
 
-## Play a sound effect by category and name
-## category: "combat", "ui", "interactions"
-## name: Name of the sound file without extension (e.g., "shoot", "click")
-func play_sfx_by_name(category: String, name: String, pitch_scale: float = 1.0) -> void:
-	var path = "res://assets/audio/sfx/%s/%s.mp3" % [category, name]
-	play_sfx(path, pitch_scale)
-
-
 ## Play use Scene SFX player (dedicated channel, stops previous scene SFX)
 func play_scene_sfx(path: String) -> void:
 	if not scene_player:
@@ -165,10 +304,9 @@ func play_scene_sfx(path: String) -> void:
 	# Stop any currently playing scene SFX first
 	scene_player.stop()
 	
-	var stream = load(path)
+	var stream = _get_stream(_key_for_path(path))
 	if not stream:
-		push_warning("SFXManager: Failed to load scene audio file: %s" % path)
-		return
+		return  # Missing file, already reported by _get_stream
 	
 	scene_player.stream = stream
 	scene_player.play()
@@ -0,0 +1,755 @@
+#!/usr/bin/env python3
+"""
+Shared DSP building blocks for the Last Light Odyssey audio tools.
+Everything here works on whole NumPy arrays at a time, never per sample.
+"""
+
+import functools
+from collections import namedtuple
+
+import numpy as np
+
+SAMPLE_RATE = 44100
+
+# Frames per block for streamed renders
+DEFAULT_BLOCK_SIZE = 4096
+
+WAVEFORMS = ("sine", "saw", "square", "triangle")
+CURVES = ("linear", "exponential")
+
+# Steepness of the "exponential" envelope segments
+EXP_CURVE_STEEPNESS = 5.0
+
+
+# ============================================================================
+# OSCILLATORS
+# ============================================================================
+
+class Oscillator:
+    """A single oscillator voice.
+
+    ``freq`` is either a constant in Hz or a per-sample array of instantaneous
+    frequencies; ``phase`` is the starting phase in cycles (0..1).
+    """
+
+    def __init__(self, freq, amp=1.0, waveform="sine", phase=0.0):
+        if waveform not in WAVEFORMS:
+            raise ValueError(f"Unknown waveform '{waveform}' (expected one of {WAVEFORMS})")
+        self.freq = freq
+        self.amp = amp
+        self.waveform = waveform
+        self.phase = phase
+
+    def render(self, t, sample_rate=SAMPLE_RATE):
+        """Render this voice alone over the time vector ``t``."""
+        return OscillatorBank(sample_rate).add_voice(self).render(t)[0]
+
+
+class OscillatorBank:
+    """Renders many oscillators in one pass.
+
+    Instantaneous frequency is integrated into phase with a cumulative sum, so
+    swept and modulated tones stay continuous instead of computing
+    ``sin(2*pi*f(t)*t)`` directly. Methods that add voices return the bank so
+    calls can be chained::
+
+        shimmer, hum = OscillatorBank().add(200 + 800 * lfo, 0.4).add(100, 0.3).render(t)
+    """
+
+    def __init__(self, sample_rate=SAMPLE_RATE):
+        self.sample_rate = sample_rate
+        self.voices = []
+
+    def add(self, freq, amp=1.0, waveform="sine", phase=0.0):
+        """Add a voice and return the bank."""
+        return self.add_voice(Oscillator(freq, amp, waveform, phase))
+
+    def add_voice(self, osc):
+        """Add an existing Oscillator and return the bank."""
+        self.voices.append(osc)
+        return self
+
+    def phases(self, num_samples):
+        """Return the accumulated phase (in cycles) of every voice, shape (voices, samples)."""
+        freqs = np.empty((len(self.voices), num_samples), dtype=np.float64)
+        for row, osc in zip(freqs, self.voices):
+            row[:] = osc.freq
+        # Exclusive running sum so every voice starts exactly at its initial phase
+        phase = np.cumsum(freqs, axis=1)
+        travelled = phase[:, -1] / self.sample_rate
+        phase -= freqs
+        phase /= self.sample_rate
+        start = np.array([osc.phase for osc in self.voices], dtype=np.float64)
+        if _active_phase_state is not None:
+            # Streaming: continue from where this bank ended in the previous block
+            carried = _active_phase_state.carry(len(self.voices))
+            start += carried
+            _active_phase_state.store((carried + travelled) % 1.0)
+        phase += start[:, None]
+        return phase
+
+    def render(self, t):
+        """Render every voice over ``t``; returns an array of shape (voices, samples)."""
+        phase = self.phases(len(t))
+        out = np.empty_like(phase)
+        if _oscillator_engine[0] == "wavetable":
+            for row, voice_phase, osc in zip(out, phase, self.voices):
+                row[:] = oscillate(voice_phase, osc.freq, osc.waveform, self.sample_rate)
+        else:
+            waveforms = np.array([osc.waveform for osc in self.voices])
+            for waveform in set(waveforms):
+                rows = waveforms == waveform
+                out[rows] = _WAVE_SHAPES[waveform](phase[rows])
+        out *= np.array([osc.amp for osc in self.voices], dtype=np.float64)[:, None]
+        return out
+
+    def render_mix(self, t):
+        """Render every voice and sum them into a single signal."""
+        return self.render(t).sum(axis=0)
+
+
+class PhaseState:
+    """Carries oscillator phase across the blocks of a streamed render.
+
+    While active (``with PhaseState() as state:``), every OscillatorBank
+    rendered in a block is matched to the bank rendered at the same position
+    in the previous block and starts from its end phase. Generators therefore
+    need no changes to stream, as long as they create the same banks in the
+    same order for every block. Call ``begin_block()`` before each block.
+    """
+
+    def __init__(self):
+        self._previous = []
+        self._current = []
+
+    def begin_block(self):
+        """Start a new block: phases stored in the last block become the carry-in."""
+        self._previous, self._current = self._current, []
+
+    def carry(self, num_voices):
+        """Phase offsets for the next bank in this block (zero on the first block)."""
+        slot = len(self._current)
+        if slot < len(self._previous) and len(self._previous[slot]) == num_voices:
+            return self._previous[slot].copy()
+        return np.zeros(num_voices)
+
+    def store(self, end_phase):
+        """Record the end phase of the bank that just rendered."""
+        self._current.append(end_phase)
+
+    def __enter__(self):
+        global _active_phase_state
+        self._outer = _active_phase_state
+        _active_phase_state = self
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        global _active_phase_state
+        _active_phase_state = self._outer
+
+
+_active_phase_state = None
+
+
+def _sine_shape(phase):
+    return np.sin(2 * np.pi * phase)
+
+
+def _saw_shape(phase):
+    return 2.0 * (phase % 1.0) - 1.0
+
+
+def _square_shape(phase):
+    return np.where(phase % 1.0 < 0.5, 1.0, -1.0)
+
+
+def _triangle_shape(phase):
+    return 1.0 - 4.0 * np.abs((phase + 0.25) % 1.0 - 0.5)
+
+
+_WAVE_SHAPES = {
+    "sine": _sine_shape,
+    "saw": _saw_shape,
+    "square": _square_shape,
+    "triangle": _triangle_shape,
+}
+
+
+# ============================================================================
+# WAVETABLES
+# ============================================================================
+
+OSCILLATOR_ENGINES = ("math", "wavetable")
+INTERPOLATIONS = ("linear", "cubic")
+
+# Samples per single-cycle table
+WAVETABLE_SIZE = 2048
+
+# Top fundamental of the first table band; every further band covers one octave
+WAVETABLE_BASE_FREQ = 20.0
+
+# Guard samples around each table so interpolation never has to wrap indices
+_GUARD_BEFORE = 1
+_GUARD_AFTER = 2
+
+
+def _harmonic_amplitudes(waveform, num_harmonics):
+    """Sine-series coefficients of each waveform, matching the phase of the math shapes."""
+    n = np.arange(1, num_harmonics + 1, dtype=np.float64)
+    if waveform == "sine":
+        return (n == 1).astype(np.float64)
+    if waveform == "saw":
+        return -2.0 / (np.pi * n)
+    odd = n % 2 == 1
+    if waveform == "square":
+        return np.where(odd, 4.0 / (np.pi * n), 0.0)
+    # triangle
+    return np.where(odd, 8.0 / (np.pi * n) ** 2 * np.where((n - 1) % 4 == 0, 1.0, -1.0), 0.0)
+
+
+class Wavetable:
+    """Band-limited single-cycle tables for one waveform.
+
+    Band ``k`` is used for fundamentals up to ``base_freq * 2**k`` and only
+    holds the harmonics that stay below Nyquist at that frequency, so bright
+    waveforms swept upwards lose harmonics instead of aliasing.
+    """
+
+    def __init__(self, waveform, sample_rate=SAMPLE_RATE, size=WAVETABLE_SIZE, base_freq=WAVETABLE_BASE_FREQ):
+        if waveform not in WAVEFORMS:
+            raise ValueError(f"Unknown waveform '{waveform}' (expected one of {WAVEFORMS})")
+        if size & (size - 1):
+            raise ValueError(f"Wavetable size must be a power of two, got {size}")
+        self.waveform = waveform
+        self.size = size
+        self.base_freq = base_freq
+        nyquist = sample_rate / 2.0
+        num_bands = 1 if waveform == "sine" else max(1, int(np.ceil(np.log2(nyquist / base_freq))))
+        self.tables = np.empty((num_bands, _GUARD_BEFORE + size + _GUARD_AFTER), dtype=np.float64)
+        for band, padded in enumerate(self.tables):
+            top_freq = base_freq * 2.0 ** band
+            num_harmonics = max(1, min(size // 2 - 1, int(nyquist // top_freq)))
+            spectrum = np.zeros(size // 2 + 1, dtype=np.complex128)
+            spectrum[1:num_harmonics + 1] = -0.5j * size * _harmonic_amplitudes(waveform, num_harmonics)
+            table = np.fft.irfft(spectrum, size)
+            padded[:_GUARD_BEFORE] = table[-_GUARD_BEFORE:]
+            padded[_GUARD_BEFORE:_GUARD_BEFORE + size] = table
+            padded[_GUARD_BEFORE + size:] = table[:_GUARD_AFTER]
+        self.tables.setflags(write=False)
+
+    def band(self, freq):
+        """Table band for a frequency (scalar or array)."""
+        # frexp's exponent is ceil(log2(x)) except at exact powers of two, which
+        # land one band higher (fewer harmonics, still alias-free)
+        _, exponent = np.frexp(np.abs(freq) / self.base_freq)
+        return np.clip(exponent, 0, len(self.tables) - 1)
+
+    def lookup(self, phase, freq, interpolation="linear"):
+        """Read the table at ``phase`` (in cycles) for a scalar or per-sample ``freq``."""
+        if interpolation not in INTERPOLATIONS:
+            raise ValueError(f"Unknown interpolation '{interpolation}' (expected one of {INTERPOLATIONS})")
+        pos = np.multiply(phase, self.size, dtype=np.float64)
+        index = np.floor(pos)
+        frac = pos - index
+        index = index.astype(np.intp)
+        index &= self.size - 1
+        index += _GUARD_BEFORE
+        band = self.band(freq)
+        if np.ndim(band) == 0:
+            table = self.tables[band]
+        else:
+            # Per-sample band selection: index into the flattened table set
+            table = self.tables.ravel()
+            index += np.broadcast_to(band, index.shape) * self.tables.shape[1]
+        y0 = table.take(index)
+        index += 1
+        y1 = table.take(index)
+        if interpolation == "linear":
+            y1 -= y0
+            y1 *= frac
+            y1 += y0
+            return y1
+        # Cubic Hermite (Catmull-Rom) through the four surrounding samples
+        ym1 = table.take(index - 2)
+        y2 = table.take(index + 1)
+        c1 = 0.5 * (y1 - ym1)
+        c2 = ym1 - 2.5 * y0 + 2.0 * y1 - 0.5 * y2
+        c3 = 0.5 * (y2 - ym1) + 1.5 * (y0 - y1)
+        return ((c3 * frac + c2) * frac + c1) * frac + y0
+
+
+@functools.lru_cache(maxsize=None)
+def wavetable(waveform, sample_rate=SAMPLE_RATE):
+    """Shared (read-only) Wavetable for a waveform, built on first use."""
+    return Wavetable(waveform, sample_rate)
+
+
+_oscillator_engine = ("wavetable", "linear")
+
+
+def set_oscillator_engine(engine="wavetable", interpolation="linear"):
+    """Choose how oscillators are evaluated: band-limited tables or direct math."""
+    if engine not in OSCILLATOR_ENGINES:
+        raise ValueError(f"Unknown oscillator engine '{engine}' (expected one of {OSCILLATOR_ENGINES})")
+    if interpolation not in INTERPOLATIONS:
+        raise ValueError(f"Unknown interpolation '{interpolation}' (expected one of {INTERPOLATIONS})")
+    global _oscillator_engine
+    _oscillator_engine = (engine, interpolation)
+
+
+def oscillator_engine():
+    """The current ``(engine, interpolation)`` pair."""
+    return _oscillator_engine
+
+
+def oscillate(phase, freq, waveform="sine", sample_rate=SAMPLE_RATE):
+    """Evaluate a waveform at ``phase`` (in cycles) with the current oscillator engine.
+
+    ``freq`` (scalar or per-sample) selects the band-limited table; the math
+    engine ignores it.
+    """
+    engine, interpolation = _oscillator_engine
+    if engine == "math":
+        return _WAVE_SHAPES[waveform](phase)
+    return wavetable(waveform, sample_rate).lookup(phase, freq, interpolation)
+
+
+# ============================================================================
+# BLOCK STREAMING
+# ============================================================================
+
+def iter_blocks(num_samples, block_size=DEFAULT_BLOCK_SIZE, sample_rate=SAMPLE_RATE):
+    """Yield ``(start, t)`` for consecutive blocks covering ``num_samples`` samples.
+
+    ``t`` holds the absolute sample times of the block, so generators written
+    for a whole-clip time vector work unchanged on blocks.
+    """
+    for start in range(0, num_samples, block_size):
+        count = min(block_size, num_samples - start)
+        yield start, np.arange(start, start + count, dtype=np.float64) / sample_rate
+
+
+# ============================================================================
+# ENVELOPES
+# ============================================================================
+
+def envelope_curve(x, breakpoints, levels, curve="linear"):
+    """Evaluate a piecewise envelope at positions ``x``.
+
+    ``breakpoints`` are increasing segment start positions (same units as
+    ``x``) and ``levels`` the envelope level at each breakpoint. Segments may
+    have zero length (an instant jump); past the last breakpoint the final
+    level is held.
+    """
+    if curve not in CURVES:
+        raise ValueError(f"Unknown envelope curve '{curve}' (expected one of {CURVES})")
+    breakpoints = np.asarray(breakpoints, dtype=np.float64)
+    levels = np.asarray(levels, dtype=np.float64)
+    seg = np.clip(np.searchsorted(breakpoints, x, side="right") - 1, 0, len(breakpoints) - 1)
+    nxt = np.minimum(seg + 1, len(breakpoints) - 1)
+    length = breakpoints[nxt] - breakpoints[seg]
+    frac = np.clip((x - breakpoints[seg]) / np.maximum(length, 1e-12), 0.0, 1.0)
+    frac[length <= 0] = 0.0
+    if curve == "exponential":
+        k = EXP_CURVE_STEEPNESS
+        frac = (1.0 - np.exp(-k * frac)) / (1.0 - np.exp(-k))
+    return levels[seg] + (levels[nxt] - levels[seg]) * frac
+
+
+def _frozen(arr):
+    arr.setflags(write=False)
+    return arr
+
+
+def _adsr_breakpoints(num_samples, attack, decay, sustain_level, release, sample_rate):
+    attack_samples = int(attack * sample_rate)
+    decay_samples = int(decay * sample_rate)
+    release_samples = int(release * sample_rate)
+    sustain_samples = num_samples - attack_samples - decay_samples - release_samples
+
+    if sustain_samples < 0:
+        sustain_samples = 0
+        release_samples = num_samples - attack_samples - decay_samples
+        if release_samples < 0:
+            release_samples = 0
+            decay_samples = num_samples - attack_samples
+
+    a = attack_samples
+    d = a + decay_samples
+    s = d + sustain_samples
+    r = s + release_samples
+    return [0, a, d, s, r], [0.0, 1.0, sustain_level, sustain_level, 0.0]
+
+
+@functools.lru_cache(maxsize=128)
+def adsr_envelope(num_samples, attack=0.05, decay=0.1, sustain_level=0.7, release=0.3,
+                  curve="linear", sample_rate=SAMPLE_RATE):
+    """Return a cached, read-only ADSR envelope of ``num_samples`` samples.
+
+    Stage lengths are in seconds. If the clip is too short the sustain stage
+    is dropped first, then the release, then the decay is cut to fit.
+    """
+    breakpoints, levels = _adsr_breakpoints(num_samples, attack, decay, sustain_level, release, sample_rate)
+    x = np.arange(num_samples, dtype=np.float64)
+    return _frozen(envelope_curve(x, breakpoints, levels, curve))
+
+
+def adsr_envelope_block(num_samples, start, count, attack=0.05, decay=0.1, sustain_level=0.7,
+                        release=0.3, curve="linear", sample_rate=SAMPLE_RATE):
+    """Samples ``start:start + count`` of the ADSR envelope of a ``num_samples`` clip.
+
+    Used by streamed renders, which never hold the whole envelope in memory.
+    """
+    breakpoints, levels = _adsr_breakpoints(num_samples, attack, decay, sustain_level, release, sample_rate)
+    x = np.arange(start, start + count, dtype=np.float64)
+    return envelope_curve(x, breakpoints, levels, curve)
+
+
+def _stage_breakpoints(stages, start_level, scale):
+    breakpoints, levels = [0.0], [start_level]
+    for duration, level in stages:
+        breakpoints.append(breakpoints[-1] + duration * scale)
+        levels.append(level)
+    return breakpoints, levels
+
+
+@functools.lru_cache(maxsize=128)
+def stage_envelope(num_samples, stages, start_level=0.0, curve="linear", sample_rate=SAMPLE_RATE):
+    """Return a cached, read-only multi-stage envelope.
+
+    ``stages`` is a tuple of ``(duration_sec, target_level)`` pairs walked in
+    order from ``start_level``; the last level is held to the end.
+    """
+    breakpoints, levels = _stage_breakpoints(stages, start_level, sample_rate)
+    x = np.arange(num_samples, dtype=np.float64)
+    return _frozen(envelope_curve(x, breakpoints, levels, curve))
+
+
+def retrigger_envelope(t, rate, stages, start_level=0.0, curve="linear"):
+    """Restart a multi-stage envelope ``rate`` times per second over ``t``.
+
+    Gives every repeated note (heartbeats, pings, chimes) its own envelope.
+    ``stages`` are ``(duration_sec, target_level)`` pairs as in
+    stage_envelope(); a stage still running when the next note starts is cut.
+    """
+    breakpoints, levels = _stage_breakpoints(stages, start_level, 1.0)
+    note_time = ((t * rate) % 1.0) / rate
+    return envelope_curve(note_time, breakpoints, levels, curve)
+
+
+def apply_envelope(buffer, envelope):
+    """Multiply ``envelope`` into ``buffer`` in place and return the buffer."""
+    buffer *= envelope
+    return buffer
+
+
+@functools.lru_cache(maxsize=16)
+def equal_power_fades(num_samples):
+    """Cached, read-only ``(fade_in, fade_out)`` curves whose powers sum to one.
+
+    ``fade_out`` starts at exactly 1 and ``fade_in`` at 0, so a crossfade
+    begins on the outgoing signal alone.
+    """
+    x = np.arange(num_samples, dtype=np.float64) * (0.5 * np.pi / max(num_samples, 1))
+    return _frozen(np.sin(x)), _frozen(np.cos(x))
+
+
+# ============================================================================
+# NOISE
+# ============================================================================
+
+NOISE_KINDS = ("white", "pink", "brown")
+
+# Number of Voss-McCartney rows used for pink noise (covers ~16 octaves)
+PINK_ROWS = 16
+
+# Spawn-key tag of the per-row pink noise generators (keeps them apart from
+# the call-site streams)
+_PINK_KEY = 0x70696E6B
+
+# Leak of the brown noise integrator (keeps it from drifting off to DC)
+BROWN_LEAK = 0.998
+
+
+def _leaky_integrate(x, leak, y0=0.0, chunk=1024):
+    """Vectorized ``y[n] = leak * y[n-1] + x[n]``, returning (y, last value).
+
+    Each chunk is solved in closed form with a scaled cumulative sum; chunks
+    stay short so the leak**-n scaling cannot overflow.
+    """
+    y = np.empty_like(x)
+    powers = leak ** np.arange(1, chunk + 1, dtype=np.float64)
+    for start in range(0, len(x), chunk):
+        seg = x[start:start + chunk]
+        p = powers[:len(seg)]
+        y[start:start + len(seg)] = p * (y0 + np.cumsum(seg / p))
+        y0 = y[start + len(seg) - 1]
+    return y, y0
+
+
+class _NoiseStream:
+    """State of one noise call site: its own generator plus pink/brown/hold carry."""
+
+    def __init__(self, seed_seq):
+        self.seed_seq = seed_seq
+        self.rng = np.random.default_rng(seed_seq)
+        self.pink_rngs = None
+        self.pink_pos = 0
+        self.pink_rows = np.zeros(PINK_ROWS)
+        self.brown_last = 0.0
+        self.hold_index = None
+        self.hold_value = 0.0
+        self.table_pos = {}
+
+
+class NoiseSource:
+    """Seeded noise generators that render whole blocks at a time.
+
+    Every call site gets its own generator, matched by call order like
+    PhaseState matches oscillator banks: the n-th noise call in a block
+    continues the stream of the n-th call in the previous block. Call
+    ``begin_block()`` before each block of a streamed render; then the
+    samples do not depend on where the blocks are split, and a streamed
+    render equals the one-shot render. Pink, brown, sample-and-hold and
+    table noise also keep their state between blocks, so they join without
+    seams.
+    """
+
+    def __init__(self, seed=None, sample_rate=SAMPLE_RATE):
+        self.sample_rate = sample_rate
+        self._seed_seq = np.random.SeedSequence(seed)
+        self._streams = []
+        self._slot = 0
+
+    def begin_block(self):
+        """Start a new block: the next call continues the first call site's stream."""
+        self._slot = 0
+
+    def _stream(self):
+        if self._slot == len(self._streams):
+            seq = np.random.SeedSequence(self._seed_seq.entropy, spawn_key=(self._slot,))
+            self._streams.append(_NoiseStream(self._seed_seq if self._slot == 0 else seq))
+        stream = self._streams[self._slot]
+        self._slot += 1
+        return stream
+
+    def white(self, shape, amplitude=1.0):
+        """Uniform white noise in [-amplitude, amplitude)."""
+        return self._stream().rng.uniform(-amplitude, amplitude, shape)
+
+    def pink(self, num_samples, amplitude=1.0):
+        """Pink (1/f) noise using the Voss-McCartney algorithm.
+
+        Row ``k`` holds a random value that is redrawn every ``2**k`` samples;
+        the sum of all rows plus fresh white noise falls off at 3 dB/octave.
+        Each row draws from its own generator, so block splits do not change
+        the sequence.
+        """
+        stream = self._stream()
+        if stream.pink_rngs is None:
+            seq = stream.seed_seq
+            stream.pink_rngs = [np.random.default_rng(np.random.SeedSequence(
+                seq.entropy, spawn_key=(*seq.spawn_key, _PINK_KEY, k))) for k in range(PINK_ROWS + 1)]
+        pos = stream.pink_pos + np.arange(num_samples)
+        out = stream.pink_rngs[0].standard_normal(num_samples)
+        for k in range(PINK_ROWS):
+            index = pos >> k
+            first = index[0]
+            # A new value is due at every index after the first one in this block,
+            # and at the first one too if it starts exactly on an update boundary
+            carried = bool(stream.pink_pos & ((1 << k) - 1))
+            fresh = stream.pink_rngs[k + 1].standard_normal(index[-1] - first + 1 - carried)
+            if carried:
+                fresh = np.concatenate(([stream.pink_rows[k]], fresh))
+            out += fresh[index - first]
+            stream.pink_rows[k] = fresh[-1]
+        stream.pink_pos += num_samples
+        out *= amplitude / 3.0 / np.sqrt(PINK_ROWS + 1)
+        return out
+
+    def brown(self, num_samples, amplitude=1.0):
+        """Brown (1/f^2) noise: leaky integration of white noise."""
+        stream = self._stream()
+        steps = stream.rng.standard_normal(num_samples) * np.sqrt(1.0 - BROWN_LEAK ** 2)
+        out, stream.brown_last = _leaky_integrate(steps, BROWN_LEAK, stream.brown_last)
+        return out * (amplitude / 3.0)
+
+    def sample_and_hold(self, t, rate, amplitude=1.0):
+        """Random values in [-amplitude, amplitude) held for ``1 / rate`` seconds each."""
+        stream = self._stream()
+        index = np.floor(np.asarray(t) * rate).astype(np.int64)
+        first = index[0]
+        carried = stream.hold_index == first
+        values = stream.rng.uniform(-1.0, 1.0, index[-1] - first + 1 - carried)
+        if carried:
+            values = np.concatenate(([stream.hold_value], values))
+        stream.hold_index, stream.hold_value = index[-1], values[-1]
+        return values[index - first] * amplitude
+
+    def click_train(self, t, rate, amplitude=1.0):
+        """Poisson-distributed single-sample clicks, ``rate`` clicks/sec on average.
+
+        ``rate`` may be a per-sample array for clicks that speed up or slow down.
+        """
+        expected = np.broadcast_to(np.asarray(rate, dtype=np.float64) / self.sample_rate, np.shape(t))
+        return (self._stream().rng.poisson(expected) > 0) * amplitude
+
+    def from_table(self, kind, num_samples, amplitude=1.0, table_size=1 << 18, table_seed=0):
+        """Read ``kind`` noise from a shared precomputed table instead of generating it.
+
+        Much cheaper than pink()/brown() for long renders. Each source starts
+        at its own random offset and continues where the last read stopped.
+        """
+        stream = self._stream()
+        table = noise_table(kind, table_size, table_seed, self.sample_rate)
+        pos = stream.table_pos.get(kind)
+        if pos is None:
+            pos = int(stream.rng.integers(table_size))
+        index = (pos + np.arange(num_samples)) % table_size
+        stream.table_pos[kind] = (pos + num_samples) % table_size
+        return table[index] * amplitude
+
+
+@functools.lru_cache(maxsize=8)
+def noise_table(kind, num_samples, seed=0, sample_rate=SAMPLE_RATE):
+    """Return a cached, read-only table of ``kind`` noise at unit amplitude."""
+    if kind not in NOISE_KINDS:
+        raise ValueError(f"Unknown noise kind '{kind}' (expected one of {NOISE_KINDS})")
+    source = NoiseSource(seed, sample_rate)
+    if kind == "white":
+        table = source.white(num_samples)
+    else:
+        table = getattr(source, kind)(num_samples)
+    return _frozen(table)
+
+
+# ============================================================================
+# LOUDNESS
+# ============================================================================
+
+# ITU-R BS.1770 K-weighting biquads (b, a) as specified at 48 kHz: a +4 dB
+# high shelf followed by a ~38 Hz high-pass
+K_FILTER_RATE = 48000
+K_SHELF = ((1.53512485958697, -2.69169618940638, 1.19839281085285),
+           (1.0, -1.69065929318241, 0.73248077421585))
+K_HIGHPASS = ((1.0, -2.0, 1.0),
+              (1.0, -1.99004745483398, 0.99007225036621))
+
+# Gating block length and hop (400 ms blocks overlapping by 75%)
+GATE_BLOCK = 0.4
+GATE_HOP = 0.1
+ABSOLUTE_GATE_LUFS = -70.0
+RELATIVE_GATE_LU = -10.0
+
+# Reported in place of -inf for silent buffers
+SILENCE_DB = -120.0
+
+LoudnessStats = namedtuple("LoudnessStats", "peak rms loudness")
+LoudnessStats.__doc__ = "Sample peak and RMS (linear) and approximate integrated loudness (LUFS)."
+
+
+def db(x):
+    """Linear amplitude to decibels (SILENCE_DB for zero)."""
+    return 20.0 * np.log10(x) if x > 0 else SILENCE_DB
+
+
+def _biquad_response(b, a, w):
+    z = np.exp(-1j * w)
+    return (b[0] + b[1] * z + b[2] * z * z) / (a[0] + a[1] * z + a[2] * z * z)
+
+
+@functools.lru_cache(maxsize=16)
+def k_weighting_response(num_samples, sample_rate=SAMPLE_RATE):
+    """Magnitude of the K-weighting filters at every rfft bin of a ``num_samples`` buffer.
+
+    The 48 kHz reference filters are evaluated at each bin's frequency in Hz,
+    which matches the analog response closely across the audible band.
+    """
+    w = 2 * np.pi * np.fft.rfftfreq(num_samples, 1.0 / sample_rate) / K_FILTER_RATE
+    return _frozen(np.abs(_biquad_response(*K_SHELF, w) * _biquad_response(*K_HIGHPASS, w)))
+
+
+def k_weight(samples, sample_rate=SAMPLE_RATE):
+    """Apply the K-weighting magnitude response in the frequency domain."""
+    spectrum = np.fft.rfft(samples)
+    spectrum *= k_weighting_response(len(samples), sample_rate)
+    return np.fft.irfft(spectrum, len(samples))
+
+
+class LoudnessMeter:
+    """Peak, RMS and gated integrated loudness (BS.1770 style) of a signal.
+
+    Feed the whole buffer at once (one vectorized pass) or block by block
+    for streamed renders; K-weighting is applied per block in the frequency
+    domain, so the result is an approximation either way::
+
+        stats = LoudnessMeter().add(samples).result()
+    """
+
+    def __init__(self, sample_rate=SAMPLE_RATE):
+        self.sample_rate = sample_rate
+        self.segment = int(round(GATE_HOP * sample_rate))
+        self.peak = 0.0
+        self._sum_squares = 0.0
+        self._count = 0
+        self._segments = []
+        self._pending = np.empty(0)
+
+    def add(self, block):
+        """Measure another block of float samples; returns the meter."""
+        block = np.asarray(block, dtype=np.float64)
+        if not len(block):
+            return self
+        self.peak = max(self.peak, float(np.abs(block).max()))
+        self._sum_squares += float(np.dot(block, block))
+        self._count += len(block)
+        # Mean square of the K-weighted signal per 100 ms segment
+        weighted = k_weight(block, self.sample_rate)
+        pending = np.concatenate([self._pending, weighted * weighted])
+        whole = len(pending) // self.segment * self.segment
+        self._segments.append(pending[:whole].reshape(-1, self.segment).mean(axis=1))
+        self._pending = pending[whole:]
+        return self
+
+    def result(self):
+        """LoudnessStats for everything added so far."""
+        rms = np.sqrt(self._sum_squares / self._count) if self._count else 0.0
+        segments = np.concatenate(self._segments) if self._segments else np.empty(0)
+        per_block = int(round(GATE_BLOCK / GATE_HOP))
+        if len(segments) >= per_block:
+            # Overlapping 400 ms blocks are means of four consecutive segments
+            totals = np.cumsum(np.concatenate([[0.0], segments]))
+            blocks = (totals[per_block:] - totals[:-per_block]) / per_block
+        elif len(segments) or len(self._pending):
+            # Shorter than one gating block: measure the whole clip
+            total = segments.sum() * self.segment + self._pending.sum()
+            blocks = np.array([total / (len(segments) * self.segment + len(self._pending))])
+        else:
+            blocks = np.empty(0)
+        return LoudnessStats(self.peak, float(rms), _gated_loudness(blocks))
+
+
+def _block_lufs(mean_square):
+    return -0.691 + 10.0 * np.log10(np.maximum(mean_square, 1e-30))
+
+
+def _gated_loudness(blocks):
+    blocks = blocks[_block_lufs(blocks) > ABSOLUTE_GATE_LUFS]
+    if not len(blocks):
+        return SILENCE_DB
+    relative_gate = _block_lufs(blocks.mean()) + RELATIVE_GATE_LU
+    blocks = blocks[_block_lufs(blocks) > relative_gate]
+    return float(_block_lufs(blocks.mean()))
+
+
+def analyze_loudness(samples, sample_rate=SAMPLE_RATE):
+    """LoudnessStats of a whole buffer."""
+    return LoudnessMeter(sample_rate).add(samples).result()
+
+
+def normalization_gain(stats, target_lufs, peak_ceiling=1.0):
+    """Gain that brings ``stats`` to ``target_lufs`` without the peak exceeding ``peak_ceiling``."""
+    if stats.peak <= 0 or stats.loudness <= SILENCE_DB:
+        return 1.0
+    gain = 10 ** ((target_lufs - stats.loudness) / 20)
+    return min(gain, peak_ceiling / stats.peak)
@@ -0,0 +1,364 @@
+#!/usr/bin/env python3
+"""
+Audio file output for the Last Light Odyssey audio tools.
+Converts float buffers (-1.0..1.0) to PCM in one vectorized step, writes WAV
+files either in a single buffered call or block by block, and encodes MP3, OGG
+Vorbis and resampled WAV files by piping raw PCM (whole buffers or streamed
+blocks) straight into ffmpeg, and decodes existing files back to floats.
+"""
+
+import os
+import struct
+import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+SAMPLE_RATE = 44100
+
+# sample_format -> (bytes per sample, WAV format tag)
+WAVE_FORMAT_PCM = 1
+WAVE_FORMAT_IEEE_FLOAT = 3
+SAMPLE_FORMATS = {
+    "s16": (2, WAVE_FORMAT_PCM),
+    "s24": (3, WAVE_FORMAT_PCM),
+    "f32": (4, WAVE_FORMAT_IEEE_FLOAT),
+}
+
+# ffmpeg raw input format for each sample format
+FFMPEG_INPUT_FORMATS = {
+    "s16": "s16le",
+    "s24": "s24le",
+    "f32": "f32le",
+}
+
+# Output formats, chosen by file extension
+ENCODE_FORMATS = ("mp3", "ogg", "wav")
+
+
+def _check_format(sample_format):
+    if sample_format not in SAMPLE_FORMATS:
+        raise ValueError(f"Unknown sample format '{sample_format}' (expected one of {tuple(SAMPLE_FORMATS)})")
+
+
+def to_pcm(samples, sample_format="s16", gain=1.0):
+    """Convert a float buffer to little-endian PCM bytes, clipping to full scale."""
+    _check_format(sample_format)
+    scaled = np.asarray(samples, dtype=np.float64) * gain
+    if sample_format == "f32":
+        return np.clip(scaled, -1.0, 1.0).astype("<f4").tobytes()
+    if sample_format == "s16":
+        scaled *= 32767
+        return np.clip(scaled, -32768, 32767).astype("<i2").tobytes()
+    # s24: pack the low three bytes of each little-endian int32
+    scaled *= 8388607
+    ints = np.clip(scaled, -8388608, 8388607).astype("<i4")
+    return ints.view(np.uint8).reshape(-1, 4)[:, :3].tobytes()
+
+
+def wav_header(data_bytes, sample_rate=SAMPLE_RATE, sample_format="s16", channels=1):
+    """Build a canonical 44-byte RIFF/WAVE header for ``data_bytes`` of audio."""
+    _check_format(sample_format)
+    width, format_tag = SAMPLE_FORMATS[sample_format]
+    block_align = channels * width
+    return (b"RIFF" + struct.pack("<I", 36 + data_bytes) + b"WAVE"
+            + b"fmt " + struct.pack("<IHHIIHH", 16, format_tag, channels, sample_rate,
+                                    sample_rate * block_align, block_align, width * 8)
+            + b"data" + struct.pack("<I", data_bytes))
+
+
+def write_wav(filepath, samples, sample_rate=SAMPLE_RATE, sample_format="s16", gain=1.0):
+    """Write a mono float buffer to a WAV file with a single buffered write."""
+    data = to_pcm(samples, sample_format, gain)
+    os.makedirs(os.path.dirname(filepath) or ".", exist_ok=True)
+    with open(filepath, "wb") as f:
+        f.write(wav_header(len(data), sample_rate, sample_format) + data)
+
+
+class WavWriter:
+    """Stream a long render to a WAV file block by block.
+
+    The header is written with a zero length up front and patched on close,
+    so memory use depends only on the block size::
+
+        with WavWriter(path) as out:
+            for block in blocks:
+                out.write(block)
+    """
+
+    def __init__(self, filepath, sample_rate=SAMPLE_RATE, sample_format="s16", gain=1.0):
+        _check_format(sample_format)
+        self.sample_rate = sample_rate
+        self.sample_format = sample_format
+        self.gain = gain
+        self.data_bytes = 0
+        os.makedirs(os.path.dirname(filepath) or ".", exist_ok=True)
+        self._file = open(filepath, "wb")
+        self._file.write(wav_header(0, sample_rate, sample_format))
+
+    def write(self, block):
+        """Append a block of float samples."""
+        data = to_pcm(block, self.sample_format, self.gain)
+        self._file.write(data)
+        self.data_bytes += len(data)
+
+    def close(self):
+        """Patch the RIFF/data sizes and close the file."""
+        if self._file.closed:
+            return
+        self._file.seek(0)
+        self._file.write(wav_header(self.data_bytes, self.sample_rate, self.sample_format))
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+# ============================================================================
+# ENCODING
+# ============================================================================
+
+def output_format(out_path):
+    """Encode format implied by a file extension (one of ENCODE_FORMATS)."""
+    out_format = os.path.splitext(str(out_path))[1].lstrip(".").lower()
+    if out_format not in ENCODE_FORMATS:
+        raise ValueError(f"Cannot encode '{out_path}' (expected one of {ENCODE_FORMATS})")
+    return out_format
+
+
+def _codec_args(out_format, bitrate, quality, out_sample_format):
+    if out_format == "mp3":
+        return ['-codec:a', 'libmp3lame', '-b:a', bitrate]
+    if out_format == "ogg":
+        return ['-codec:a', 'libvorbis', '-q:a', str(quality)]
+    _check_format(out_sample_format)
+    return ['-codec:a', 'pcm_' + FFMPEG_INPUT_FORMATS[out_sample_format]]
+
+
+def ffmpeg_command(out_path, sample_rate=SAMPLE_RATE, sample_format="s16", bitrate="192k",
+                   quality=5, out_rate=44100, out_format="mp3", out_sample_format="s16"):
+    """Build an ffmpeg command that reads raw mono PCM on stdin and encodes ``out_path``.
+
+    ``sample_format`` describes the input; ``out_format`` is "mp3" (CBR
+    ``bitrate``), "ogg" (Vorbis ``quality``) or "wav" (``out_sample_format`` PCM),
+    resampled to ``out_rate``.
+    """
+    _check_format(sample_format)
+    return [
+        'ffmpeg', '-y', '-loglevel', 'error',
+        '-f', FFMPEG_INPUT_FORMATS[sample_format], '-ar', str(sample_rate), '-ac', '1', '-i', 'pipe:0',
+        *_codec_args(out_format, bitrate, quality, out_sample_format),
+        '-ar', str(out_rate), str(out_path)
+    ]
+
+
+def decode(path, sample_rate=SAMPLE_RATE):
+    """Decode any audio file ffmpeg can read to a mono float64 buffer at ``sample_rate``."""
+    command = [
+        'ffmpeg', '-loglevel', 'error', '-i', str(path),
+        '-f', FFMPEG_INPUT_FORMATS["f32"], '-ac', '1', '-ar', str(sample_rate), 'pipe:1'
+    ]
+    result = subprocess.run(command, capture_output=True, check=True)
+    return np.frombuffer(result.stdout, dtype="<f4").astype(np.float64)
+
+
+def _ffmpeg_input_format(out_format, sample_format):
+    # MP3/OGG and 16-bit WAVs are fed 16-bit PCM; deeper WAVs get floats
+    return "f32" if out_format == "wav" and sample_format != "s16" else "s16"
+
+
+def encode(samples, out_path, sample_rate=SAMPLE_RATE, gain=1.0, bitrate="192k", quality=5,
+           out_rate=None, sample_format="s16", out_format=None):
+    """Encode a float buffer to MP3, OGG Vorbis or WAV (by default chosen from the extension).
+
+    WAVs at the render rate are written directly; everything else streams PCM
+    into ffmpeg's stdin (no temp files). ``out_rate`` downsamples the output.
+    """
+    out_format = out_format or output_format(out_path)
+    out_rate = out_rate or sample_rate
+    if out_format == "wav" and out_rate == sample_rate:
+        write_wav(str(out_path), samples, sample_rate, sample_format, gain)
+        return
+    in_format = _ffmpeg_input_format(out_format, sample_format)
+    os.makedirs(os.path.dirname(str(out_path)) or ".", exist_ok=True)
+    subprocess.run(ffmpeg_command(out_path, sample_rate, in_format, bitrate, quality, out_rate,
+                                  out_format, sample_format),
+                   input=to_pcm(samples, in_format, gain), capture_output=True, check=True)
+
+
+def encode_mp3(samples, out_path, sample_rate=SAMPLE_RATE, gain=1.0, bitrate="192k"):
+    """Encode a float buffer to MP3 by streaming PCM into ffmpeg's stdin (no temp WAV)."""
+    encode(samples, out_path, sample_rate, gain, bitrate=bitrate, out_rate=44100, out_format="mp3")
+
+
+def encode_batch(items, sample_rate=SAMPLE_RATE, gain=1.0):
+    """Encode many short float buffers with a single ffmpeg process.
+
+    ``items`` is a list of ``(samples, out_path, options)`` where options are
+    encode() keyword arguments (``bitrate``, ``quality``, ``out_rate``,
+    ``sample_format``). The buffers are sent back to back on stdin and split
+    into one output per item with sample-exact ``atrim`` filters, so a whole
+    bank of UI or combat sounds costs one encoder startup instead of one per
+    file.
+    """
+    if not items:
+        return
+    labels = "".join(f"[s{i}]" for i in range(len(items)))
+    filters = [f"[0:a]asplit={len(items)}{labels}" if len(items) > 1 else "[0:a]anull[s0]"]
+    outputs = []
+    offset = 0
+    for i, (samples, out_path, options) in enumerate(items):
+        end = offset + len(samples)
+        filters.append(f"[s{i}]atrim=start_sample={offset}:end_sample={end},asetpts=PTS-STARTPTS[o{i}]")
+        offset = end
+        os.makedirs(os.path.dirname(str(out_path)) or ".", exist_ok=True)
+        outputs += ['-map', f'[o{i}]',
+                    *_codec_args(output_format(out_path), options.get("bitrate", "192k"),
+                                 options.get("quality", 5), options.get("sample_format", "s16")),
+                    '-ar', str(options.get("out_rate") or sample_rate), str(out_path)]
+    command = [
+        'ffmpeg', '-y', '-loglevel', 'error',
+        '-f', FFMPEG_INPUT_FORMATS["s16"], '-ar', str(sample_rate), '-ac', '1', '-i', 'pipe:0',
+        '-filter_complex', ";".join(filters),
+        *outputs
+    ]
+    pcm = b"".join(to_pcm(samples, "s16", gain) for samples, _, _ in items)
+    subprocess.run(command, input=pcm, capture_output=True, check=True)
+
+
+class _FFmpegSink:
+    """One ffmpeg process fed block by block (used by encode_stream)."""
+
+    def __init__(self, out_path, sample_rate, gain, out_format, bitrate="192k", quality=5,
+                 out_rate=None, sample_format="s16"):
+        self.in_format = _ffmpeg_input_format(out_format, sample_format)
+        self.gain = gain
+        os.makedirs(os.path.dirname(str(out_path)) or ".", exist_ok=True)
+        command = ffmpeg_command(out_path, sample_rate, self.in_format, bitrate, quality,
+                                 out_rate or sample_rate, out_format, sample_format)
+        self.proc = subprocess.Popen(command, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL,
+                                     stderr=subprocess.PIPE)
+
+    def write(self, block):
+        if self.proc.stdin.closed:
+            return
+        try:
+            self.proc.stdin.write(to_pcm(block, self.in_format, self.gain))
+        except BrokenPipeError:
+            self.proc.stdin.close()  # ffmpeg exited early; its error is reported by close()
+
+    def close(self):
+        try:
+            self.proc.stdin.close()
+        except BrokenPipeError:
+            pass
+        stderr = self.proc.stderr.read()
+        self.proc.stderr.close()
+        if self.proc.wait() != 0:
+            raise subprocess.CalledProcessError(self.proc.returncode, self.proc.args, stderr=stderr)
+
+    def abort(self):
+        self.proc.kill()
+        self.proc.wait()
+
+
+def encode_stream(blocks, outputs, sample_rate=SAMPLE_RATE, gain=1.0):
+    """Encode an iterable of float blocks to several files at once.
+
+    ``outputs`` is a list of ``(out_path, options)`` where options are encode()
+    keyword arguments. Every block is handed to all outputs as it is produced,
+    so the render runs once and memory does not grow with duration.
+    """
+    sinks = []
+    try:
+        for out_path, options in outputs:
+            options = dict(options)
+            out_format = options.pop("out_format", None) or output_format(out_path)
+            out_rate = options.get("out_rate") or sample_rate
+            if out_format == "wav" and out_rate == sample_rate:
+                sinks.append(WavWriter(str(out_path), sample_rate, options.get("sample_format", "s16"), gain))
+            else:
+                sinks.append(_FFmpegSink(out_path, sample_rate, gain, out_format, **options))
+        for block in blocks:
+            for sink in sinks:
+                sink.write(block)
+    except BaseException:
+        for sink in sinks:
+            if isinstance(sink, _FFmpegSink):
+                sink.abort()
+            else:
+                sink.close()
+        raise
+    # Close every sink before reporting the first failure
+    error = None
+    for sink in sinks:
+        try:
+            sink.close()
+        except subprocess.CalledProcessError as exc:
+            error = error or exc
+    if error:
+        raise error
+
+
+def encode_mp3_stream(blocks, out_path, sample_rate=SAMPLE_RATE, gain=1.0, bitrate="192k"):
+    """Encode an iterable of float blocks to MP3, writing each to ffmpeg as it is produced.
+
+    Only one block is held at a time, so memory does not grow with duration.
+    """
+    encode_stream(blocks, [(out_path, {"bitrate": bitrate, "out_rate": 44100, "out_format": "mp3"})],
+                  sample_rate, gain)
+
+
+class EncoderPool:
+    """Bounded pool of concurrent ffmpeg encoder processes.
+
+    ``submit`` returns immediately so the caller can synthesize the next asset
+    while earlier ones encode; submitting one buffer once per format encodes
+    all of them concurrently without copying it. At most ``max_workers`` encoders run at once and
+    at most ``max_pending`` buffers are held; ``submit`` blocks beyond that so
+    memory stays bounded. Encoder errors are re-raised from ``wait``/``close``.
+    """
+
+    def __init__(self, max_workers=None, max_pending=None):
+        self.max_workers = max_workers or min(4, os.cpu_count() or 1)
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        self._slots = threading.BoundedSemaphore(max_pending or self.max_workers * 2)
+        self._futures = []
+
+    def submit(self, samples, out_path, **kwargs):
+        """Queue ``samples`` for encoding to ``out_path``; kwargs go to encode()."""
+        self._slots.acquire()
+        try:
+            future = self._executor.submit(encode, samples, out_path, **kwargs)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        self._futures.append(future)
+        return future
+
+    def wait(self):
+        """Block until every queued encode has finished, raising the first error."""
+        futures, self._futures = self._futures, []
+        for future in futures:
+            future.result()
+
+    def close(self):
+        """Wait for outstanding encodes and shut the pool down."""
+        try:
+            self.wait()
+        finally:
+            self._executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self._executor.shutdown(wait=True, cancel_futures=True)
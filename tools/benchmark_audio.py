@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+Benchmark the Last Light Odyssey audio generators stage by stage.
+Runs every scene SFX in the manifest plus every sequenced music track and the
+placeholder SFX generator, reports samples/sec, per-stage wall time and memory, and can
+compare the results against a stored JSON baseline to catch regressions.
+
+Memory is reported two ways, neither of them a per-benchmark RSS:
+    peak_traced_alloc_kb       per benchmark: tracemalloc's peak of Python/NumPy
+                               allocations during one extra (untimed) run
+    meta.process_peak_rss_kb   once: the whole process's peak resident set size
+                               (ru_maxrss), which covers every benchmark run so far
+
+Usage:
+    python tools/benchmark_audio.py --output bench.json
+    python tools/benchmark_audio.py --baseline bench.json --threshold 0.2
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+import generate_scene_sfx as scene_sfx
+from audio_dsp import INTERPOLATIONS, OSCILLATOR_ENGINES, analyze_loudness, set_oscillator_engine
+from audio_io import encode_batch, encode_mp3, encode_mp3_stream, write_wav
+
+SAMPLE_RATE = scene_sfx.SAMPLE_RATE
+
+# Stage timings below this are treated as noise when checking for regressions
+MIN_REGRESSION_SECONDS = 0.002
+
+# Stages that read existing files rather than produce audio; reported, but
+# left out of samples/sec
+INPUT_STAGES = ("decode",)
+
+
+def process_peak_rss_kb():
+    """Peak resident set size of the whole process so far in KB (None where unsupported).
+
+    ru_maxrss only ever grows, so this covers every benchmark run before the call.
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KB, macOS reports bytes
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+class StageTimer:
+    """Accumulates wall time per named stage."""
+
+    def __init__(self):
+        self.stages = {}
+
+    def run(self, stage, func, *args, **kwargs):
+        start = time.perf_counter()
+        result = func(*args, **kwargs)
+        self.stages[stage] = self.stages.get(stage, 0.0) + time.perf_counter() - start
+        return result
+
+
+def bench_scene_sfx(asset, tmp_dir, encode):
+    """Time synthesis, envelope, loudness analysis, WAV write and (optionally) ffmpeg for one scene SFX."""
+    timer = StageTimer()
+    scene_sfx.seed_noise(scene_sfx.asset_seed(asset.subdir, asset.name))
+    samples = timer.run("synthesis", scene_sfx.generate_samples, asset.duration, asset.generator)
+    timer.run("envelope", scene_sfx.apply_envelope, samples, **asset.envelope)
+    stats = timer.run("loudness", analyze_loudness, samples, SAMPLE_RATE)
+    gain = scene_sfx.loudness_gain(asset, stats)
+    timer.run("wav_write", write_wav, os.path.join(tmp_dir, "bench.wav"), samples, SAMPLE_RATE, gain=gain)
+    if encode:
+        timer.run("encode", encode_mp3, samples, os.path.join(tmp_dir, "bench.mp3"),
+                  sample_rate=SAMPLE_RATE, gain=gain, bitrate=scene_sfx.MP3_BITRATE)
+    return len(samples), timer.stages
+
+
+def bench_music(name, tmp_dir, encode):
+    """Time the streamed seamless-loop render (and encode) of one sequenced music track."""
+    import generate_music_placeholder as music
+
+    timer = StageTimer()
+    num_samples = 0
+    track = music.load_music_track(name, loop=True)
+    blocks = track.render_loop_blocks()
+    while True:
+        block = timer.run("synthesis", next, blocks, None)
+        if block is None:
+            break
+        num_samples += len(block)
+    if encode:
+        timer.run("encode", encode_mp3_stream, track.render_loop_blocks(),
+                  os.path.join(tmp_dir, "music.mp3"), sample_rate=music.SAMPLE_RATE, bitrate="128k")
+    return num_samples, timer.stages
+
+
+def bench_placeholders(tmp_dir, encode):
+    """Time the placeholder SFX tones, their variant banks and the single batched encode.
+
+    Variants are derived from the files on disk, which needs ffmpeg to decode;
+    without it the decode and variants stages are skipped.
+    """
+    import generate_sfx_placeholders as placeholders
+
+    timer = StageTimer()
+    definitions, formats, variants = placeholders.load_manifest()
+    items = timer.run("synthesis", placeholders.batch_items, definitions, formats, overwrite=True)
+    if shutil.which("ffmpeg") is not None:
+        sources = timer.run("decode", placeholders.variant_sources, definitions, variants)
+        items += timer.run("variants", placeholders.variant_items, sources, formats, variants)
+    num_samples = sum(len(samples) for samples, _, _ in items)
+    if encode:
+        items = [(samples, os.path.join(tmp_dir, f"{i}_{os.path.basename(path)}"), options)
+                 for i, (samples, path, options) in enumerate(items)]
+        timer.run("encode", encode_batch, items, sample_rate=placeholders.SAMPLE_RATE)
+    return num_samples, timer.stages
+
+
+def measure(func, repeat):
+    """Run a benchmark ``repeat`` times, keeping the fastest time for every stage.
+
+    Tracing allocations slows NumPy-heavy code down, so the peak is taken in
+    one extra run after the timed ones.
+    """
+    best = None
+    num_samples = 0
+    for _ in range(repeat):
+        num_samples, stages = func()
+        best = stages if best is None else {k: min(v, best.get(k, v)) for k, v in stages.items()}
+    tracemalloc.start()
+    func()
+    peak_traced = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    total = sum(best.values())
+    producing = sum(v for k, v in best.items() if k not in INPUT_STAGES)
+    return {
+        "samples": num_samples,
+        "stages": {k: round(v, 6) for k, v in best.items()},
+        "total_seconds": round(total, 6),
+        "samples_per_sec": round(num_samples / producing) if producing > 0 else None,
+        "peak_traced_alloc_kb": peak_traced // 1024,
+    }
+
+
+def compare(results, baseline, threshold):
+    """Return regression messages for stages slower than baseline by more than ``threshold``."""
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get("results", {}).get(name)
+        if not previous:
+            continue
+        for stage, seconds in current["stages"].items():
+            before = previous["stages"].get(stage)
+            if before is None or seconds - before < MIN_REGRESSION_SECONDS:
+                continue
+            if seconds > before * (1.0 + threshold):
+                regressions.append(f"{name} [{stage}]: {before * 1000:.1f} ms -> {seconds * 1000:.1f} ms "
+                                   f"(+{(seconds / before - 1.0) * 100:.0f}%)")
+    return regressions
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Benchmark the audio generation pipeline.",
+        epilog="Memory figures: peak_traced_alloc_kb is tracemalloc's peak allocation per benchmark "
+               "(not RSS); meta.process_peak_rss_kb is the process-wide ru_maxrss after all benchmarks.")
+    parser.add_argument("-o", "--output", help="write machine-readable results to this JSON file")
+    parser.add_argument("--baseline", help="compare against a JSON file written by --output")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="allowed slowdown per stage before it counts as a regression (default: 0.2 = 20%%)")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="runs per benchmark; the fastest time per stage is kept (default: %(default)s)")
+    parser.add_argument("--only", action="append", metavar="NAME",
+                        help="only benchmark matching scene SFX (same matching as generate_scene_sfx.py)")
+    parser.add_argument("--engine", choices=OSCILLATOR_ENGINES, default="wavetable",
+                        help="oscillator engine to benchmark (default: %(default)s)")
+    parser.add_argument("--interpolation", choices=INTERPOLATIONS, default="linear",
+                        help="wavetable interpolation (default: %(default)s)")
+    parser.add_argument("--no-encode", action="store_true", help="skip the ffmpeg stage")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    set_oscillator_engine(args.engine, args.interpolation)
+    encode = not args.no_encode and shutil.which("ffmpeg") is not None
+    if not args.no_encode and not encode:
+        print("ffmpeg not found; skipping the encode stage.")
+
+    assets, _ = scene_sfx.load_manifest()
+    assets = scene_sfx.select_assets(assets, args.only)
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        benches = [(f"scene_sfx/{a.subdir}/{a.name}", lambda a=a: bench_scene_sfx(a, tmp_dir, encode))
+                   for a in assets]
+        if not args.only:
+            import generate_music_placeholder as music
+            benches += [(f"music/{name}", lambda name=name: bench_music(name, tmp_dir, encode))
+                        for name in music.available_tracks()]
+            benches.append(("placeholders/all", lambda: bench_placeholders(tmp_dir, encode)))
+
+        print(f"{'benchmark':<52} {'samples/s':>12} {'total ms':>9} {'traced KB':>10}  stages (ms)")
+        for name, func in benches:
+            result = measure(func, args.repeat)
+            results[name] = result
+            stages = ", ".join(f"{k} {v * 1000:.1f}" for k, v in result["stages"].items())
+            print(f"{name:<52} {result['samples_per_sec'] or 0:>12,} {result['total_seconds'] * 1000:>9.1f} "
+                  f"{result['peak_traced_alloc_kb']:>10,}  {stages}")
+
+    totals = {}
+    for result in results.values():
+        for stage, seconds in result["stages"].items():
+            totals[stage] = round(totals.get(stage, 0.0) + seconds, 6)
+    print("\nTotals: " + ", ".join(f"{k} {v:.3f} s" for k, v in totals.items()))
+    process_peak = process_peak_rss_kb()
+    print(f"Process peak RSS (all benchmarks): {process_peak} KB")
+
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "sample_rate": SAMPLE_RATE,
+            "repeat": args.repeat,
+            "oscillator": [args.engine, args.interpolation],
+            "encode": encode,
+            "process_peak_rss_kb": process_peak,
+        },
+        "results": results,
+        "totals": totals,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"Wrote {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) over {args.threshold:.0%}:")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print(f"\nNo regressions over {args.threshold:.0%} against {args.baseline}.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
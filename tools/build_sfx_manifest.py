@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Build the SFX manifest read by SFXManager (scripts/autoload/sfx_manager.gd).
+Lists every generated sound under assets/audio/sfx by category and name with
+its res:// path, so the game can preload streams instead of formatting paths
+and calling load() on every play. Variant banks (<category>/variants/<name>_NN)
+are listed per sound so SFXManager can round-robin them. The SFX generators
+rewrite the manifest after each run.
+"""
+
+import argparse
+import json
+import os
+import re
+from pathlib import Path
+
+from audio_io import ENCODE_FORMATS
+
+BASE_DIR = Path(__file__).parent.parent
+SFX_DIR = BASE_DIR / "assets" / "audio" / "sfx"
+MANIFEST_PATH = SFX_DIR / "sfx_manifest.json"
+
+# Categories under this directory hold one-shot narrative scene SFX; the game
+# caches them lazily with eviction instead of preloading them
+SCENE_ROOT = "scenes"
+
+# Variants of <category>/<name> live in <category>/variants/<name>_NN.<ext>
+VARIANTS_DIR = "variants"
+_VARIANT_NAME = re.compile(r"^(.+)_(\d+)$")
+
+
+def res_path(path):
+    """Godot res:// path of a file inside the project."""
+    return "res://" + Path(os.path.relpath(path, BASE_DIR)).as_posix()
+
+
+def scan_sfx(sfx_dir=SFX_DIR):
+    """Map each category ("combat", "scenes/event_scene", ...) to ``{name: res:// path}``.
+
+    When a sound exists in several formats the first of ENCODE_FORMATS wins.
+    """
+    categories = {}
+    for path in sorted(Path(sfx_dir).rglob("*")):
+        out_format = path.suffix.lstrip(".").lower()
+        if out_format not in ENCODE_FORMATS or path.parent.name == VARIANTS_DIR:
+            continue
+        category = path.parent.relative_to(sfx_dir).as_posix()
+        sounds = categories.setdefault(category, {})
+        current = sounds.get(path.stem)
+        if current is None or ENCODE_FORMATS.index(out_format) < ENCODE_FORMATS.index(current.rsplit(".", 1)[1]):
+            sounds[path.stem] = res_path(path)
+    return categories
+
+
+def scan_variants(sfx_dir=SFX_DIR):
+    """Map "category/name" to the res:// paths of its variants, in variant order.
+
+    Only the preferred format (first of ENCODE_FORMATS present) is listed.
+    """
+    variants = {}
+    for directory in sorted(Path(sfx_dir).rglob(VARIANTS_DIR)):
+        if not directory.is_dir():
+            continue
+        category = directory.parent.relative_to(sfx_dir).as_posix()
+        by_format = {}
+        for path in sorted(directory.iterdir()):
+            match = _VARIANT_NAME.match(path.stem)
+            out_format = path.suffix.lstrip(".").lower()
+            if match and out_format in ENCODE_FORMATS:
+                by_format.setdefault((match.group(1), out_format), []).append(res_path(path))
+        for (name, out_format), paths in sorted(by_format.items(),
+                                                key=lambda item: ENCODE_FORMATS.index(item[0][1])):
+            variants.setdefault(f"{category}/{name}", paths)
+    return dict(sorted(variants.items()))
+
+
+def build_manifest(sfx_dir=SFX_DIR):
+    """Manifest data: categories to preload at startup, every sound path and variant banks."""
+    categories = scan_sfx(sfx_dir)
+    scene_prefix = SCENE_ROOT + "/"
+    return {
+        "preload": [c for c in categories if c != SCENE_ROOT and not c.startswith(scene_prefix)],
+        "categories": categories,
+        "variants": scan_variants(sfx_dir),
+    }
+
+
+def write_manifest(path=MANIFEST_PATH, sfx_dir=SFX_DIR):
+    """Scan ``sfx_dir`` and write the manifest; returns the number of sounds listed."""
+    manifest = build_manifest(sfx_dir)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+        f.write("\n")
+    return sum(len(sounds) for sounds in manifest["categories"].values())
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Write the SFX manifest used by SFXManager.")
+    parser.add_argument("-o", "--output", default=str(MANIFEST_PATH),
+                        help="manifest path (default: assets/audio/sfx/sfx_manifest.json)")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    count = write_manifest(args.output)
+    print(f"Wrote {os.path.relpath(args.output)} ({count} sounds)")
@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+Cross-reference res:// paths used by the game against the files on disk.
+Scans GDScript (and the scenes/resources that reference assets) for literal
+paths, formatted paths ("res://.../%s.png"), concatenated prefixes with the
+file names they are joined to, play_sfx_by_name() category/name pairs and
+MusicManager _load_track() track names, then checks them against assets/ and the generator manifests in tools/.
+
+Reports:
+    missing   referenced paths with no file on disk (and the generator that makes them)
+    unused    files under assets/ that nothing references (variants count as
+              used when their sound is)
+    orphaned  .import/.uid files whose source is gone, and generator manifest
+              entries whose output was never generated
+
+Usage:
+    python tools/check_asset_refs.py
+    python tools/check_asset_refs.py --json refs.json
+"""
+
+import argparse
+import fnmatch
+import json
+import os
+import re
+import sys
+from collections import namedtuple
+from pathlib import Path
+
+from audio_io import ENCODE_FORMATS
+
+BASE_DIR = Path(__file__).parent.parent
+TOOLS_DIR = Path(__file__).parent
+ASSETS_DIR = BASE_DIR / "assets"
+SFX_ROOT = "assets/audio/sfx"
+MUSIC_ROOT = "assets/audio/music"
+
+# Directories never scanned for references (generated, third-party or build output)
+SKIP_DIRS = {".git", ".godot", "builds", "tools", "__pycache__"}
+SCRIPT_EXTENSIONS = (".gd",)
+RESOURCE_EXTENSIONS = (".tscn", ".tres", ".godot", ".cfg")
+# Godot sidecar files that belong to another file
+SIDECAR_EXTENSIONS = (".import", ".uid")
+# Extensions a bare file-name literal must have to be joined to a path prefix
+ASSET_EXTENSIONS = (".png", ".jpg", ".svg", ".webp", ".mp3", ".ogg", ".wav", ".ttf", ".otf", ".tscn", ".tres")
+
+# One reference: ``target`` is a project-relative path, or a glob pattern for
+# formatted and concatenated paths
+Reference = namedtuple("Reference", "source line kind target")
+
+_RES_LITERAL = re.compile(r'"res://([^"]*)"')
+_FORMAT_SPEC = re.compile(r"%[-+ 0#]*\d*(?:\.\d+)?[sdifxXo]")
+_CONCAT = re.compile(r'"res://([^"]*/)"\s*\+')
+_BARE_NAME = re.compile(r'"([^"/]+\.(?:' + "|".join(e.lstrip(".") for e in ASSET_EXTENSIONS) + r'))"')
+_SFX_BY_NAME = re.compile(r'play_sfx_by_name\(\s*"([^"]+)"\s*,\s*"([^"]+)"')
+_MUSIC_TRACK = re.compile(r'_load_track\(\s*"([^"]+)"')
+
+
+def iter_project_files(root=BASE_DIR, extensions=SCRIPT_EXTENSIONS, skip_dirs=SKIP_DIRS):
+    """Yield project files with one of ``extensions``, skipping ``skip_dirs``."""
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if d not in skip_dirs)
+        for filename in sorted(filenames):
+            if filename.endswith(extensions):
+                yield Path(dirpath) / filename
+
+
+def script_references(path, root=BASE_DIR):
+    """References in one GDScript file.
+
+    Literal paths are exact; ``%`` format specifiers become ``*``; a prefix
+    concatenated with a variable ("res://dir/" + file) is resolved against the
+    bare file names ("hit.mp3") in the same script, or kept as ``dir/*``.
+    """
+    source = path.relative_to(root).as_posix()
+    text = path.read_text(encoding="utf-8")
+    refs = []
+    prefixes = []
+    for number, line in enumerate(text.splitlines(), 1):
+        code = line.strip()
+        if code.startswith("#"):
+            continue
+        for match in _RES_LITERAL.finditer(code):
+            target = match.group(1)
+            if _CONCAT.match(code, match.start()):
+                prefixes.append((number, target))
+            elif _FORMAT_SPEC.search(target):
+                refs.append(Reference(source, number, "pattern", _FORMAT_SPEC.sub("*", target)))
+            elif target and not target.endswith("/"):
+                refs.append(Reference(source, number, "path", target))
+        for category, name in _SFX_BY_NAME.findall(code):
+            refs.append(Reference(source, number, "sfx", f"{SFX_ROOT}/{category}/{name}.*"))
+        # MusicManager picks the track's file by extension and its <track>.loop.json
+        for name in _MUSIC_TRACK.findall(code):
+            refs.append(Reference(source, number, "music", f"{MUSIC_ROOT}/{name}.*"))
+
+    bare_names = sorted(set(_BARE_NAME.findall(text)))
+    for number, prefix in prefixes:
+        candidates = [name for name in bare_names if (root / prefix / name).exists()]
+        if candidates:
+            refs.extend(Reference(source, number, "path", prefix + name) for name in candidates)
+        else:
+            refs.append(Reference(source, number, "pattern", prefix + "*"))
+    # Bare names that exist under none of the prefixes are missing files
+    for name in bare_names:
+        if prefixes and not any((root / prefix / name).exists() for _, prefix in prefixes):
+            refs.append(Reference(source, prefixes[0][0], "path", prefixes[0][1] + name))
+    return refs
+
+
+def resource_references(path, root=BASE_DIR):
+    """Literal res:// paths in a scene, resource or config file."""
+    source = path.relative_to(root).as_posix()
+    refs = []
+    for number, line in enumerate(path.read_text(encoding="utf-8", errors="replace").splitlines(), 1):
+        for target in _RES_LITERAL.findall(line):
+            if target and not target.endswith("/"):
+                refs.append(Reference(source, number, "path", target))
+    return refs
+
+
+def collect_references(root=BASE_DIR, skip_dirs=SKIP_DIRS):
+    """Every reference in the project's scripts, scenes and resources."""
+    refs = []
+    for path in iter_project_files(root, SCRIPT_EXTENSIONS, skip_dirs):
+        refs.extend(script_references(path, root))
+    for path in iter_project_files(root, RESOURCE_EXTENSIONS, skip_dirs):
+        refs.extend(resource_references(path, root))
+    return refs
+
+
+def asset_files(assets_dir=ASSETS_DIR, root=BASE_DIR):
+    """Project-relative paths of every file under assets/ (sidecars excluded)."""
+    return sorted(path.relative_to(root).as_posix() for path in Path(assets_dir).rglob("*")
+                  if path.is_file() and not path.name.endswith(SIDECAR_EXTENSIONS))
+
+
+def generator_outputs(tools_dir=TOOLS_DIR):
+    """Map each generated asset (extension as ``.*``) to the generator that makes it."""
+    outputs = {}
+    scene_manifest = tools_dir / "scene_sfx_manifest.json"
+    if scene_manifest.exists():
+        data = json.loads(scene_manifest.read_text(encoding="utf-8"))
+        for category in data["categories"]:
+            for entry in category["sfx"]:
+                subdir = entry.get("subdir", category.get("subdir"))
+                name = os.path.splitext(entry["name"])[0]
+                outputs[f"{SFX_ROOT}/scenes/{subdir}/{name}.*"] = "generate_scene_sfx.py"
+    placeholder_manifest = tools_dir / "sfx_placeholders_manifest.json"
+    if placeholder_manifest.exists():
+        data = json.loads(placeholder_manifest.read_text(encoding="utf-8"))
+        for category in data["categories"]:
+            for entry in category["sfx"]:
+                outputs[f"{SFX_ROOT}/{category['id']}/{entry['name']}.*"] = "generate_sfx_placeholders.py"
+    for track in sorted((tools_dir / "music").glob("*.json")):
+        outputs[f"{MUSIC_ROOT}/{track.stem}.*"] = "generate_music_placeholder.py"
+    return outputs
+
+
+def sfx_variants(root=BASE_DIR):
+    """Variant banks listed in the SFX manifest ("category/name" -> res:// paths)."""
+    manifest = root / SFX_ROOT / "sfx_manifest.json"
+    if not manifest.exists():
+        return {}
+    return json.loads(manifest.read_text(encoding="utf-8")).get("variants", {})
+
+
+def _generated_pattern(target):
+    """Generator-output key for a referenced path (extension replaced by ``.*``)."""
+    stem, ext = os.path.splitext(target)
+    return f"{stem}.*" if ext.lstrip(".") in ENCODE_FORMATS or ext == ".*" else target
+
+
+def check(root=BASE_DIR, tools_dir=TOOLS_DIR, skip_dirs=SKIP_DIRS):
+    """Cross-reference the project; returns a report dictionary."""
+    refs = collect_references(root, skip_dirs)
+    assets = asset_files(root / "assets", root)
+    outputs = generator_outputs(tools_dir)
+
+    used = set()
+    missing = {}
+    for ref in refs:
+        if ref.kind == "path":
+            if (root / ref.target).exists():
+                used.add(ref.target)
+                continue
+        else:
+            matches = fnmatch.filter(assets, ref.target)
+            if matches:
+                used.update(matches)
+                continue
+        entry = missing.setdefault(ref.target, {"kind": ref.kind, "referenced_by": [],
+                                                "generator": outputs.get(_generated_pattern(ref.target))})
+        entry["referenced_by"].append(f"{ref.source}:{ref.line}")
+
+    # SFXManager plays a sound's variant bank in its place, so variants are
+    # used whenever their sound is
+    for key, paths in sfx_variants(root).items():
+        if fnmatch.filter(used, f"{SFX_ROOT}/{key}.*"):
+            used.update(path[len("res://"):] for path in paths)
+
+    orphaned_sidecars = []
+    for path in sorted(Path(root / "assets").rglob("*")):
+        if path.name.endswith(SIDECAR_EXTENSIONS) and not path.with_suffix("").exists():
+            orphaned_sidecars.append(path.relative_to(root).as_posix())
+    orphaned_outputs = [(pattern, generator) for pattern, generator in sorted(outputs.items())
+                        if not fnmatch.filter(assets, pattern)]
+
+    return {
+        "missing": missing,
+        "unused": [path for path in assets if path not in used],
+        "orphaned": {
+            "sidecars": orphaned_sidecars,
+            "generator_outputs": [{"path": pattern, "generator": generator}
+                                  for pattern, generator in orphaned_outputs],
+        },
+        "references": len(refs),
+        "assets": len(assets),
+    }
+
+
+def print_report(report):
+    print(f"Checked {report['references']} references against {report['assets']} asset files.")
+
+    print(f"\nMissing ({len(report['missing'])}):")
+    for target, entry in sorted(report["missing"].items()):
+        hint = f"  [run tools/{entry['generator']}]" if entry["generator"] else ""
+        print(f"  res://{target}{hint}")
+        for source in entry["referenced_by"]:
+            print(f"      {source}")
+
+    print(f"\nUnused ({len(report['unused'])}):")
+    for path in report["unused"]:
+        print(f"  res://{path}")
+
+    orphaned = report["orphaned"]
+    print(f"\nOrphaned ({len(orphaned['sidecars']) + len(orphaned['generator_outputs'])}):")
+    for path in orphaned["sidecars"]:
+        print(f"  res://{path}  (source file missing)")
+    for entry in orphaned["generator_outputs"]:
+        print(f"  res://{entry['path']}  (listed by tools/{entry['generator']}, never generated)")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Find missing, unused and orphaned assets.")
+    parser.add_argument("--json", metavar="PATH", help="also write the report as JSON")
+    parser.add_argument("--include-addons", action="store_true",
+                        help="scan addons/ for references too (skipped by default)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    skip_dirs = SKIP_DIRS if args.include_addons else SKIP_DIRS | {"addons"}
+    report = check(BASE_DIR, TOOLS_DIR, skip_dirs)
+    print_report(report)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+            f.write("\n")
+    return 1 if report["missing"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
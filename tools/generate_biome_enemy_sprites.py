@@ -6,34 +6,14 @@ Generate biome-specific enemy sprites for Last Light Odyssey
 Style: Pokemon/RPG-style pixel art with 3/4 TOP-DOWN perspective
 """
 
-from PIL import Image, ImageDraw
+from PIL import ImageDraw
 import os
 
+from sprite_kit import OUTLINE, SIZE, WHITE, compose, shadow_layer
+
 # Output directory
 OUTPUT_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "assets", "sprites", "characters")
 
-# Sprite size - 32x32 for tactical game
-SIZE = 32
-
-# Common colors
-OUTLINE = (25, 25, 35)           # Dark outline
-WHITE = (255, 255, 255)
-BLACK = (0, 0, 0)
-
-
-def create_base_image():
-    """Create a transparent 32x32 image."""
-    return Image.new("RGBA", (SIZE, SIZE), (0, 0, 0, 0))
-
-
-def draw_shadow(draw, cx=16, width=12, y=30):
-    """Draw ground shadow ellipse for 3/4 top-down grounding."""
-    shadow_color = (0, 0, 0, 60)
-    draw.ellipse(
-        (cx - width // 2, y - 2, cx + width // 2, y + 1),
-        fill=shadow_color
-    )
-
 
 # =============================================================================
 # ASTEROID ROBOTS (Mining/Industrial)
@@ -44,9 +24,6 @@ def generate_asteroid_basic():
     Basic Mining Robot - Simple industrial robot with drill arm
     Boxy body, single drill arm, rugged mining aesthetic
     """
-    img = create_base_image()
-    draw = ImageDraw.Draw(img)
-    
     # Industrial/mining colors - browns, grays, orange accents
     colors = {
         "primary": (100, 80, 70),         # Brown metal body
@@ -57,7 +34,8 @@ def generate_asteroid_basic():
         "drill": (50, 50, 55),           # Dark drill bit
     }
     
-    draw_shadow(draw, width=14)
+    img = compose(SIZE, shadow_layer(SIZE, width=14))
+    draw = ImageDraw.Draw(img)
     cx = 16
     
     # === BASE/TREADS (bottom) ===
@@ -122,9 +100,6 @@ def generate_asteroid_heavy():
     Heavy Industrial Robot - Bulky mining robot with multiple drill arms
     Larger, more armored, multiple tools
     """
-    img = create_base_image()
-    draw = ImageDraw.Draw(img)
-    
     colors = {
         "primary": (90, 70, 60),         # Darker brown metal
         "secondary": (70, 50, 40),       # Very dark brown
@@ -134,7 +109,8 @@ def generate_asteroid_heavy():
         "drill": (40, 40, 45),           # Dark drill
     }
     
-    draw_shadow(draw, width=16)
+    img = compose(SIZE, shadow_layer(SIZE, width=16))
+    draw = ImageDraw.Draw(img)
     cx = 16
     
     # === WIDE BASE/TREADS ===
@@ -202,9 +178,6 @@ def generate_asteroid_sniper():
     Precision Mining Bot - Compact robot with long-range sensor
     Smaller, more precise, targeting equipment
     """
-    img = create_base_image()
-    draw = ImageDraw.Draw(img)
-    
     colors = {
         "primary": (110, 90, 80),        # Lighter brown
         "secondary": (85, 65, 55),       # Medium brown
@@ -214,7 +187,8 @@ def generate_asteroid_sniper():
         "drill": (45, 45, 50),           # Dark drill
     }
     
-    draw_shadow(draw, width=12)
+    img = compose(SIZE, shadow_layer(SIZE, width=12))
+    draw = ImageDraw.Draw(img)
     cx = 16
     
     # === COMPACT BASE ===
@@ -263,9 +237,6 @@ def generate_asteroid_elite():
     Advanced Industrial Robot - Multiple tools, heavily armored
     Most advanced mining robot with various attachments
     """
-    img = create_base_image()
-    draw = ImageDraw.Draw(img)
-    
     colors = {
         "primary": (80, 60, 50),         # Dark brown
         "secondary": (60, 45, 35),       # Very dark brown
@@ -276,7 +247,8 @@ def generate_asteroid_elite():
         "energy": (100, 200, 255),       # Blue energy glow
     }
     
-    draw_shadow(draw, width=16)
+    img = compose(SIZE, shadow_layer(SIZE, width=16))
+    draw = ImageDraw.Draw(img)
     cx = 16
     
     # === HEAVY BASE ===
@@ -358,9 +330,6 @@ def generate_planet_basic():
     Basic Alien Creature - Quadruped alien with organic design
     Four-legged creature, alien colors, bioluminescent accents
     """
-    img = create_base_image()
-    draw = ImageDraw.Draw(img)
-    
     # Alien/planet colors - purples, teals, bioluminescent
     colors = {
         "primary": (120, 80, 140),        # Purple body
@@ -371,7 +340,8 @@ def generate_planet_basic():
         "limb": (90, 70, 100),           # Darker limb color
     }
     
-    draw_shadow(draw, width=14)
+    img = compose(SIZE, shadow_layer(SIZE, width=14))
+    draw = ImageDraw.Draw(img)
     cx = 16
     
     # === HIND LEGS (back) ===
@@ -439,9 +409,6 @@ def generate_planet_heavy():
     Heavy Armored Creature - Bulky shelled alien
     Large, armored, shell-like protection, bioluminescent patterns
     """
-    img = create_base_image()
-    draw = ImageDraw.Draw(img)
-    
     colors = {
         "primary": (100, 70, 110),       # Dark purple body
         "secondary": (80, 50, 90),       # Very dark purple
@@ -452,7 +419,8 @@ def generate_planet_heavy():
         "limb": (70, 50, 80),            # Dark limbs
     }
     
-    draw_shadow(draw, width=16)
+    img = compose(SIZE, shadow_layer(SIZE, width=16))
+    draw = ImageDraw.Draw(img)
     cx = 16
     
     # === HEAVY BASE/LEGS ===
@@ -511,9 +479,6 @@ def generate_planet_sniper():
     Long-Range Creature - Tentacled alien with ranged appendages
     Multiple tentacles, elongated body, bioluminescent targeting
     """
-    img = create_base_image()
-    draw = ImageDraw.Draw(img)
-    
     colors = {
         "primary": (110, 90, 130),       # Light purple body
         "secondary": (90, 70, 110),      # Medium purple
@@ -523,7 +488,8 @@ def generate_planet_sniper():
         "tentacle": (80, 60, 100),       # Dark tentacle color
     }
     
-    draw_shadow(draw, width=14)
+    img = compose(SIZE, shadow_layer(SIZE, width=14))
+    draw = ImageDraw.Draw(img)
     cx = 16
     
     # === TENTACLES (multiple, organic) ===
@@ -588,9 +554,6 @@ def generate_planet_elite():
     Elite Alien - Hybrid design with advanced bioluminescence
     Most advanced creature, multiple features, glowing patterns
     """
-    img = create_base_image()
-    draw = ImageDraw.Draw(img)
-    
     colors = {
         "primary": (130, 100, 150),      # Bright purple body
         "secondary": (100, 70, 120),      # Medium purple
@@ -601,7 +564,8 @@ def generate_planet_elite():
         "crystal": (200, 150, 255),      # Crystal growths
     }
     
-    draw_shadow(draw, width=16)
+    img = compose(SIZE, shadow_layer(SIZE, width=16))
+    draw = ImageDraw.Draw(img)
     cx = 16
     
     # === MULTIPLE LEGS/APPENDAGES ===
@@ -8,33 +8,19 @@ Style: Pokemon/RPG-style pixel art with 3/4 TOP-DOWN perspective
 Size: 64x64 (2x2 tiles) - much larger than regular enemies
 """
 
-from PIL import Image, ImageDraw
+from PIL import ImageDraw
 import os
 
+from sprite_kit import OUTLINE, WHITE, compose, shadow_layer
+
 # Output directory
 OUTPUT_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "assets", "sprites", "characters")
 
 # Sprite size - 64x64 for boss enemies (2x2 tiles)
 SIZE = 64
 
-# Common colors
-OUTLINE = (25, 25, 35)           # Dark outline
-WHITE = (255, 255, 255)
-BLACK = (0, 0, 0)
-
-
-def create_base_image():
-    """Create a transparent 64x64 image."""
-    return Image.new("RGBA", (SIZE, SIZE), (0, 0, 0, 0))
-
-
-def draw_shadow(draw, cx=32, width=24, y=60):
-    """Draw ground shadow ellipse for 3/4 top-down grounding (larger for boss)."""
-    shadow_color = (0, 0, 0, 80)  # Slightly more opaque for larger unit
-    draw.ellipse(
-        (cx - width // 2, y - 4, cx + width // 2, y + 2),
-        fill=shadow_color
-    )
+# Ground shadow reaches further and is slightly more opaque for the larger unit
+BOSS_SHADOW = {"depth": (4, 2), "alpha": 80}
 
 
 # =============================================================================
@@ -46,9 +32,6 @@ def generate_station_boss():
     Station Boss - Massive defensive security mech
     Large armored body, multiple weapon systems, defensive posture
     """
-    img = create_base_image()
-    draw = ImageDraw.Draw(img)
-    
     # Station colors - dark metal, cyan/teal accents, industrial
     colors = {
         "primary": (60, 70, 85),          # Dark blue-gray metal
@@ -60,7 +43,8 @@ def generate_station_boss():
         "warning": (255, 150, 50),        # Orange warning lights
     }
     
-    draw_shadow(draw, cx=32, width=28, y=60)
+    img = compose(SIZE, shadow_layer(SIZE, cx=32, width=28, y=60, **BOSS_SHADOW))
+    draw = ImageDraw.Draw(img)
     cx = 32  # Center of 64x64 image
     
     # === MASSIVE BASE/TREADS ===
@@ -153,9 +137,6 @@ def generate_asteroid_boss():
     Asteroid Boss - Massive industrial mining behemoth
     Huge drill systems, multiple arms, heavily armored
     """
-    img = create_base_image()
-    draw = ImageDraw.Draw(img)
-    
     colors = {
         "primary": (80, 60, 50),          # Brown metal
         "secondary": (60, 45, 35),         # Dark brown
@@ -166,7 +147,8 @@ def generate_asteroid_boss():
         "energy": (150, 200, 255),         # Blue energy
     }
     
-    draw_shadow(draw, cx=32, width=30, y=60)
+    img = compose(SIZE, shadow_layer(SIZE, cx=32, width=30, y=60, **BOSS_SHADOW))
+    draw = ImageDraw.Draw(img)
     cx = 32
     
     # === MASSIVE BASE/PLATFORM ===
@@ -260,9 +242,6 @@ def generate_planet_boss():
     Planet Boss - Massive alien alpha predator
     Huge organic body, multiple limbs, bioluminescent patterns
     """
-    img = create_base_image()
-    draw = ImageDraw.Draw(img)
-    
     colors = {
         "primary": (140, 100, 160),        # Bright purple body
         "secondary": (110, 70, 130),       # Darker purple
@@ -274,7 +253,8 @@ def generate_planet_boss():
         "pattern": (160, 120, 180),        # Body pattern
     }
     
-    draw_shadow(draw, cx=32, width=28, y=60)
+    img = compose(SIZE, shadow_layer(SIZE, cx=32, width=28, y=60, **BOSS_SHADOW))
+    draw = ImageDraw.Draw(img)
     cx = 32
     
     # === MASSIVE LEGS/BASE ===
@@ -1,100 +1,108 @@
 #!/usr/bin/env python3
 """
-Generate a placeholder MP3 music track for Last Light Odyssey title menu.
-Creates a simple atmospheric drone with a basic melody.
+Generate placeholder music tracks for Last Light Odyssey.
+Tracks are note sequences described by data files in tools/music/ and are
+rendered by the music sequencer in fixed-size blocks straight into ffmpeg, so
+memory use stays the same for a 30 second loop or a multi-minute music bed.
+
+Tracks with a "loop" section are rendered loop-ready by default: exactly
+"duration" seconds long with the music past the end crossfaded into the
+head, as OGG (MP3 encoder padding would leave a gap at the loop point),
+plus a <track>.loop.json file with the loop points. MusicManager prefers
+OGG/WAV renders over MP3 and loops them at those points.
+
+The title track is rendered by default. The navigation and tactical tracks
+ship with composed music; render their placeholders only to replace it.
 """
 
-import math
-import numpy as np
-from pydub import AudioSegment
+import argparse
+import json
+import os
 from pathlib import Path
 
+from audio_dsp import DEFAULT_BLOCK_SIZE
+from audio_io import ENCODE_FORMATS, encode_stream
+from music_sequencer import load_track
+
 # Project paths
 BASE_DIR = Path(__file__).parent.parent
 MUSIC_DIR = BASE_DIR / "assets" / "audio" / "music"
+TRACKS_DIR = Path(__file__).parent / "music"
+
+SAMPLE_RATE = 44100
+DEFAULT_TRACKS = ("title_menu_music",)
+# Formats in MusicManager's order of preference (MUSIC_EXTENSIONS)
+GAME_FORMATS = ("ogg", "wav", "mp3")
+
+
+def available_tracks():
+    """Names of every track data file in tools/music/."""
+    return sorted(path.stem for path in TRACKS_DIR.glob("*.json"))
+
+
+def load_music_track(name, duration_sec=None, loop=None):
+    """Load tools/music/<name>.json; ``loop=None`` follows the track's data file."""
+    return load_track(TRACKS_DIR / f"{name}.json", duration_sec, SAMPLE_RATE, loop=loop)
+
 
-def generate_oscillator(freq, duration_ms, amplitude=0.5, sample_rate=44100):
-    """Generate a sine wave tone."""
-    duration_sec = duration_ms / 1000.0
-    t = np.linspace(0, duration_sec, int(sample_rate * duration_sec), False)
-    wave = np.sin(2 * np.pi * freq * t)
-    return (wave * amplitude * 32767).astype(np.int16)
-
-def apply_fade(audio, fade_ms=1000):
-    """Apply fade in and fade out."""
-    return audio.fade_in(fade_ms).fade_out(fade_ms)
-
-def generate_title_music():
-    """Generate a 30-second atmospheric placeholder track."""
-    print("Generating title music placeholder...")
-    sample_rate = 44100
-    duration_ms = 30000 # 30 seconds
-    
-    # 1. Base Drone (Deep, spacey)
-    base_freq = 55.0  # A1
-    drone1 = generate_oscillator(base_freq, duration_ms, amplitude=0.2)
-    drone2 = generate_oscillator(base_freq * 1.5, duration_ms, amplitude=0.1) # Perfect fifth
-    
-    # Mix drones
-    drone_mix = (drone1.astype(np.int32) + drone2.astype(np.int32))
-    
-    # 2. Add some "pulsing" to the drone
-    pulse_freq = 0.2 # low frequency oscillation
-    t = np.linspace(0, duration_ms/1000.0, len(drone_mix), False)
-    pulser = (np.sin(2 * np.pi * pulse_freq * t) * 0.3 + 0.7)
-    drone_pulsed = (drone_mix * pulser).astype(np.int16)
-    
-    # 3. Add a simple melody (Arpeggio)
-    melody = np.zeros(len(drone_pulsed), dtype=np.int16)
-    notes = [440.0, 554.37, 659.25, 880.0] # A4, C#5, E5, A5
-    note_duration = 2000 # 2 seconds
-    
-    for i in range(0, duration_ms, note_duration):
-        note_idx = (i // note_duration) % len(notes)
-        freq = notes[note_idx]
-        start_sample = int((i/1000.0) * sample_rate)
-        end_sample = min(start_sample + int((note_duration/1000.0) * sample_rate), len(melody))
-        
-        # Generate note with fade
-        note_wave = generate_oscillator(freq, note_duration, amplitude=0.1)
-        note_segment = AudioSegment(
-            note_wave.tobytes(), 
-            frame_rate=sample_rate, 
-            sample_width=2, 
-            channels=1
-        ).fade_in(500).fade_out(1000)
-        
-        # Convert back to numpy
-        note_data = np.frombuffer(note_segment.raw_data, dtype=np.int16)
-        
-        # Place in melody array
-        place_end = min(start_sample + len(note_data), len(melody))
-        melody[start_sample:place_end] = note_data[:place_end-start_sample]
-
-    # Combine all
-    final_mix = (drone_pulsed.astype(np.int32) + melody.astype(np.int32))
-    # Normalize to avoid clipping
-    max_val = np.max(np.abs(final_mix))
-    if max_val > 32767:
-        final_mix = (final_mix * (32767 / max_val)).astype(np.int16)
-    else:
-        final_mix = final_mix.astype(np.int16)
-
-    # Convert to AudioSegment
-    audio = AudioSegment(
-        final_mix.tobytes(),
-        frame_rate=sample_rate,
-        sample_width=2,
-        channels=1
-    )
-    
-    audio = apply_fade(audio)
-    
-    # Export
+def track_blocks(name, duration_sec=None, block_size=DEFAULT_BLOCK_SIZE, loop=None):
+    """Yield a track in blocks of ``block_size`` float samples (loop-ready with ``loop``)."""
+    return load_music_track(name, duration_sec, loop).blocks(block_size)
+
+
+def generate_track(name, duration_sec=None, block_size=DEFAULT_BLOCK_SIZE, loop=None, out_format=None):
+    """Render a track data file to assets/audio/music/<name>.<format>.
+
+    ``loop`` defaults to the track's data file; loop renders also write
+    <name>.loop.json with the loop points in samples, which MusicManager
+    applies. ``out_format`` defaults to ogg for loop renders (gapless) and
+    mp3 otherwise.
+    """
+    track = load_music_track(name, duration_sec, loop)
+    out_format = out_format or ("ogg" if track.loop else "mp3")
+    print(f"Generating {name} placeholder{' (seamless loop)' if track.loop else ''}...")
+    if track.loop and out_format == "mp3":
+        print("  Note: MP3 encoder padding adds a gap at the loop point; "
+              "use --format ogg or wav for a sample-exact loop.")
     MUSIC_DIR.mkdir(parents=True, exist_ok=True)
-    output_path = MUSIC_DIR / "title_menu_music.mp3"
-    audio.export(str(output_path), format="mp3", bitrate="128k")
+    output_path = MUSIC_DIR / f"{name}.{out_format}"
+    encode_stream(track.blocks(block_size), [(output_path, {"bitrate": "128k"})], sample_rate=SAMPLE_RATE)
+    if track.loop:
+        with open(MUSIC_DIR / f"{name}.loop.json", "w", encoding="utf-8") as f:
+            json.dump({**track.loop_metadata(), "file": output_path.name}, f, indent=2)
+            f.write("\n")
     print(f"Successfully generated: {output_path}")
+    # MusicManager loads the first of these it finds
+    for other in GAME_FORMATS[:GAME_FORMATS.index(out_format)]:
+        if (MUSIC_DIR / f"{name}.{other}").exists():
+            print(f"  Note: the game plays {name}.{other} in preference to this file; remove it to use this render.")
+
+
+def generate_title_music(duration_sec=30.0, block_size=DEFAULT_BLOCK_SIZE):
+    """Generate an atmospheric placeholder track (30 seconds by default)."""
+    generate_track("title_menu_music", duration_sec, block_size)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Generate placeholder music tracks.")
+    parser.add_argument("tracks", nargs="*", metavar="TRACK",
+                        help=f"tracks to render (default: {', '.join(DEFAULT_TRACKS)}; "
+                             f"available: {', '.join(available_tracks())})")
+    parser.add_argument("--duration", type=float,
+                        help="track length in seconds (default: from the track's data file)")
+    parser.add_argument("--block-size", type=int, default=DEFAULT_BLOCK_SIZE,
+                        help="frames rendered per block (default: %(default)s)")
+    parser.add_argument("--no-loop", dest="loop", action="store_false", default=None,
+                        help="render with the track's fade in/out instead of as a seamless loop")
+    parser.add_argument("--format", choices=ENCODE_FORMATS,
+                        help="output format (default: ogg for seamless loops, mp3 otherwise); "
+                             "mp3 pads the loop point")
+    return parser.parse_args(argv)
+
 
 if __name__ == "__main__":
-    generate_title_music()
+    args = parse_args()
+    for name in args.tracks or DEFAULT_TRACKS:
+        if not os.path.exists(TRACKS_DIR / f"{name}.json"):
+            raise SystemExit(f"Unknown track '{name}' (available: {', '.join(available_tracks())})")
+        generate_track(name, args.duration, args.block_size, args.loop, args.format)
@@ -5,31 +5,24 @@ Style: Pokemon/RPG-style chibi pixel art
 Perspective: 3/4 front-facing view with large head, visible body and legs
 """
 
-from PIL import Image, ImageDraw
+from PIL import ImageDraw
 import os
 
+from sprite_kit import SIZE, WHITE, cached_layer, compose, layer_cache_info
+
 # Output directory
 OUTPUT_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "assets", "sprites", "characters")
 
-# Sprite size
-SIZE = 32
-
 # Common colors
 OUTLINE = (40, 40, 50)
 SKIN_LIGHT = (255, 220, 185)
 SKIN_MID = (240, 195, 160)
 SKIN_SHADOW = (210, 165, 135)
-WHITE = (255, 255, 255)
 BLACK = (20, 20, 30)
 EYE_WHITE = (255, 255, 255)
 EYE_PUPIL = (40, 40, 60)
 
 
-def create_base_image():
-    """Create a transparent 32x32 image."""
-    return Image.new("RGBA", (SIZE, SIZE), (0, 0, 0, 0))
-
-
 def draw_base_body(draw, colors, has_pants=True):
     """Draw the common humanoid body structure."""
     cx = 16  # Center x
@@ -137,11 +130,12 @@ def draw_base_head(draw, hair_color, hair_style="short"):
         draw.arc((12, 0, 19, 5), 0, 360, fill=OUTLINE, width=1)
 
 
+base_body_layer = cached_layer(draw_base_body)
+base_head_layer = cached_layer(draw_base_head)
+
+
 def generate_captain():
     """Generate captain sprite - commanding officer with cap."""
-    img = create_base_image()
-    draw = ImageDraw.Draw(img)
-    
     colors = {
         "primary": (200, 170, 50),      # Gold uniform
         "secondary": (170, 140, 30),    # Darker gold
@@ -151,11 +145,9 @@ def generate_captain():
     }
     hair_color = (60, 45, 30)  # Dark brown
     
-    # Draw body first
-    draw_base_body(draw, colors)
-    
-    # Draw head
-    draw_base_head(draw, hair_color, "military")
+    # Draw body and head
+    img = compose(SIZE, base_body_layer(SIZE, colors), base_head_layer(SIZE, hair_color, "military"))
+    draw = ImageDraw.Draw(img)
     
     # === CAPTAIN'S CAP ===
     # Cap base
@@ -186,9 +178,6 @@ def generate_captain():
 
 def generate_scout():
     """Generate scout sprite - agile recon specialist."""
-    img = create_base_image()
-    draw = ImageDraw.Draw(img)
-    
     colors = {
         "primary": (60, 100, 60),       # Forest green
         "secondary": (45, 80, 45),      # Darker green
@@ -198,11 +187,9 @@ def generate_scout():
     }
     hair_color = (100, 70, 45)  # Auburn/brown
     
-    # Draw body
-    draw_base_body(draw, colors)
-    
-    # Draw head with short spiky hair
-    draw_base_head(draw, hair_color, "short")
+    # Draw body and head with short spiky hair
+    img = compose(SIZE, base_body_layer(SIZE, colors), base_head_layer(SIZE, hair_color, "short"))
+    draw = ImageDraw.Draw(img)
     
     # === TACTICAL GOGGLES ===
     # Goggles on forehead
@@ -232,9 +219,6 @@ def generate_scout():
 
 def generate_tech():
     """Generate tech sprite - engineer with tools."""
-    img = create_base_image()
-    draw = ImageDraw.Draw(img)
-    
     colors = {
         "primary": (50, 140, 150),      # Teal/cyan
         "secondary": (35, 110, 120),    # Darker teal
@@ -244,11 +228,9 @@ def generate_tech():
     }
     hair_color = (45, 45, 55)  # Dark gray/black
     
-    # Draw body (slightly bulkier)
-    draw_base_body(draw, colors)
-    
-    # Draw head
-    draw_base_head(draw, hair_color, "short")
+    # Draw body and head
+    img = compose(SIZE, base_body_layer(SIZE, colors), base_head_layer(SIZE, hair_color, "short"))
+    draw = ImageDraw.Draw(img)
     
     # === TECH VISOR/GLASSES ===
     # Safety glasses
@@ -281,9 +263,6 @@ def generate_tech():
 
 def generate_medic():
     """Generate medic sprite - field medic with cross."""
-    img = create_base_image()
-    draw = ImageDraw.Draw(img)
-    
     colors = {
         "primary": (180, 60, 140),      # Magenta/purple
         "secondary": (150, 40, 115),    # Darker magenta
@@ -293,11 +272,9 @@ def generate_medic():
     }
     hair_color = (160, 130, 100)  # Light brown/blonde
     
-    # Draw body
-    draw_base_body(draw, colors)
-    
-    # Draw head with ponytail
-    draw_base_head(draw, hair_color, "ponytail")
+    # Draw body and head with ponytail
+    img = compose(SIZE, base_body_layer(SIZE, colors), base_head_layer(SIZE, hair_color, "ponytail"))
+    draw = ImageDraw.Draw(img)
     
     # === MEDICAL CROSS ===
     # Cross on chest (prominent)
@@ -332,9 +309,6 @@ def generate_medic():
 
 def generate_heavy():
     """Generate heavy sprite - armored tank with shield."""
-    img = create_base_image()
-    draw = ImageDraw.Draw(img)
-    
     colors = {
         "primary": (180, 90, 50),       # Orange-red armor
         "secondary": (150, 70, 40),     # Darker orange
@@ -346,11 +320,9 @@ def generate_heavy():
     }
     hair_color = (50, 40, 35)  # Dark brown/black
     
-    # Draw body (bulkier version)
-    draw_base_body(draw, colors)
-    
-    # Draw head with military cut
-    draw_base_head(draw, hair_color, "military")
+    # Draw body and head with military cut
+    img = compose(SIZE, base_body_layer(SIZE, colors), base_head_layer(SIZE, hair_color, "military"))
+    draw = ImageDraw.Draw(img)
     
     # === HEAVY ARMOR PLATING ===
     # Shoulder pauldrons (large, armored)
@@ -429,6 +401,9 @@ def main():
         print(f"Generated: {filepath}")
     
     print("\nAll officer sprites generated successfully!")
+    reused = sum(info.hits for info in layer_cache_info().values())
+    drawn = sum(info.misses for info in layer_cache_info().values())
+    print(f"Shared layers: {drawn} drawn, {reused} reused")
     print(f"Output directory: {OUTPUT_DIR}")
 
 
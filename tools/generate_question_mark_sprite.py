@@ -0,0 +1,99 @@
+"""
+Generate a pixel art question mark sprite for locked navigation nodes.
+Matches the style of existing node graphics (64x64, pixel art).
+The glyph is built from signed distance fields (see sdf_raster.py), so it
+renders in one vectorized pass at any size; --supersample smooths the edges
+of large versions.
+"""
+
+import argparse
+import math
+from pathlib import Path
+
+from sdf_raster import band, circle, ellipse, fill, interior, intersect, rounded_rect, render_image
+from sdf_raster import subtract
+
+BASE_DIR = Path(__file__).parent.parent
+OUTPUT_PATH = BASE_DIR / "assets" / "sprites" / "navigation" / "question_mark.png"
+
+# Glyph geometry is laid out on this grid and scaled to the requested size
+DESIGN_SIZE = 64
+
+# Color scheme matching the code
+OUTLINE_COLOR = (51, 51, 77, 255)  # Dark gray/blue outline (0.2, 0.2, 0.3)
+FILL_COLOR = (128, 128, 153, 255)  # Medium gray fill (0.5, 0.5, 0.6)
+HIGHLIGHT_COLOR = (179, 179, 204, 255)  # Light gray highlight (0.7, 0.7, 0.8)
+
+# Curve ellipse (radii 16 x 12) and the scales of its outline and highlight
+# bands, as squared normalized radii
+CURVE_RADII = (16.0, 12.0)
+CURVE_OUTLINE = (0.85, 1.15)
+CURVE_HIGHLIGHT = (0.3, 0.7)
+
+
+def curve_ellipse(x, y, center, level):
+    """The curve ellipse scaled to squared normalized radius ``level``."""
+    scale = math.sqrt(level)
+    return ellipse(x, y, center, (CURVE_RADII[0] * scale, CURVE_RADII[1] * scale))
+
+
+def question_mark(x, y):
+    """Layers of the question mark in design-grid coordinates."""
+    center_x, center_y = DESIGN_SIZE // 2, DESIGN_SIZE // 2
+    curve_center = (center_x, center_y - 8)
+
+    # Top curve: upper half of an ellipse, cut flat where the stem joins
+    top = rounded_rect(x, y, (31.5, 15.5), (16.0, 8.0))
+    dome = intersect(curve_ellipse(x, y, curve_center, CURVE_OUTLINE[1]), top)
+    dome_inner = intersect(curve_ellipse(x, y, curve_center, CURVE_OUTLINE[0]), top)
+    # Vertical stem, outlined on its sides only
+    stem = rounded_rect(x, y, (center_x, 31.5), (3.5, 8.0))
+    stem_sides = subtract(stem, rounded_rect(x, y, (center_x, 31.5), (2.5, 12.0)))
+    # Bottom dot
+    dot = circle(x, y, (center_x, 44), 5.5)
+    # Highlight on top-left of curve for 3D effect
+    highlight = intersect(subtract(curve_ellipse(x, y, curve_center, CURVE_HIGHLIGHT[1]),
+                                   curve_ellipse(x, y, curve_center, CURVE_HIGHLIGHT[0])),
+                          rounded_rect(x, y, (22.5, 13.5), (5.0, 4.0)))
+
+    return [
+        (fill(dome), OUTLINE_COLOR),
+        (fill(dome_inner), FILL_COLOR),
+        (fill(stem), FILL_COLOR),
+        (fill(stem_sides), OUTLINE_COLOR),
+        (band(dot, -2.0), OUTLINE_COLOR),
+        (interior(dot, 2.0), FILL_COLOR),
+        (fill(highlight), HIGHLIGHT_COLOR),
+    ]
+
+
+def generate_question_mark_sprite(size=64, supersample=1):
+    """Generate a size x size question mark sprite (64x64 pixel art by default)."""
+    scale = DESIGN_SIZE / size
+
+    def paint(x, y):
+        # Map pixel coordinates onto the design grid (identity at 64 px)
+        return question_mark((x + 0.5) * scale - 0.5, (y + 0.5) * scale - 0.5)
+
+    return render_image(paint, (size, size), supersample)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Generate the locked-node question mark sprite.")
+    parser.add_argument("-o", "--output", default=str(OUTPUT_PATH),
+                        help="output PNG (default: assets/sprites/navigation/question_mark.png)")
+    parser.add_argument("--size", type=int, default=64, help="sprite width and height (default: %(default)s)")
+    parser.add_argument("--supersample", type=int, default=1,
+                        help="samples per pixel along each axis; 1 keeps hard pixel-art edges (default: %(default)s)")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    # Generate the sprite
+    sprite = generate_question_mark_sprite(args.size, args.supersample)
+
+    # Save to the navigation assets folder
+    sprite.save(args.output)
+    print(f"Question mark sprite saved to: {args.output}")
+    print(f"Size: {sprite.size}, Mode: {sprite.mode}")
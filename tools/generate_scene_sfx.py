@@ -1,85 +1,146 @@
 #!/usr/bin/env python3
 """
 Generate sci-fi scene SFX for Last Light Odyssey.
-Uses Python's wave module for WAV synthesis, then ffmpeg to convert to MP3.
+Synthesizes with NumPy (one array evaluation per generator) and pipes the PCM
+straight into a bounded pool of ffmpeg encoders, so no temporary WAVs are
+written and encoding overlaps with synthesis of the next asset.
 Updated with separate scene channel support and louder volume.
 """
 
-import wave
-import struct
-import math
-import random
+import argparse
+import functools
+import hashlib
+import json
 import os
-import subprocess
 import sys
+import tempfile
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+import audio_dsp
+import audio_io
+from audio_dsp import DEFAULT_BLOCK_SIZE, NoiseSource, OscillatorBank, PhaseState
+from audio_dsp import adsr_envelope, adsr_envelope_block, iter_blocks, retrigger_envelope
+from audio_dsp import INTERPOLATIONS, OSCILLATOR_ENGINES, oscillate, oscillator_engine, set_oscillator_engine
+from audio_dsp import LoudnessMeter, analyze_loudness, db, normalization_gain
+from audio_dsp import apply_envelope as dsp_apply_envelope
+from audio_io import ENCODE_FORMATS, EncoderPool, encode_stream
+from build_sfx_manifest import write_manifest
+from render_cache import DEFAULT_CACHE_DIR, DEFAULT_MAX_BYTES, RenderCache, source_digest
 
 SAMPLE_RATE = 44100
 BASE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
                         "assets", "audio", "sfx", "scenes")
+MANIFEST_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "scene_sfx_manifest.json")
+
+MANIFEST_DIR = os.path.dirname(MANIFEST_PATH)
+LOUDNESS_REPORT_PATH = os.path.join(MANIFEST_DIR, "scene_sfx_loudness.json")
+
+# Assets are normalized to a loudness target (overridable per category in the
+# manifest) instead of getting a fixed gain. The peak ceiling keeps the old
+# 0.95 "near max" limit from when sounds were reported as too quiet.
+DEFAULT_LOUDNESS = {"target_lufs": -18.0, "peak_ceiling": 0.95}
+MP3_BITRATE = "192k"
+
+# Format policy used when neither the manifest nor a category gives one
+DEFAULT_FORMATS = ({"format": "mp3", "bitrate": MP3_BITRATE},)
+
+# Base seed mixed into every per-asset noise stream (see asset_seed)
+NOISE_SEED = 42
+
+# Noise source used by the generators (reseeded per asset by render_sfx)
+_noise = NoiseSource(NOISE_SEED, SAMPLE_RATE)
+
+# One scene SFX: generator rendered for `duration` seconds with an ADSR envelope,
+# normalized to its `loudness` policy and encoded once per entry of `formats`
+SceneSFX = namedtuple("SceneSFX", "subdir name generator duration envelope category formats loudness")
+
+
+def seed_noise(seed):
+    """Reseed the noise source used by white_noise() and the glitch/click generators."""
+    global _noise
+    _noise = NoiseSource(seed, SAMPLE_RATE)
 
 
 def generate_samples(duration_sec, generator_func):
-    """Generate audio samples using a generator function."""
+    """Generate audio samples by evaluating a generator over the whole time vector.
+
+    Generators take ``(t, dur)`` where ``t`` is a NumPy array of sample times
+    and return an array (or scalar) of the same shape.
+    """
     num_samples = int(SAMPLE_RATE * duration_sec)
-    samples = []
-    for i in range(num_samples):
-        t = i / SAMPLE_RATE
-        val = generator_func(t, duration_sec)
-        val = max(-1.0, min(1.0, val))
-        samples.append(val)
-    return samples
+    t = np.arange(num_samples, dtype=np.float64) / SAMPLE_RATE
+    samples = np.broadcast_to(generator_func(t, duration_sec), t.shape).astype(np.float64)
+    return np.clip(samples, -1.0, 1.0, out=samples)
+
+
+def generate_sample_blocks(duration_sec, generator_func, envelope, block_size=DEFAULT_BLOCK_SIZE):
+    """Yield enveloped blocks of ``block_size`` samples (bounded memory for long assets).
+
+    Produces the same signal as generate_samples() + apply_envelope() (up to
+    float rounding), but only one block is alive at a time: oscillator phase
+    and each noise call site's stream are carried between blocks, so the
+    result does not depend on ``block_size``.
+    """
+    num_samples = int(SAMPLE_RATE * duration_sec)
+    with PhaseState() as phase_state:
+        for start, t in iter_blocks(num_samples, block_size, SAMPLE_RATE):
+            phase_state.begin_block()
+            _noise.begin_block()
+            block = np.broadcast_to(generator_func(t, duration_sec), t.shape).astype(np.float64)
+            np.clip(block, -1.0, 1.0, out=block)
+            block *= adsr_envelope_block(num_samples, start, len(t), sample_rate=SAMPLE_RATE, **envelope)
+            yield block
+
+
+def scalar_generator(func):
+    """Adapt a legacy per-sample generator ``func(t, dur) -> float`` to the array API.
+
+    This evaluates the generator once per sample exactly like the old engine did,
+    so it is slow; use it only for generators that have not been vectorized yet.
+    """
+    @functools.wraps(func)
+    def wrapper(t, dur):
+        return np.fromiter((func(float(x), dur) for x in t), dtype=np.float64, count=len(t))
+    return wrapper
 
 
 def apply_envelope(samples, attack=0.05, decay=0.1, sustain_level=0.7, release=0.3):
-    """Apply ADSR envelope to samples."""
-    n = len(samples)
-    attack_samples = int(attack * SAMPLE_RATE)
-    decay_samples = int(decay * SAMPLE_RATE)
-    release_samples = int(release * SAMPLE_RATE)
-    sustain_samples = n - attack_samples - decay_samples - release_samples
-
-    if sustain_samples < 0:
-        sustain_samples = 0
-        release_samples = n - attack_samples - decay_samples
-        if release_samples < 0:
-            release_samples = 0
-            decay_samples = n - attack_samples
-
-    result = []
-    for i in range(n):
-        if i < attack_samples:
-            env = i / max(1, attack_samples)
-        elif i < attack_samples + decay_samples:
-            progress = (i - attack_samples) / max(1, decay_samples)
-            env = 1.0 - (1.0 - sustain_level) * progress
-        elif i < attack_samples + decay_samples + sustain_samples:
-            env = sustain_level
-        else:
-            progress = (i - attack_samples - decay_samples - sustain_samples) / max(1, release_samples)
-            env = sustain_level * (1.0 - progress)
-        result.append(samples[i] * env)
-    return result
+    """Apply an ADSR envelope to samples in place (envelopes are cached per clip length)."""
+    env = adsr_envelope(len(samples), attack, decay, sustain_level, release, sample_rate=SAMPLE_RATE)
+    return dsp_apply_envelope(samples, env)
+
 
+def white_noise(t, amplitude=1.0):
+    """Generate white noise samples matching the shape of ``t``."""
+    return _noise.white(np.shape(t), amplitude)
 
-def white_noise(amplitude=1.0):
-    """Generate white noise sample."""
-    return random.uniform(-amplitude, amplitude)
 
+# The fixed-frequency helpers below are for LFOs and control signals. Audible
+# tones (especially swept or modulated ones) go through OscillatorBank so their
+# phase is integrated from the instantaneous frequency. Both use the current
+# oscillator engine (band-limited wavetables unless --engine math is given).
 
 def sine_wave(t, freq):
-    """Generate sine wave sample."""
-    return math.sin(2 * math.pi * freq * t)
+    """Generate sine wave samples at a constant frequency."""
+    return oscillate(t * freq, freq, "sine", SAMPLE_RATE)
 
 
 def saw_wave(t, freq):
-    """Generate sawtooth wave sample."""
-    phase = (t * freq) % 1.0
-    return 2.0 * phase - 1.0
+    """Generate sawtooth wave samples at a constant frequency."""
+    return oscillate(t * freq, freq, "saw", SAMPLE_RATE)
 
 
 def square_wave(t, freq):
-    """Generate square wave sample."""
-    return 1.0 if (t * freq) % 1.0 < 0.5 else -1.0
+    """Generate square wave samples at a constant frequency."""
+    return oscillate(t * freq, freq, "square", SAMPLE_RATE)
+
+
+def pluck(t, rate, decay):
+    """Retriggered note envelope: full level ``rate`` times per second, fading to silence over ``decay`` seconds."""
+    return retrigger_envelope(t, rate, ((decay, 0.0),), start_level=1.0)
 
 
 def mix(*components):
@@ -87,42 +148,151 @@ def mix(*components):
     return sum(components) / len(components)
 
 
-def save_wav(samples, filepath):
-    """Save samples to WAV file."""
-    os.makedirs(os.path.dirname(filepath), exist_ok=True)
-    with wave.open(filepath, 'w') as wav:
-        wav.setnchannels(1)
-        wav.setsampwidth(2)
-        wav.setframerate(SAMPLE_RATE)
-        for s in samples:
-            # INCREASED VOLUME: 0.95 (near max) instead of 0.8 (-6dB)
-            # User reported sounds were too quiet
-            val = int(s * 32767 * 0.95)
-            wav.writeframes(struct.pack('<h', max(-32768, min(32767, val))))
-
-
-def wav_to_mp3(wav_path, mp3_path):
-    """Convert WAV to MP3 using ffmpeg."""
-    subprocess.run([
-        'ffmpeg', '-y', '-i', wav_path,
-        '-codec:a', 'libmp3lame', '-b:a', '192k',
-        '-ar', '44100', mp3_path
-    ], capture_output=True, check=True)
-    os.remove(wav_path)
-
-
-def generate_sfx(name, subdir, duration, generator_func,
-                 attack=0.05, decay=0.1, sustain=0.7, release=0.3):
-    """Generate a single SFX file."""
-    out_dir = os.path.join(BASE_DIR, subdir)
-    wav_path = os.path.join(out_dir, name.replace('.mp3', '.wav'))
-    mp3_path = os.path.join(out_dir, name)
-
-    print(f"  Generating {subdir}/{name}...")
-    samples = generate_samples(duration, generator_func)
-    samples = apply_envelope(samples, attack, decay, sustain, release)
-    save_wav(samples, wav_path)
-    wav_to_mp3(wav_path, mp3_path)
+# Shared helpers whose source is part of every asset's cache key
+SYNTH_HELPERS = (generate_samples, apply_envelope, white_noise, sine_wave, saw_wave,
+                 square_wave, pluck, mix)
+
+
+def asset_seed(subdir, name):
+    """Derive a stable noise seed for one asset from its path under BASE_DIR.
+
+    Every asset gets its own stream, so its output does not depend on which
+    assets rendered before it or on which worker process renders it.
+    """
+    digest = hashlib.sha256(f"{NOISE_SEED}:{subdir}/{name}".encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "little")
+
+
+def render_sfx(asset):
+    """Render one SceneSFX to an enveloped float buffer (runs in worker processes)."""
+    seed_noise(asset_seed(asset.subdir, asset.name))
+    samples = generate_samples(asset.duration, asset.generator)
+    return apply_envelope(samples, **asset.envelope)
+
+
+def measure_stream(asset, block_size=DEFAULT_BLOCK_SIZE):
+    """Loudness of a long SceneSFX, rendered block by block without keeping it."""
+    seed_noise(asset_seed(asset.subdir, asset.name))
+    meter = LoudnessMeter(SAMPLE_RATE)
+    for block in generate_sample_blocks(asset.duration, asset.generator, asset.envelope, block_size):
+        meter.add(block)
+    return meter.result()
+
+
+def stream_sfx(asset, outputs, gain, block_size=DEFAULT_BLOCK_SIZE):
+    """Render a long SceneSFX block by block straight into its encoders."""
+    seed_noise(asset_seed(asset.subdir, asset.name))
+    blocks = generate_sample_blocks(asset.duration, asset.generator, asset.envelope, block_size)
+    encode_stream(blocks, [(path, options) for path, options, _ in outputs],
+                  sample_rate=SAMPLE_RATE, gain=gain)
+
+
+def iter_rendered(assets, jobs=1):
+    """Yield ``(asset, samples)`` in input order, rendering in ``jobs`` worker processes.
+
+    Results come back in input order, so output is identical for any job count.
+    """
+    if jobs <= 1:
+        for asset in assets:
+            yield asset, render_sfx(asset)
+        return
+    # Workers may be spawned fresh (Windows), so hand them the oscillator engine
+    with ProcessPoolExecutor(max_workers=jobs, initializer=set_oscillator_engine,
+                             initargs=oscillator_engine()) as executor:
+        yield from zip(assets, executor.map(render_sfx, assets))
+
+
+def asset_outputs(asset):
+    """``(path, encode options, cache key)`` for every format in the asset's policy.
+
+    A spec's "sample_rate" downsamples that output and its optional "suffix"
+    is appended to the file stem (e.g. beam_22k.ogg).
+    """
+    stem = os.path.splitext(asset.name)[0]
+    render_key = render_cache_key(asset)
+    # PCM conversion and ffmpeg arguments shape the encoded bytes too
+    encoder = source_digest(audio_io)
+    outputs = []
+    for spec in asset.formats:
+        options = {k: v for k, v in spec.items() if k not in ("format", "suffix", "sample_rate")}
+        if "sample_rate" in spec:
+            options["out_rate"] = spec["sample_rate"]
+        path = os.path.join(BASE_DIR, asset.subdir, f"{stem}{spec.get('suffix', '')}.{spec['format']}")
+        key = RenderCache.key(render=render_key, format=spec, loudness=asset.loudness, encoder=encoder)
+        outputs.append((path, options, key))
+    return outputs
+
+
+def render_cache_key(asset):
+    """Cache key covering everything that affects an asset's rendered (pre-gain) samples."""
+    return RenderCache.key(
+        generator=source_digest(asset.generator),
+        helpers=[source_digest(func) for func in SYNTH_HELPERS],
+        engine=source_digest(audio_dsp),
+        oscillator=oscillator_engine(),
+        duration=asset.duration,
+        envelope=asset.envelope,
+        sample_rate=SAMPLE_RATE,
+        seed=asset_seed(asset.subdir, asset.name),
+    )
+
+
+def asset_status(asset, cache):
+    """Classify an asset as "current", "cached", "encode" (render cached, outputs missing) or "missing"."""
+    if cache is None:
+        return "missing"
+    statuses = {cache.status(key, path) for path, _, key in asset_outputs(asset)}
+    if statuses == {"current"}:
+        return "current"
+    if "missing" not in statuses:
+        return "cached"
+    if cache.contains(render_cache_key(asset), ".npy"):
+        return "encode"
+    return "missing"
+
+
+def loudness_gain(asset, stats):
+    """Gain that brings an asset to its loudness target."""
+    return normalization_gain(stats, asset.loudness["target_lufs"], asset.loudness.get("peak_ceiling", 1.0))
+
+
+def loudness_entry(asset, stats, gain):
+    """One asset's row in the loudness report."""
+    return {
+        "category": asset.category,
+        "peak_db": round(db(stats.peak), 2),
+        "rms_db": round(db(stats.rms), 2),
+        "loudness_lufs": round(stats.loudness, 2),
+        "target_lufs": asset.loudness["target_lufs"],
+        "gain_db": round(db(gain), 2),
+        "output_lufs": round(stats.loudness + db(gain), 2),
+        "output_peak_db": round(db(stats.peak * gain), 2),
+    }
+
+
+def write_loudness_report(path, entries):
+    """Merge this run's measurements into the bank's loudness report."""
+    assets = {}
+    if os.path.exists(path):
+        with open(path, "r", encoding="utf-8") as f:
+            assets = json.load(f).get("assets", {})
+    assets.update(entries)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"assets": dict(sorted(assets.items()))}, f, indent=2)
+        f.write("\n")
+
+
+def generate_sfx(asset, samples, outputs, encoder, action="Generated"):
+    """Normalize a rendered SFX and queue it on the encoder pool once per output format.
+
+    Returns its loudness report entry.
+    """
+    stats = analyze_loudness(samples, SAMPLE_RATE)
+    gain = loudness_gain(asset, stats)
+    print(f"  {action} {asset.subdir}/{asset.name} ({stats.loudness:.1f} LUFS, {db(gain):+.1f} dB)")
+    for path, options, _ in outputs:
+        encoder.submit(samples, path, sample_rate=SAMPLE_RATE, gain=gain, **options)
+    return loudness_entry(asset, stats, gain)
 
 
 # ============================================================================
@@ -131,42 +301,44 @@ def generate_sfx(name, subdir, duration, generator_func,
 
 def beam_gen(t, dur):
     """Sci-fi teleport beam sound."""
-    # Rising/falling shimmer
-    shimmer = sine_wave(t, 200 + 800 * sine_wave(t, 10)) * 0.4
-    # High frequency carrier
-    carrier = sine_wave(t, 2000 + 500 * sine_wave(t, 20)) * 0.15
+    shimmer, carrier, hum = (OscillatorBank()
+                             .add(200 + 800 * sine_wave(t, 10), 0.4)    # Rising/falling shimmer
+                             .add(2000 + 500 * sine_wave(t, 20), 0.15)  # High frequency carrier
+                             .add(100, 0.3)                             # Bass hum
+                             .render(t))
     # Energy swoosh
     progress = t / dur
-    whoosh = white_noise(0.3) * (0.5 + 0.5 * sine_wave(t, 2)) * max(0, 1 - abs(progress - 0.5) * 4)
-    # Bass hum
-    hum = sine_wave(t, 100) * 0.3
+    whoosh = white_noise(t, 0.3) * (0.5 + 0.5 * sine_wave(t, 2)) * np.maximum(0, 1 - abs(progress - 0.5) * 4)
     return mix(shimmer, carrier, whoosh, hum)
 
 def extraction_complete_gen(t, dur):
     """Mission success fanfare."""
     progress = t / dur
-    # Major chord fanfare
-    c = sine_wave(t, 523) * 0.3
-    e = sine_wave(t, 659) * 0.25
-    g = sine_wave(t, 784) * 0.25
-    c_high = sine_wave(t, 1046) * 0.2
-    # Ascending visual
-    sweep = sine_wave(t, 400 + 400 * progress) * 0.15
-    # Confirmation chime
-    chime = sine_wave(t, 1500) * 0.15 * (1 if progress > 0.8 else 0)
+    c, e, g, c_high, sweep, chime = (OscillatorBank()
+                                     # Major chord fanfare
+                                     .add(523, 0.3)
+                                     .add(659, 0.25)
+                                     .add(784, 0.25)
+                                     .add(1046, 0.2)
+                                     # Ascending visual
+                                     .add(400 + 400 * progress, 0.15)
+                                     # Confirmation chime
+                                     .add(1500, 0.15)
+                                     .render(t))
+    chime *= progress > 0.8
     return mix(c, e, g, c_high, sweep, chime)
 
 def extraction_failed_gen(t, dur):
     """Mission failure, team lost."""
     progress = t / dur
-    # Dissonant fall
-    fall = sine_wave(t, 400 * (1 - progress * 0.5)) * 0.3
-    # Warning buzzer
-    buzz = square_wave(t, 150) * 0.2 * (1 if (t * 4) % 1.0 < 0.5 else 0)
+    fall, buzz, thud = (OscillatorBank()
+                        .add(400 * (1 - progress * 0.5), 0.3)  # Dissonant fall
+                        .add(150, 0.2, "square")               # Warning buzzer
+                        .add(60 * (1 - progress), 0.4)         # Low thud
+                        .render(t))
+    buzz *= (t * 4) % 1.0 < 0.5
     # Static failure
-    static = white_noise(0.3) * progress * 0.3
-    # Low thud
-    thud = sine_wave(t, 60 * (1 - progress)) * 0.4
+    static = white_noise(t, 0.3) * progress * 0.3
     return mix(fall, buzz, static, thud)
 
 
@@ -175,12 +347,13 @@ def voyage_failure_gen(t, dur):
     """Final game over screen (recap)."""
     # Simply a longer, more final version of extinction
     progress = t / dur
-    # Dying drone
-    drone = sine_wave(t, 100 * (1 - progress * 0.2)) * 0.4
+    drone, toll = (OscillatorBank()
+                   .add(100 * (1 - progress * 0.2), 0.4)  # Dying drone
+                   .add(220, 0.3)                         # Sad toll
+                   .render(t))
+    toll *= pluck(t, 0.5, 1.0)
     # Wind/Vacuum
-    wind = white_noise(0.2) * (0.3 + 0.3 * sine_wave(t, 0.2)) * 0.3
-    # Sad toll
-    toll = sine_wave(t, 220) * 0.3 * max(0, 1 - (t % 2.0))
+    wind = white_noise(t, 0.2) * (0.3 + 0.3 * sine_wave(t, 0.2)) * 0.3
     return mix(drone, wind, toll)
 
 
@@ -190,62 +363,69 @@ def voyage_failure_gen(t, dur):
 
 def solar_flare_gen(t, dur):
     """Intense solar radiation - energy surge with warning alarm."""
-    # Rising energy sweep
-    sweep_freq = 200 + 800 * (t / dur)
-    energy = sine_wave(t, sweep_freq) * 0.4
+    energy, alarm, rumble = (OscillatorBank()
+                             # Rising energy sweep
+                             .add(200 + 800 * (t / dur), 0.4)
+                             # Warning alarm
+                             .add(np.where((t * 4) % 1.0 < 0.5, 880, 660), 0.2)
+                             # Low rumble
+                             .add(60 + 20 * sine_wave(t, 0.5), 0.3)
+                             .render(t))
+    alarm *= (t * 2) % 1.0 < 0.7
     # Crackling radiation
-    crackle = white_noise(0.3) * (0.5 + 0.5 * sine_wave(t, 3))
-    # Warning alarm
-    alarm_freq = 880 if (t * 4) % 1.0 < 0.5 else 660
-    alarm = sine_wave(t, alarm_freq) * 0.2 * (1 if (t * 2) % 1.0 < 0.7 else 0)
-    # Low rumble
-    rumble = sine_wave(t, 60 + 20 * sine_wave(t, 0.5)) * 0.3
+    crackle = white_noise(t, 0.3) * (0.5 + 0.5 * sine_wave(t, 3))
     return mix(energy, crackle, alarm, rumble)
 
 
 def meteor_shower_gen(t, dur):
     """Meteor impacts on hull - thuds, debris, warnings."""
+    impact, stress, beep = (OscillatorBank()
+                            .add(80, 0.5)                              # Impact thuds
+                            .add(150 + 50 * sine_wave(t, 1.3), 0.2)    # Hull stress
+                            .add(1200, 0.15)                           # Warning beep
+                            .render(t))
     # Impact thuds at random-ish intervals
-    impact_phase = (t * 3.7) % 1.0
-    impact = sine_wave(t, 80) * max(0, 1.0 - impact_phase * 8) * 0.5
+    impact *= pluck(t, 3.7, 0.034)
+    beep *= (t * 6) % 1.0 < 0.1
     # Debris rattling
-    debris = white_noise(0.25) * (0.3 + 0.7 * abs(sine_wave(t, 5.5)))
-    # Hull stress
-    stress = sine_wave(t, 150 + 50 * sine_wave(t, 1.3)) * 0.2
-    # Warning beep
-    beep = sine_wave(t, 1200) * 0.15 * (1 if (t * 6) % 1.0 < 0.1 else 0)
+    debris = white_noise(t, 0.25) * (0.3 + 0.7 * abs(sine_wave(t, 5.5)))
     return mix(impact, debris, stress, beep)
 
 
 def disease_outbreak_gen(t, dur):
     """Medical alarms, quarantine sirens."""
-    # Biohazard siren (rising/falling)
-    siren_freq = 600 + 200 * sine_wave(t, 1.5)
-    siren = sine_wave(t, siren_freq) * 0.35
-    # Heartbeat monitor beeps
-    heartbeat_phase = (t * 1.2) % 1.0
-    heartbeat = sine_wave(t, 1000) * max(0, 1.0 - heartbeat_phase * 15) * 0.3
-    # Flatline hint toward end
-    flatline_mix = max(0, (t / dur - 0.7) / 0.3)
-    flatline = sine_wave(t, 1000) * 0.2 * flatline_mix
-    # Ambient tension
-    tension = sine_wave(t, 120) * 0.15
+    siren, heartbeat, flatline, tension = (OscillatorBank()
+                                           # Biohazard siren (rising/falling)
+                                           .add(600 + 200 * sine_wave(t, 1.5), 0.35)
+                                           # Heartbeat monitor beeps
+                                           .add(1000, 0.3)
+                                           # Flatline hint toward end
+                                           .add(1000, 0.2)
+                                           # Ambient tension
+                                           .add(120, 0.15)
+                                           .render(t))
+    heartbeat *= pluck(t, 1.2, 0.056)
+    flatline *= np.maximum(0, (t / dur - 0.7) / 0.3)
     return mix(siren, heartbeat, flatline, tension)
 
 
 def system_malfunction_gen(t, dur):
     """Electrical sparks, error beeps, system failures."""
+    # Digital glitch
+    glitching = _noise.click_train(t, 0.05 * SAMPLE_RATE) > 0
+    glitch_freq = np.where(glitching, 2000 + 1000 * _noise.white(t.shape), 440)
+    error_beep, power, glitch = (OscillatorBank()
+                                 # Error beeps (descending)
+                                 .add(800 - 200 * (t / dur), 0.15, "square")
+                                 # Power fluctuation
+                                 .add(60, 0.3)
+                                 .add(glitch_freq, 0.1, "saw")
+                                 .render(t))
+    error_beep *= (t * 4) % 1.0 < 0.15
+    power *= 0.5 + 0.5 * sine_wave(t, 0.8)
     # Electrical sparks (random bursts of noise)
     spark_trigger = sine_wave(t, 7.3)
-    sparks = white_noise(0.5) * (1 if spark_trigger > 0.7 else 0) * 0.4
-    # Error beeps (descending)
-    error_freq = 800 - 200 * (t / dur)
-    error_beep = square_wave(t, error_freq) * 0.15 * (1 if (t * 4) % 1.0 < 0.15 else 0)
-    # Power fluctuation
-    power = sine_wave(t, 60) * 0.3 * (0.5 + 0.5 * sine_wave(t, 0.8))
-    # Digital glitch
-    glitch_freq = 2000 + 1000 * random.uniform(-1, 1) if random.random() < 0.05 else 440
-    glitch = saw_wave(t, glitch_freq) * 0.1
+    sparks = white_noise(t, 0.5) * (spark_trigger > 0.7) * 0.4
     return mix(sparks, error_beep, power, glitch)
 
 
@@ -253,85 +433,96 @@ def pirate_ambush_gen(t, dur):
     """Weapons fire, explosions, combat alarms."""
     # Laser shots
     laser_phase = (t * 5) % 1.0
-    laser_freq = 3000 - 2500 * laser_phase
-    laser = sine_wave(t, laser_freq) * max(0, 1.0 - laser_phase * 5) * 0.3
+    laser, alert, shield = (OscillatorBank()
+                            .add(3000 - 2500 * laser_phase, 0.3)
+                            # Red alert
+                            .add(np.where((t * 2) % 1.0 < 0.5, 440, 550), 0.2, "square")
+                            # Shield impact
+                            .add(200 + 100 * sine_wave(t, 8), 0.2)
+                            .render(t))
+    laser *= pluck(t, 5, 0.04)
     # Explosion rumble
-    explosion = white_noise(0.4) * sine_wave(t, 30) * 0.3
-    # Red alert
-    alert_freq = 440 if (t * 2) % 1.0 < 0.5 else 550
-    alert = square_wave(t, alert_freq) * 0.2
-    # Shield impact
-    shield = sine_wave(t, 200 + 100 * sine_wave(t, 8)) * 0.2
+    explosion = white_noise(t, 0.4) * sine_wave(t, 30) * 0.3
     return mix(laser, explosion, alert, shield)
 
 
 def space_debris_gen(t, dur):
     """Space debris hitting hull, navigation warnings."""
-    # Metallic pings
-    ping_phase = (t * 4.3) % 1.0
-    ping = sine_wave(t, 2000 + 500 * sine_wave(t, 0.7)) * max(0, 1.0 - ping_phase * 10) * 0.3
-    # Hull stress groaning
-    groan = sine_wave(t, 80 + 30 * sine_wave(t, 0.3)) * 0.35
+    ping, groan, nav = (OscillatorBank()
+                        .add(2000 + 500 * sine_wave(t, 0.7), 0.3)  # Metallic pings
+                        .add(80 + 30 * sine_wave(t, 0.3), 0.35)    # Hull stress groaning
+                        .add(700, 0.15)                            # Nav warning
+                        .render(t))
+    ping *= pluck(t, 4.3, 0.023)
+    nav *= (t * 3) % 1.0 < 0.08
     # Scraping
-    scrape = white_noise(0.2) * abs(sine_wave(t, 2.5)) * 0.3
-    # Nav warning
-    nav = sine_wave(t, 700) * 0.15 * (1 if (t * 3) % 1.0 < 0.08 else 0)
+    scrape = white_noise(t, 0.2) * abs(sine_wave(t, 2.5)) * 0.3
     return mix(ping, groan, scrape, nav)
 
 
 def sensor_ghost_gen(t, dur):
     """Mysterious scanner blips, eerie silence."""
-    # Mysterious ping
-    ping_phase = (t * 0.8) % 1.0
-    ping = sine_wave(t, 1500 + 500 * sine_wave(t, 0.2)) * max(0, 1.0 - ping_phase * 6) * 0.25
-    # Eerie ambient
-    eerie1 = sine_wave(t, 180 + 20 * sine_wave(t, 0.15)) * 0.2
-    eerie2 = sine_wave(t, 270 + 15 * sine_wave(t, 0.12)) * 0.15
+    ping, eerie1, eerie2, sweep = (OscillatorBank()
+                                   # Mysterious ping
+                                   .add(1500 + 500 * sine_wave(t, 0.2), 0.25)
+                                   # Eerie ambient
+                                   .add(180 + 20 * sine_wave(t, 0.15), 0.2)
+                                   .add(270 + 15 * sine_wave(t, 0.12), 0.15)
+                                   # Scanner sweep
+                                   .add(400 + 300 * sine_wave(t, 0.5), 0.1)
+                                   .render(t))
+    ping *= pluck(t, 0.8, 0.208)
     # Static whispers
-    static = white_noise(0.08) * (0.3 + 0.7 * abs(sine_wave(t, 0.4)))
-    # Scanner sweep
-    sweep = sine_wave(t, 400 + 300 * sine_wave(t, 0.5)) * 0.1
+    static = white_noise(t, 0.08) * (0.3 + 0.7 * abs(sine_wave(t, 0.4)))
     return mix(ping, eerie1, eerie2, static, sweep)
 
 
 def radiation_storm_gen(t, dur):
     """Geiger counter, radiation warnings, energy interference."""
-    # Geiger clicks
+    geiger, rad_hum, warn = (OscillatorBank()
+                             .add(4000, 0.3)                         # Geiger clicks
+                             .add(100 + 50 * sine_wave(t, 0.7), 0.3)  # Radiation hum
+                             .add(950, 0.2)                          # Warning
+                             .render(t))
     click_rate = 10 + 20 * (t / dur)
-    geiger = sine_wave(t, 4000) * (1 if random.random() < click_rate / SAMPLE_RATE * 5 else 0) * 0.3
-    # Radiation hum
-    rad_hum = sine_wave(t, 100 + 50 * sine_wave(t, 0.7)) * 0.3
-    # Warning
-    warn = sine_wave(t, 950) * 0.2 * (1 if (t * 3) % 1.0 < 0.5 else 0) * (1 if (t * 6) % 1.0 < 0.3 else 0)
+    geiger *= _noise.click_train(t, click_rate * 5)
+    warn *= ((t * 3) % 1.0 < 0.5) & ((t * 6) % 1.0 < 0.3)
     # Interference
-    interference = white_noise(0.2) * (0.5 + 0.5 * sine_wave(t, 1.5))
+    interference = white_noise(t, 0.2) * (0.5 + 0.5 * sine_wave(t, 1.5))
     return mix(geiger, rad_hum, warn, interference)
 
 
 def cryo_failure_gen(t, dur):
     """Cryogenic system alarm, freezing sounds."""
-    # Cryo alarm (high-pitched pulsing)
-    cryo_alarm = sine_wave(t, 1100 + 100 * sine_wave(t, 3)) * 0.25 * (1 if (t * 4) % 1.0 < 0.6 else 0)
+    cryo_alarm, whoosh, emergency = (OscillatorBank()
+                                     # Cryo alarm (high-pitched pulsing)
+                                     .add(1100 + 100 * sine_wave(t, 3), 0.25)
+                                     # Pod opening (low whoosh)
+                                     .add(60 + 40 * (t / dur), 0.3)
+                                     # Emergency beep
+                                     .add(800, 0.2)
+                                     .render(t))
+    cryo_alarm *= (t * 4) % 1.0 < 0.6
+    emergency *= (t * 8) % 1.0 < 0.05
     # Freezing/hissing
-    hiss = white_noise(0.3) * 0.3 * (0.5 + 0.5 * sine_wave(t, 0.5))
-    # Pod opening (low whoosh)
-    whoosh = sine_wave(t, 60 + 40 * (t / dur)) * 0.3
-    # Emergency beep
-    emergency = sine_wave(t, 800) * 0.2 * (1 if (t * 8) % 1.0 < 0.05 else 0)
+    hiss = white_noise(t, 0.3) * 0.3 * (0.5 + 0.5 * sine_wave(t, 0.5))
     return mix(cryo_alarm, hiss, whoosh, emergency)
 
 
 def clear_skies_gen(t, dur):
     """Calm ambient hum, all-clear tone."""
-    # Peaceful ship hum
-    hum = sine_wave(t, 120) * 0.2
-    hum2 = sine_wave(t, 180) * 0.1
-    # All-clear chime (gentle)
-    chime_phase = (t * 0.5) % 1.0
-    chime = sine_wave(t, 800) * max(0, 1.0 - chime_phase * 4) * 0.2
-    chime2 = sine_wave(t, 1200) * max(0, 1.0 - chime_phase * 5) * 0.1
-    # Soft ambience
-    ambience = sine_wave(t, 300 + 10 * sine_wave(t, 0.1)) * 0.08
+    hum, hum2, chime, chime2, ambience = (OscillatorBank()
+                                          # Peaceful ship hum
+                                          .add(120, 0.2)
+                                          .add(180, 0.1)
+                                          # All-clear chime (gentle)
+                                          .add(800, 0.2)
+                                          .add(1200, 0.1)
+                                          # Soft ambience
+                                          .add(300 + 10 * sine_wave(t, 0.1), 0.08)
+                                          .render(t))
+    chime *= pluck(t, 0.5, 0.5)
+    chime2 *= pluck(t, 0.5, 0.4)
     return mix(hum, hum2, chime, chime2, ambience)
 
 
@@ -341,72 +532,80 @@ def clear_skies_gen(t, dur):
 
 def casualties_mount_gen(t, dur):
     """Warning tones, first crisis, growing concern."""
-    # Warning tone
-    warn = sine_wave(t, 500 + 100 * sine_wave(t, 1.5)) * 0.3
-    # Slow heartbeat
-    beat_phase = (t * 1.0) % 1.0
-    beat = sine_wave(t, 80) * max(0, 1.0 - beat_phase * 8) * 0.35
-    # Somber pad
-    pad = sine_wave(t, 220) * 0.15 + sine_wave(t, 330) * 0.1
+    warn, beat, pad_low, pad_high = (OscillatorBank()
+                                     # Warning tone
+                                     .add(500 + 100 * sine_wave(t, 1.5), 0.3)
+                                     # Slow heartbeat
+                                     .add(80, 0.35)
+                                     # Somber pad
+                                     .add(220, 0.15)
+                                     .add(330, 0.1)
+                                     .render(t))
+    beat *= pluck(t, 1.0, 0.125)
+    pad = pad_low + pad_high
     return mix(warn, beat, pad)
 
 
 def weight_of_command_gen(t, dur):
     """Heavy alarms, desperation building."""
-    # Heavier alarm
-    alarm = sine_wave(t, 400 + 150 * sine_wave(t, 2)) * 0.35
-    # Strained systems
-    strain = sine_wave(t, 60 + 20 * sine_wave(t, 0.8)) * 0.3
-    # Distorted heartbeat (faster)
-    beat_phase = (t * 1.5) % 1.0
-    beat = sine_wave(t, 70) * max(0, 1.0 - beat_phase * 6) * 0.3
-    # Dissonant tones
-    dissonance = sine_wave(t, 310) * 0.1 + sine_wave(t, 317) * 0.1
+    alarm, strain, beat, dis_a, dis_b = (OscillatorBank()
+                                         # Heavier alarm
+                                         .add(400 + 150 * sine_wave(t, 2), 0.35)
+                                         # Strained systems
+                                         .add(60 + 20 * sine_wave(t, 0.8), 0.3)
+                                         # Distorted heartbeat (faster)
+                                         .add(70, 0.3)
+                                         # Dissonant tones
+                                         .add(310, 0.1)
+                                         .add(317, 0.1)
+                                         .render(t))
+    beat *= pluck(t, 1.5, 0.111)
+    dissonance = dis_a + dis_b
     return mix(alarm, strain, beat, dissonance)
 
 
 def desperation_gen(t, dur):
     """Critical warnings, failing systems."""
-    # Critical alarm (fast pulsing)
-    alarm = sine_wave(t, 700) * 0.3 * (1 if (t * 5) % 1.0 < 0.5 else 0)
-    # System dying
-    dying = sine_wave(t, 200 - 100 * (t / dur)) * 0.3
+    alarm, dying, dread = (OscillatorBank()
+                           .add(700, 0.3)                       # Critical alarm (fast pulsing)
+                           .add(200 - 100 * (t / dur), 0.3)     # System dying
+                           .add(45, 0.35)                       # Deep bass dread
+                           .render(t))
+    alarm *= (t * 5) % 1.0 < 0.5
     # Chaotic noise
-    chaos = white_noise(0.2) * (0.5 + 0.5 * sine_wave(t, 3))
-    # Deep bass dread
-    dread = sine_wave(t, 45) * 0.35
+    chaos = white_noise(t, 0.2) * (0.5 + 0.5 * sine_wave(t, 3))
     return mix(alarm, dying, chaos, dread)
 
 
 def all_hope_lost_gen(t, dur):
     """Emergency sirens, near-total failure."""
-    # Wailing siren
-    siren_freq = 500 + 400 * sine_wave(t, 3)
-    siren = sine_wave(t, siren_freq) * 0.3
-    # Systems failing (descending)
-    failing = sine_wave(t, 300 - 200 * (t / dur)) * 0.25
+    siren, failing, bass = (OscillatorBank()
+                            .add(500 + 400 * sine_wave(t, 3), 0.3)  # Wailing siren
+                            .add(300 - 200 * (t / dur), 0.25)       # Systems failing (descending)
+                            .add(35, 0.4)                           # Dread bass
+                            .render(t))
     # Noise/static building
-    static = white_noise(0.3) * (t / dur) * 0.4
-    # Dread bass
-    bass = sine_wave(t, 35) * 0.4
+    static = white_noise(t, 0.3) * (t / dur) * 0.4
     return mix(siren, failing, static, bass)
 
 
 def extinction_gen(t, dur):
     """Final system shutdown, silence, end."""
-    # Systems powering down
     progress = t / dur
-    powerdown = sine_wave(t, 300 * (1 - progress * 0.8)) * 0.3 * (1 - progress)
-    # Last heartbeat
-    if t < dur * 0.3:
-        beat_phase = (t * 0.8) % 1.0
-        beat = sine_wave(t, 60) * max(0, 1.0 - beat_phase * 8) * 0.4
-    else:
-        beat = 0
-    # Flatline
-    flatline = sine_wave(t, 1000) * 0.15 * max(0, progress - 0.6) / 0.4 if progress > 0.6 else 0
-    # Fading hum
-    hum = sine_wave(t, 100) * 0.2 * (1 - progress)
+    powerdown, beat, flatline, hum = (OscillatorBank()
+                                      # Systems powering down
+                                      .add(300 * (1 - progress * 0.8), 0.3)
+                                      # Last heartbeat
+                                      .add(60, 0.4)
+                                      # Flatline
+                                      .add(1000, 0.15)
+                                      # Fading hum
+                                      .add(100, 0.2)
+                                      .render(t))
+    powerdown *= 1 - progress
+    beat *= pluck(t, 0.8, 0.156) * (t < dur * 0.3)
+    flatline *= np.maximum(0, progress - 0.6) / 0.4
+    hum *= 1 - progress
     return mix(powerdown, beat, flatline, hum)
 
 
@@ -418,33 +617,34 @@ def mission_station_gen(t, dur):
     """Airlock opening, beam-down activation."""
     # Airlock hiss
     progress = t / dur
-    hiss = white_noise(0.35) * max(0, 1 - progress * 3) if progress < 0.4 else 0
+    hiss = white_noise(t, 0.35) * np.maximum(0, 1 - progress * 3)
     # Beam activation (rising tone)
     beam_start = 0.3
-    if t > beam_start:
-        beam_progress = (t - beam_start) / (dur - beam_start)
-        beam = sine_wave(t, 300 + 700 * beam_progress) * 0.35
-        beam += sine_wave(t, 600 + 1400 * beam_progress) * 0.15
-    else:
-        beam = 0
-    # Metallic clunk
-    clunk = sine_wave(t, 150) * max(0, 1 - (t * 10)) * 0.4 if t < 0.2 else 0
-    # Station ambience
-    ambience = sine_wave(t, 90) * 0.1
+    beam_progress = np.maximum(0, (t - beam_start) / (dur - beam_start))
+    beam_low, beam_high, clunk, ambience = (OscillatorBank()
+                                            .add(300 + 700 * beam_progress, 0.35)
+                                            .add(600 + 1400 * beam_progress, 0.15)
+                                            # Metallic clunk
+                                            .add(150, 0.4)
+                                            # Station ambience
+                                            .add(90, 0.1)
+                                            .render(t))
+    beam = (beam_low + beam_high) * (t > beam_start)
+    clunk *= np.maximum(0, 1 - (t * 10))
     return mix(hiss, beam, clunk, ambience)
 
 
 def mission_asteroid_gen(t, dur):
     """Mining environment, rocky deployment."""
-    # Rocky rumble
-    rumble = sine_wave(t, 50 + 20 * sine_wave(t, 0.5)) * 0.35
-    # Mining drill hint
-    drill = saw_wave(t, 300 + 100 * sine_wave(t, 4)) * 0.15
+    rumble, drill, echo = (OscillatorBank()
+                           .add(50 + 20 * sine_wave(t, 0.5), 0.35)        # Rocky rumble
+                           .add(300 + 100 * sine_wave(t, 4), 0.15, "saw")  # Mining drill hint
+                           .add(800, 0.15)                                # Metallic echoes
+                           .render(t))
+    echo *= pluck(t, 3, 0.042)
     # Deployment whoosh
     progress = t / dur
-    whoosh = white_noise(0.3) * max(0, 1 - abs(progress - 0.5) * 4) * 0.3
-    # Metallic echoes
-    echo = sine_wave(t, 800) * max(0, 1 - ((t * 3) % 1.0) * 8) * 0.15
+    whoosh = white_noise(t, 0.3) * np.maximum(0, 1 - abs(progress - 0.5) * 4) * 0.3
     return mix(rumble, drill, whoosh, echo)
 
 
@@ -452,14 +652,16 @@ def mission_planet_gen(t, dur):
     """Atmospheric entry, alien environment."""
     # Atmospheric whoosh
     progress = t / dur
-    atmo = white_noise(0.3) * (0.5 + 0.5 * sine_wave(t, 0.5)) * 0.3
-    # Entry heat (rising then fading)
-    heat = sine_wave(t, 200 + 300 * max(0, 1 - abs(progress - 0.4) * 4)) * 0.25
+    atmo = white_noise(t, 0.3) * (0.5 + 0.5 * sine_wave(t, 0.5)) * 0.3
+    heat, alien, alien2 = (OscillatorBank()
+                           # Entry heat (rising then fading)
+                           .add(200 + 300 * np.maximum(0, 1 - abs(progress - 0.4) * 4), 0.25)
+                           # Alien ambience
+                           .add(250 + 30 * sine_wave(t, 0.2), 0.15)
+                           .add(370 + 20 * sine_wave(t, 0.15), 0.1)
+                           .render(t))
     # Wind-like sounds
-    wind = white_noise(0.2) * abs(sine_wave(t, 0.3)) * 0.25
-    # Alien ambience
-    alien = sine_wave(t, 250 + 30 * sine_wave(t, 0.2)) * 0.15
-    alien2 = sine_wave(t, 370 + 20 * sine_wave(t, 0.15)) * 0.1
+    wind = white_noise(t, 0.2) * abs(sine_wave(t, 0.3)) * 0.25
     return mix(atmo, heat, wind, alien, alien2)
 
 
@@ -471,60 +673,61 @@ def objective_complete_gen(t, dur):
     """Success chime, positive confirmation."""
     # Victory chime (ascending notes)
     progress = t / dur
-    if progress < 0.25:
-        note_freq = 523  # C5
-    elif progress < 0.5:
-        note_freq = 659  # E5
-    elif progress < 0.75:
-        note_freq = 784  # G5
-    else:
-        note_freq = 1047  # C6
-    chime = sine_wave(t, note_freq) * 0.3
-    # Harmonic
-    harmonic = sine_wave(t, note_freq * 2) * 0.1
-    # Sparkling
-    sparkle = sine_wave(t, note_freq * 3) * 0.05 * abs(sine_wave(t, 8))
-    # Confirmation beep
-    confirm = sine_wave(t, 1200) * 0.1 * (1 if progress > 0.85 else 0)
+    note_freq = np.select(
+        [progress < 0.25, progress < 0.5, progress < 0.75],
+        [523, 659, 784],  # C5, E5, G5
+        1047)  # C6
+    chime, harmonic, sparkle, confirm = (OscillatorBank()
+                                         .add(note_freq, 0.3)
+                                         # Harmonic
+                                         .add(note_freq * 2, 0.1)
+                                         # Sparkling
+                                         .add(note_freq * 3, 0.05)
+                                         # Confirmation beep
+                                         .add(1200, 0.1)
+                                         .render(t))
+    sparkle *= abs(sine_wave(t, 8))
+    confirm *= progress > 0.85
     return mix(chime, harmonic, sparkle, confirm)
 
 
 def all_hostiles_eliminated_gen(t, dur):
     """Final combat fading, victory tone, all-clear."""
     progress = t / dur
-    # Final shot fading
-    if progress < 0.3:
-        shot = white_noise(0.3) * (1 - progress / 0.3) * 0.3
-        shot += sine_wave(t, 150) * (1 - progress / 0.3) * 0.2
-    else:
-        shot = 0
     # Silence break
     # Victory tone (ascending)
-    if progress > 0.4:
-        vic_progress = (progress - 0.4) / 0.6
-        vic_freq = 400 + 400 * vic_progress
-        victory = sine_wave(t, vic_freq) * 0.3
-        victory += sine_wave(t, vic_freq * 1.5) * 0.1
-    else:
-        victory = 0
-    # All-clear signal
-    clear = sine_wave(t, 880) * 0.2 * (1 if progress > 0.7 and (t * 3) % 1.0 < 0.15 else 0)
+    vic_progress = np.maximum(0, (progress - 0.4) / 0.6)
+    vic_freq = 400 + 400 * vic_progress
+    shot_tone, vic_low, vic_high, clear = (OscillatorBank()
+                                           .add(150, 0.2)
+                                           .add(vic_freq, 0.3)
+                                           .add(vic_freq * 1.5, 0.1)
+                                           # All-clear signal
+                                           .add(880, 0.2)
+                                           .render(t))
+    # Final shot fading
+    shot = (white_noise(t, 0.3) * 0.3 + shot_tone) * (1 - progress / 0.3) * (progress < 0.3)
+    victory = (vic_low + vic_high) * (progress > 0.4)
+    clear *= (progress > 0.7) & ((t * 3) % 1.0 < 0.15)
     return mix(shot, victory, clear)
 
 
 def arrival_perfect_gen(t, dur):
     """Triumphant arrival, celebration, hope."""
     progress = t / dur
-    # Major chord (C major)
-    c = sine_wave(t, 262) * 0.2
-    e = sine_wave(t, 330) * 0.15
-    g = sine_wave(t, 392) * 0.15
-    # Rising sweep
-    sweep = sine_wave(t, 200 + 600 * progress) * 0.15
-    # Celebration sparkles
-    sparkle = sine_wave(t, 1500 + 500 * sine_wave(t, 6)) * 0.1 * abs(sine_wave(t, 4))
-    # Triumphant horn
-    horn = sine_wave(t, 523 + 262 * progress) * 0.2
+    c, e, g, sweep, sparkle, horn = (OscillatorBank()
+                                     # Major chord (C major)
+                                     .add(262, 0.2)
+                                     .add(330, 0.15)
+                                     .add(392, 0.15)
+                                     # Rising sweep
+                                     .add(200 + 600 * progress, 0.15)
+                                     # Celebration sparkles
+                                     .add(1500 + 500 * sine_wave(t, 6), 0.1)
+                                     # Triumphant horn
+                                     .add(523 + 262 * progress, 0.2)
+                                     .render(t))
+    sparkle *= abs(sine_wave(t, 4))
     return mix(c, e, g, sweep, sparkle, horn)
 
 
@@ -532,102 +735,107 @@ def arrival_good_gen(t, dur):
     """Relief, cautious optimism, survival."""
     progress = t / dur
     # Relieved sigh (filtered noise)
-    relief = white_noise(0.15) * max(0, 1 - progress * 2) * 0.2
-    # Hopeful tone
-    hope = sine_wave(t, 330 + 50 * progress) * 0.25
-    hope2 = sine_wave(t, 440 + 30 * progress) * 0.15
-    # Gentle chime
-    chime_phase = (t * 0.7) % 1.0
-    chime = sine_wave(t, 800) * max(0, 1 - chime_phase * 5) * 0.2
-    # Ship systems stable
-    stable = sine_wave(t, 150) * 0.1
+    relief = white_noise(t, 0.15) * np.maximum(0, 1 - progress * 2) * 0.2
+    hope, hope2, chime, stable = (OscillatorBank()
+                                  # Hopeful tone
+                                  .add(330 + 50 * progress, 0.25)
+                                  .add(440 + 30 * progress, 0.15)
+                                  # Gentle chime
+                                  .add(800, 0.2)
+                                  # Ship systems stable
+                                  .add(150, 0.1)
+                                  .render(t))
+    chime *= pluck(t, 0.7, 0.286)
     return mix(relief, hope, hope2, chime, stable)
 
 
 def arrival_bad_gen(t, dur):
     """Somber arrival, bittersweet, against odds."""
-    progress = t / dur
-    # Minor chord (A minor)
-    a = sine_wave(t, 220) * 0.2
-    c = sine_wave(t, 262) * 0.15
-    e = sine_wave(t, 330) * 0.15
-    # Somber pad
-    pad = sine_wave(t, 165) * 0.2
-    # Slow, tired ship hum
-    hum = sine_wave(t, 80 + 10 * sine_wave(t, 0.2)) * 0.15
-    # Distant, weak chime
-    chime_phase = (t * 0.4) % 1.0
-    chime = sine_wave(t, 600) * max(0, 1 - chime_phase * 6) * 0.1
+    a, c, e, pad, hum, chime = (OscillatorBank()
+                                # Minor chord (A minor)
+                                .add(220, 0.2)
+                                .add(262, 0.15)
+                                .add(330, 0.15)
+                                # Somber pad
+                                .add(165, 0.2)
+                                # Slow, tired ship hum
+                                .add(80 + 10 * sine_wave(t, 0.2), 0.15)
+                                # Distant, weak chime
+                                .add(600, 0.1)
+                                .render(t))
+    chime *= pluck(t, 0.4, 0.417)
     return mix(a, c, e, pad, hum, chime)
 
 
 def game_over_extinction_gen(t, dur):
     """Final breath, systems dying, silence."""
     progress = t / dur
-    # Dying systems
-    dying = sine_wave(t, 200 * (1 - progress * 0.9)) * 0.3 * (1 - progress * 0.8)
+    dying, flatline, void = (OscillatorBank()
+                             .add(200 * (1 - progress * 0.9), 0.3)  # Dying systems
+                             .add(1000, 0.2)                        # Flatline
+                             .add(40, 0.3)                          # Deep void
+                             .render(t))
+    dying *= 1 - progress * 0.8
+    flatline *= np.clip((progress - 0.5) / 0.2, 0, 1)
+    void *= 1 - progress
     # Last breath (noise fading)
-    breath = white_noise(0.2) * max(0, 1 - progress * 1.5) * 0.25
-    # Flatline
-    if progress > 0.5:
-        flatline = sine_wave(t, 1000) * 0.2 * min(1, (progress - 0.5) / 0.2)
-    else:
-        flatline = 0
-    # Deep void
-    void = sine_wave(t, 40) * 0.3 * (1 - progress)
+    breath = white_noise(t, 0.2) * np.maximum(0, 1 - progress * 1.5) * 0.25
     return mix(dying, breath, flatline, void)
 
 
 def ship_destroyed_gen(t, dur):
     """Massive explosion, catastrophic hull breach."""
     progress = t / dur
+    blast, tear = (OscillatorBank()
+                   .add(60 + 40 * sine_wave(t, 2), 0.4)
+                   # Metal tearing
+                   .add(150 + 100 * sine_wave(t, 5), 0.2, "saw")
+                   .render(t))
     # Initial explosion
-    if progress < 0.4:
-        explosion = white_noise(0.6) * (1 - progress / 0.4) * 0.5
-        explosion += sine_wave(t, 60 + 40 * sine_wave(t, 2)) * (1 - progress / 0.4) * 0.4
-    else:
-        explosion = 0
+    explosion = (white_noise(t, 0.6) * 0.5 + blast) * (1 - progress / 0.4) * (progress < 0.4)
     # Hull breach (whoosh)
-    breach = white_noise(0.3) * max(0, 1 - abs(progress - 0.3) * 4) * 0.3
-    # Metal tearing
-    tear = saw_wave(t, 150 + 100 * sine_wave(t, 5)) * 0.2 * max(0, 1 - progress * 2)
+    breach = white_noise(t, 0.3) * np.maximum(0, 1 - abs(progress - 0.3) * 4) * 0.3
+    tear *= np.maximum(0, 1 - progress * 2)
     # Fading debris
-    debris = white_noise(0.1) * max(0, progress - 0.5) * 0.2
+    debris = white_noise(t, 0.1) * np.maximum(0, progress - 0.5) * 0.2
     return mix(explosion, breach, tear, debris)
 
 
 def captain_died_gen(t, dur):
     """Somber tone, loss of command."""
     progress = t / dur
-    # Somber low tone
-    somber = sine_wave(t, 150) * 0.25
-    somber2 = sine_wave(t, 225) * 0.15  # Perfect fifth below
-    # Fading heartbeat
-    if progress < 0.5:
-        beat_phase = (t * 0.8) % 1.0
-        beat = sine_wave(t, 60) * max(0, 1 - beat_phase * 8) * 0.3 * (1 - progress * 2)
-    else:
-        beat = 0
-    # Empty ship hum
-    hum = sine_wave(t, 90, ) * 0.15 * max(0, 1 - progress * 0.5)
-    # Slow, mournful tone
-    mourn = sine_wave(t, 440 * (1 - progress * 0.1)) * 0.1
+    somber, somber2, beat, hum, mourn = (OscillatorBank()
+                                         # Somber low tone
+                                         .add(150, 0.25)
+                                         .add(225, 0.15)  # Perfect fifth below
+                                         # Fading heartbeat
+                                         .add(60, 0.3)
+                                         # Empty ship hum
+                                         .add(90, 0.15)
+                                         # Slow, mournful tone
+                                         .add(440 * (1 - progress * 0.1), 0.1)
+                                         .render(t))
+    beat *= pluck(t, 0.8, 0.156) * (1 - progress * 2) * (progress < 0.5)
+    hum *= np.maximum(0, 1 - progress * 0.5)
     return mix(somber, somber2, beat, hum, mourn)
 
 
 def voyage_intro_gen(t, dur):
     """Epic beginning, ship launching, hopeful departure."""
     progress = t / dur
-    # Engine ignition (building)
-    engine = sine_wave(t, 80 + 120 * progress) * 0.3
-    engine_rumble = white_noise(0.2) * (0.3 + 0.7 * progress) * 0.25
-    # Hopeful ascending tone
-    hope = sine_wave(t, 262 + 200 * progress) * 0.2
-    hope2 = sine_wave(t, 330 + 200 * progress) * 0.12
+    engine, hope, hope2, sparkle = (OscillatorBank()
+                                    # Engine ignition (building)
+                                    .add(80 + 120 * progress, 0.3)
+                                    # Hopeful ascending tone
+                                    .add(262 + 200 * progress, 0.2)
+                                    .add(330 + 200 * progress, 0.12)
+                                    # Stars passing (sparkles)
+                                    .add(2000 + 500 * sine_wave(t, 5), 0.05)
+                                    .render(t))
+    sparkle *= progress
+    engine_rumble = white_noise(t, 0.2) * (0.3 + 0.7 * progress) * 0.25
     # Launch whoosh
-    whoosh = white_noise(0.3) * max(0, 1 - abs(progress - 0.5) * 3) * 0.2
-    # Stars passing (sparkles)
-    sparkle = sine_wave(t, 2000 + 500 * sine_wave(t, 5)) * 0.05 * progress
+    whoosh = white_noise(t, 0.3) * np.maximum(0, 1 - abs(progress - 0.5) * 3) * 0.2
     return mix(engine, engine_rumble, hope, hope2, whoosh, sparkle)
 
 
@@ -635,111 +843,191 @@ def voyage_intro_gen(t, dur):
 # MAIN
 # ============================================================================
 
-def main():
+def load_manifest(path=MANIFEST_PATH):
+    """Load the scene SFX manifest; returns (assets, {category id: title}).
+
+    Each category gives a subdir, default envelope, format policy and loudness
+    target; an entry may override any of them. Generators are looked up by name in this module.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+
+    assets = []
+    titles = {}
+    default_formats = manifest.get("formats", DEFAULT_FORMATS)
+    default_loudness = manifest.get("loudness", DEFAULT_LOUDNESS)
+    for category in manifest["categories"]:
+        titles[category["id"]] = category.get("title", category["id"])
+        for entry in category["sfx"]:
+            gen_name = entry["generator"]
+            generator = globals().get(gen_name)
+            if not callable(generator):
+                raise ValueError(f"{path}: unknown generator '{gen_name}' for {entry['name']}")
+            formats = tuple(entry.get("formats", category.get("formats", default_formats)))
+            for spec in formats:
+                if spec.get("format") not in ENCODE_FORMATS:
+                    raise ValueError(f"{path}: unknown format '{spec.get('format')}' for {entry['name']} "
+                                     f"(expected one of {ENCODE_FORMATS})")
+            assets.append(SceneSFX(
+                subdir=entry.get("subdir", category["subdir"]),
+                name=entry["name"],
+                generator=generator,
+                duration=float(entry["duration"]),
+                envelope=entry.get("envelope", category.get("envelope", {})),
+                category=category["id"],
+                formats=formats,
+                loudness={**default_loudness, **category.get("loudness", {}), **entry.get("loudness", {})},
+            ))
+    return assets, titles
+
+
+def select_assets(assets, only=None, categories=None):
+    """Filter assets by --only names and --category ids (no filter keeps everything).
+
+    ``only`` matches a bare name ("beam"), a file name ("beam.mp3") or a
+    subdir-qualified path ("common_scene/beam").
+    """
+    selected = []
+    for asset in assets:
+        stem = os.path.splitext(asset.name)[0]
+        aliases = {stem, asset.name, f"{asset.subdir}/{stem}", f"{asset.subdir}/{asset.name}"}
+        if only and not aliases & set(only):
+            continue
+        if categories and asset.category not in categories:
+            continue
+        selected.append(asset)
+    return selected
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Generate Last Light Odyssey scene SFX.")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1,
+                        help="number of worker processes used for synthesis (default: all cores)")
+    parser.add_argument("--manifest", default=MANIFEST_PATH,
+                        help="scene SFX manifest (default: tools/scene_sfx_manifest.json)")
+    parser.add_argument("--only", action="append", metavar="NAME",
+                        help="render only this asset (e.g. beam or event_scene/solar_flare); repeatable")
+    parser.add_argument("--category", action="append", metavar="ID",
+                        help="render only this manifest category (e.g. event); repeatable")
+    # --changed compares against the cache, so it means nothing without one
+    selection = parser.add_mutually_exclusive_group()
+    selection.add_argument("--changed", action="store_true",
+                           help="only consider assets whose output is out of date with the render cache")
+    selection.add_argument("--no-cache", action="store_true",
+                           help="re-render every asset instead of restoring unchanged ones from the cache")
+    parser.add_argument("-n", "--dry-run", action="store_true",
+                        help="list what would be rebuilt or restored, then exit")
+    parser.add_argument("--stream-threshold", type=float, default=30.0, metavar="SECONDS",
+                        help="stream assets at least this long in fixed-size blocks (default: %(default)s)")
+    parser.add_argument("--block-size", type=int, default=DEFAULT_BLOCK_SIZE,
+                        help="frames per block for streamed assets (default: %(default)s)")
+    parser.add_argument("--engine", choices=OSCILLATOR_ENGINES, default="wavetable",
+                        help="oscillator engine: band-limited wavetables or direct math (default: %(default)s)")
+    parser.add_argument("--interpolation", choices=INTERPOLATIONS, default="linear",
+                        help="wavetable interpolation (default: %(default)s)")
+    parser.add_argument("--loudness-report", default=LOUDNESS_REPORT_PATH,
+                        help="loudness report to update (default: tools/scene_sfx_loudness.json)")
+    parser.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR,
+                        help="render cache directory (default: tools/.cache)")
+    parser.add_argument("--cache-size", type=int, default=DEFAULT_MAX_BYTES // (1024 * 1024),
+                        help="maximum render cache size in MB (default: %(default)s)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    set_oscillator_engine(args.engine, args.interpolation)
+
     print("=" * 60)
     print("Last Light Odyssey - Scene SFX Generator (LOUD VOLUME)")
     print("=" * 60)
 
-    # NEW: Additional Scene SFX
-    print("\n[0/8] Additional Scenes:")
-    extras = [
-        ("beam.mp3", beam_gen, 3.0),
-        ("extraction_complete.mp3", extraction_complete_gen, 4.0),
-        ("extraction_failed.mp3", extraction_failed_gen, 4.0),
-
-        ("voyage_failure.mp3", voyage_failure_gen, 5.0),
-    ]
-    # Place these in appropriate folders or a 'common' folder?
-    # User requested separate files. I will put them in 'common_scene' folder 
-    # OR repurpose/add to existing struct. 
-    # Let's put them in 'event_scene' or similar for now, or creates specific ones.
-    # To correspond with code, let's stick to strict folders.
-    # Actually, for 'beam', it's tactical but 'scene' volume. 
-    # For 'extraction', it's mission recap.
-    # Let's create a 'common' subfolder in scenes.
-    for name, gen, dur in extras:
-        generate_sfx(name, "common_scene", dur, gen, attack=0.1, release=0.5)
-
-
-    # Event Scenes
-    print("\n[1/8] Event Scenes:")
-    events = [
-        ("solar_flare.mp3", solar_flare_gen, 3.0),
-        ("meteor_shower.mp3", meteor_shower_gen, 3.0),
-        ("disease_outbreak.mp3", disease_outbreak_gen, 3.5),
-        ("system_malfunction.mp3", system_malfunction_gen, 3.0),
-        ("pirate_ambush.mp3", pirate_ambush_gen, 3.0),
-        ("space_debris.mp3", space_debris_gen, 3.0),
-        ("sensor_ghost.mp3", sensor_ghost_gen, 3.5),
-        ("radiation_storm.mp3", radiation_storm_gen, 3.0),
-        ("cryo_failure.mp3", cryo_failure_gen, 3.0),
-        ("clear_skies.mp3", clear_skies_gen, 3.0),
-    ]
-    for name, gen, dur in events:
-        generate_sfx(name, "event_scene", dur, gen, attack=0.1, release=0.5)
-
-    # Colonist Loss Milestones
-    print("\n[2/8] Colonist Loss Milestones:")
-    milestones = [
-        ("casualties_mount.mp3", casualties_mount_gen, 3.0),
-        ("weight_of_command.mp3", weight_of_command_gen, 3.5),
-        ("desperation.mp3", desperation_gen, 3.5),
-        ("all_hope_lost.mp3", all_hope_lost_gen, 4.0),
-        ("extinction.mp3", extinction_gen, 4.0),
-    ]
-    for name, gen, dur in milestones:
-        generate_sfx(name, "colonist_loss_scene", dur, gen, attack=0.15, release=0.8)
-
-    # Mission Scenes
-    print("\n[3/8] Mission Scenes:")
-    missions = [
-        ("mission_station.mp3", mission_station_gen, 3.0),
-        ("mission_asteroid.mp3", mission_asteroid_gen, 3.0),
-        ("mission_planet.mp3", mission_planet_gen, 3.5),
-    ]
-    for name, gen, dur in missions:
-        generate_sfx(name, "mission_scene", dur, gen, attack=0.05, release=0.5)
-
-    # Objective Complete
-    print("\n[4/8] Objective Complete:")
-    generate_sfx("objective_complete.mp3", "objective_complete_scene", 2.5,
-                 objective_complete_gen, attack=0.02, decay=0.05, sustain=0.8, release=0.4)
-
-    # Enemy Elimination
-    print("\n[5/8] Enemy Elimination:")
-    generate_sfx("all_hostiles_eliminated.mp3", "enemy_elimination_scene", 3.0,
-                 all_hostiles_eliminated_gen, attack=0.05, release=0.5)
-
-    # New Earth Arrival
-    print("\n[6/8] New Earth Arrival:")
-    arrivals = [
-        ("arrival_perfect.mp3", arrival_perfect_gen, 3.5),
-        ("arrival_good.mp3", arrival_good_gen, 3.0),
-        ("arrival_bad.mp3", arrival_bad_gen, 3.5),
-    ]
-    for name, gen, dur in arrivals:
-        generate_sfx(name, "new_earth_scene", dur, gen, attack=0.1, release=0.6)
-
-    # Game Over
-    print("\n[7/8] Game Over:")
-    game_overs = [
-        ("extinction.mp3", game_over_extinction_gen, 4.0),
-        ("ship_destroyed.mp3", ship_destroyed_gen, 3.5),
-        ("captain_died.mp3", captain_died_gen, 4.0),
-    ]
-    for name, gen, dur in game_overs:
-        generate_sfx(name, "game_over_scene", dur, gen, attack=0.05, release=1.0)
-
-    # Voyage Intro
-    print("\n[8/8] Voyage Intro:")
-    generate_sfx("voyage_intro.mp3", "voyage_intro_scene", 4.0,
-                 voyage_intro_gen, attack=0.2, decay=0.2, sustain=0.8, release=0.8)
+    cache = None if args.no_cache else RenderCache(args.cache_dir, args.cache_size * 1024 * 1024)
+
+    assets, titles = load_manifest(args.manifest)
+    assets = select_assets(assets, args.only, args.category)
+    if args.changed:
+        assets = [asset for asset in assets if asset_status(asset, cache) != "current"]
+    if not assets:
+        print("\nNothing to do.")
+        return
+
+    if args.dry_run:
+        print()
+        for asset in assets:
+            action = {"current": "up to date", "cached": "restore", "encode": "re-encode",
+                      "missing": "rebuild"}[asset_status(asset, cache)]
+            print(f"  {action:<10} {asset.subdir}/{asset.name}")
+        return
+
+    # Encoders run in the background while the next asset is synthesized
+    encoder = EncoderPool()
+
+    # Restore unchanged outputs from the cache, re-encode missing formats from
+    # cached renders and queue everything else for synthesis
+    to_render = []
+    to_store = []
+    loudness = {}
+    current_category = None
+    for asset in assets:
+        if asset.category != current_category:
+            current_category = asset.category
+            print(f"\n{titles[current_category]}:")
+        missing = [output for output in asset_outputs(asset)
+                   if not (cache and cache.restore(output[2], output[0]))]
+        to_store.extend(missing)
+        master = cache.lookup(render_cache_key(asset), ".npy") if cache else None
+        if not missing:
+            print(f"  Cached {asset.subdir}/{asset.name}")
+            if master:
+                stats = analyze_loudness(np.load(master), SAMPLE_RATE)
+                loudness[f"{asset.subdir}/{asset.name}"] = loudness_entry(asset, stats, loudness_gain(asset, stats))
+        elif master:
+            loudness[f"{asset.subdir}/{asset.name}"] = generate_sfx(asset, np.load(master), missing, encoder,
+                                                                    "Re-encoded")
+        else:
+            print(f"  Queued {asset.subdir}/{asset.name}")
+            to_render.append((asset, missing))
+
+    # Short assets are rendered whole (in parallel) and their float render is
+    # cached so new formats never need re-synthesis; long ones stream in blocks
+    buffered = [(asset, missing) for asset, missing in to_render if asset.duration < args.stream_threshold]
+    streamed = [(asset, missing) for asset, missing in to_render if asset.duration >= args.stream_threshold]
+    if to_render:
+        print(f"\nRendering {len(to_render)} asset(s):")
+    rendered = iter_rendered([asset for asset, _ in buffered], jobs=args.jobs)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for (asset, samples), (_, missing) in zip(rendered, buffered):
+            loudness[f"{asset.subdir}/{asset.name}"] = generate_sfx(asset, samples, missing, encoder)
+            if cache:
+                master = os.path.join(tmp_dir, "render.npy")
+                np.save(master, samples)
+                cache.store(render_cache_key(asset), master)
+    for asset, missing in streamed:
+        # Long assets are measured in a first streamed pass, then encoded
+        stats = measure_stream(asset, args.block_size)
+        gain = loudness_gain(asset, stats)
+        print(f"  Streaming {asset.subdir}/{asset.name} ({stats.loudness:.1f} LUFS, {db(gain):+.1f} dB)")
+        stream_sfx(asset, missing, gain, args.block_size)
+        loudness[f"{asset.subdir}/{asset.name}"] = loudness_entry(asset, stats, gain)
+
+    print("\nWaiting for encoders to finish...")
+    encoder.close()
+
+    write_loudness_report(args.loudness_report, loudness)
+    print(f"Loudness report: {os.path.relpath(args.loudness_report)}")
+    print(f"SFX manifest: {write_manifest()} sounds listed")
+
+    if cache:
+        for path, _, key in to_store:
+            cache.store(key, path)
+        cache.evict()
+        print(cache.report())
 
     print("\n" + "=" * 60)
-    print("All scene SFX (including new files) generated successfully!")
+    print(f"{len(assets)} scene SFX generated successfully!")
     print("=" * 60)
 
 
 if __name__ == "__main__":
-    random.seed(42)  # Deterministic output
     main()
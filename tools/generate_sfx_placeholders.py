@@ -1,133 +1,255 @@
 #!/usr/bin/env python3
 """
 Generate placeholder MP3 audio files for SFX system.
-Creates simple tone/beep files organized by category.
+Creates simple tone/beep files organized by category, as listed in
+tools/sfx_placeholders_manifest.json, for sounds that have no file yet
+(--overwrite replaces authored sounds too). Tones are synthesized with NumPy
+and the whole bank is encoded by a single ffmpeg process.
+
+Categories named in the manifest's "variants" section also get a bank of
+seeded variants per sound (<category>/variants/<name>_NN). Variants are
+derived from the sound's file on disk, authored or placeholder, and keep its
+length, with small pitch, level, start-trim, fade and noise differences, so
+the game can round-robin them instead of pitch-shifting one file on every play.
 """
 
-import os
+import argparse
+import hashlib
+import json
 import sys
-import math
+from collections import namedtuple
 from pathlib import Path
 
-try:
-    import numpy as np
-    from pydub import AudioSegment
-    from pydub.generators import Sine
-except ImportError:
-    print("Error: Required packages not installed.")
-    print("Please install: pip install numpy pydub")
-    sys.exit(1)
+import numpy as np
+
+from audio_dsp import adsr_envelope
+from audio_io import ENCODE_FORMATS, decode, encode_batch
+from build_sfx_manifest import write_manifest
 
 
 # Base directory for the project
 BASE_DIR = Path(__file__).parent.parent
 SFX_BASE = BASE_DIR / "assets" / "audio" / "sfx"
+MANIFEST_PATH = Path(__file__).parent / "sfx_placeholders_manifest.json"
 
-# SFX definitions: (category, name, frequency_hz, duration_ms)
-SFX_DEFINITIONS = [
-    # Combat SFX
-    ("combat", "shoot", 800, 150),
-    ("combat", "hit", 400, 200),
-    ("combat", "miss", 200, 250),
-    ("combat", "charge", 300, 300),
-    ("combat", "patch", 600, 200),
-    ("combat", "turret", 500, 250),
-    ("combat", "execute", 350, 400),
-    ("combat", "precision_shot", 1000, 100),
-    ("combat", "damage", 250, 300),
-    ("combat", "death", 150, 500),
-    
-    # UI SFX
-    ("ui", "click", 1000, 100),
-    ("ui", "menu_open", 600, 200),
-    ("ui", "menu_close", 400, 200),
-    
-    # Interaction SFX
-    ("interactions", "pickup", 800, 150),
-    ("interactions", "fuel_pickup", 600, 200),
-    ("interactions", "scrap_pickup", 700, 180),
-    ("interactions", "health_pickup", 500, 250),
-]
-
-
-def generate_tone(frequency: float, duration_ms: int, sample_rate: int = 44100) -> AudioSegment:
-    """
-    Generate a simple sine wave tone.
-    
-    Args:
-        frequency: Frequency in Hz
-        duration_ms: Duration in milliseconds
-        sample_rate: Sample rate (default 44100)
-    
-    Returns:
-        AudioSegment with the generated tone
+SAMPLE_RATE = 44100
+DEFAULT_FORMATS = [{"format": "mp3", "bitrate": "128k"}]
+VARIANTS_DIR = "variants"
+
+# Variation used when the manifest's "variants" section leaves a field out
+DEFAULT_VARIANTS = {
+    "count": 0,
+    "categories": [],
+    "seed": 7,
+    "pitch_cents": 30.0,   # +/- detune per variant
+    "gain_db": 1.0,        # +/- level change
+    "trim_ms": 5.0,        # up to this much is trimmed from the start
+    "fade_ms": 10.0,       # fade-out length; every variant ends on an exact 0
+    "fade_jitter": 0.25,   # +/- fraction of fade_ms
+    "noise": 0.02,         # seeded noise layer, relative to the source's local level
+}
+
+# One placeholder tone; amplitude is 0..1 of full scale, fade_ms applies to both ends
+PlaceholderSFX = namedtuple("PlaceholderSFX", "category name frequency duration_ms amplitude fade_ms")
+
+
+def load_manifest(path=MANIFEST_PATH):
+    """Load the placeholder definitions, output formats and variant policy from the manifest."""
+    with open(path, "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+    defaults = manifest.get("defaults", {})
+    formats = manifest.get("formats", DEFAULT_FORMATS)
+    for spec in formats:
+        if spec.get("format") not in ENCODE_FORMATS:
+            raise ValueError(f"Unknown format '{spec.get('format')}' (expected one of {ENCODE_FORMATS})")
+
+    definitions = []
+    for category in manifest["categories"]:
+        for entry in category["sfx"]:
+            definitions.append(PlaceholderSFX(
+                category["id"], entry["name"], float(entry["frequency"]), int(entry["duration_ms"]),
+                float(entry.get("amplitude", defaults.get("amplitude", 0.5))),
+                float(entry.get("fade_ms", defaults.get("fade_ms", 10))),
+            ))
+    variants = {**DEFAULT_VARIANTS, **manifest.get("variants", {})}
+    return definitions, formats, variants
+
+
+def generate_tone(frequency, duration_ms, sample_rate=SAMPLE_RATE, amplitude=0.5, fade_ms=10):
+    """Return a sine tone as float samples, with linear fades to avoid clicks."""
+    num_samples = int(sample_rate * duration_ms / 1000.0)
+    wave = np.arange(num_samples, dtype=np.float64)
+    wave *= 2 * np.pi * frequency / sample_rate
+    np.sin(wave, out=wave)
+    fade = fade_ms / 1000.0
+    wave *= adsr_envelope(num_samples, attack=fade, decay=0.0, sustain_level=1.0, release=fade,
+                          sample_rate=sample_rate)
+    wave *= amplitude
+    return wave
+
+
+# ============================================================================
+# VARIANTS
+# ============================================================================
+
+def variant_seed(sfx, seed):
+    """Stable seed for one sound's variant bank (independent of render order)."""
+    digest = hashlib.sha256(f"{seed}:{sfx.category}/{sfx.name}".encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "little")
+
+
+def sfx_path(sfx, sfx_base=SFX_BASE):
+    """The sound's file on disk (first of ENCODE_FORMATS present), or None."""
+    for out_format in ENCODE_FORMATS:
+        path = Path(sfx_base) / sfx.category / f"{sfx.name}.{out_format}"
+        if path.exists():
+            return path
+    return None
+
+
+def level_follower(samples, sample_rate=SAMPLE_RATE, window_ms=5.0):
+    """Smoothed absolute level of ``samples`` (moving average over ``window_ms``)."""
+    window = max(1, int(sample_rate * window_ms / 1000.0))
+    return np.convolve(np.abs(samples), np.full(window, 1.0 / window), mode="same")
+
+
+def generate_variants(source, sfx, variants, sample_rate=SAMPLE_RATE):
+    """Derive ``variants["count"]`` seeded variants of the ``source`` samples as a (count, samples) array.
+
+    Every variant keeps the source's length. Each row reads the source at
+    its own detuned rate from a start trimmed by a few milliseconds (one
+    interpolation over a (count, samples) position matrix; reads past the
+    end are silence), adds a seeded noise layer that follows the source's
+    level, and is scaled in level and faded out so its last sample is
+    exactly 0. A trimmed start gets a 1 ms fade-in from 0 so it does not
+    begin mid-waveform.
     """
-    # Generate time array
-    duration_sec = duration_ms / 1000.0
-    t = np.linspace(0, duration_sec, int(sample_rate * duration_sec), False)
-    
-    # Generate sine wave
-    wave = np.sin(2 * np.pi * frequency * t)
-    
-    # Normalize to 16-bit integer range
-    wave_normalized = np.int16(wave * 32767 * 0.5)  # 0.5 volume to avoid clipping
-    
-    # Convert to AudioSegment
-    audio = AudioSegment(
-        wave_normalized.tobytes(),
-        frame_rate=sample_rate,
-        channels=1,
-        sample_width=2
-    )
-    
-    # Add a quick fade in/out to avoid clicks
-    audio = audio.fade_in(10).fade_out(10)
-    
-    return audio
-
-
-def generate_sfx_file(category: str, name: str, frequency: float, duration_ms: int) -> None:
+    count = int(variants["count"])
+    num_samples = len(source)
+    rng = np.random.default_rng(variant_seed(sfx, variants["seed"]))
+    ratios = 2.0 ** (rng.uniform(-variants["pitch_cents"], variants["pitch_cents"], count) / 1200.0)
+    gains = 10.0 ** (rng.uniform(-variants["gain_db"], variants["gain_db"], count) / 20.0)
+    trims = np.floor(rng.uniform(0.0, variants["trim_ms"], count) / 1000.0 * sample_rate)
+    fades = variants["fade_ms"] / 1000.0 * sample_rate * (1.0 + rng.uniform(-1.0, 1.0, count) * variants["fade_jitter"])
+
+    index = np.arange(num_samples, dtype=np.float64)
+    positions = trims[:, None] + ratios[:, None] * index
+    # One interpolation renders the whole bank
+    flat = positions.ravel()
+    bank = np.interp(flat, index, source, right=0.0).reshape(count, num_samples)
+    if variants["noise"] > 0:
+        level = np.interp(flat, index, level_follower(source, sample_rate), right=0.0)
+        bank += rng.standard_normal((count, num_samples)) * level.reshape(count, num_samples) * variants["noise"]
+
+    envelope = np.clip((num_samples - 1 - index) / np.maximum(fades, 1.0)[:, None], 0.0, 1.0)
+    fade_in = max(1, int(sample_rate / 1000.0))
+    envelope *= np.where(trims[:, None] > 0, np.clip(index / fade_in, 0.0, 1.0), 1.0)
+    bank *= envelope
+    bank *= gains[:, None]
+    return bank
+
+
+def variant_sources(definitions, variants, sfx_base=SFX_BASE):
+    """Decode the current file of every definition in a variants category.
+
+    Returns ``[(sfx, samples)]``; sounds without a file are skipped.
     """
-    Generate a single SFX file.
-    
-    Args:
-        category: Category folder name (combat, ui, interactions)
-        name: File name without extension
-        frequency: Tone frequency in Hz
-        duration_ms: Duration in milliseconds
+    sources = []
+    for sfx in definitions:
+        source_path = sfx_path(sfx, sfx_base)
+        if sfx.category in variants["categories"] and source_path is not None:
+            sources.append((sfx, decode(source_path, SAMPLE_RATE)))
+    return sources
+
+
+def variant_items(sources, formats, variants, sfx_base=SFX_BASE):
+    """Variant banks of the decoded ``sources`` (from variant_sources()), as encode_batch() items."""
+    items = []
+    for sfx, source in sources:
+        for i, samples in enumerate(generate_variants(source, sfx, variants)):
+            for spec in formats:
+                options = {k: v for k, v in spec.items() if k != "format"}
+                path = Path(sfx_base) / sfx.category / VARIANTS_DIR / f"{sfx.name}_{i:02d}.{spec['format']}"
+                items.append((samples, path, options))
+    return items
+
+
+def select(definitions, categories=None, names=None):
+    """Filter definitions by category id and/or sound name ("name" or "category/name")."""
+    if categories:
+        definitions = [d for d in definitions if d.category in categories]
+    if names:
+        definitions = [d for d in definitions if d.name in names or f"{d.category}/{d.name}" in names]
+    return definitions
+
+
+def batch_items(definitions, formats, overwrite=False):
+    """Render the definitions and pair each with its output paths for encode_batch().
+
+    Sounds that already have a file are skipped unless ``overwrite`` is set,
+    so authored sounds are never replaced by placeholder tones by accident.
     """
-    # Create category directory if it doesn't exist
-    category_dir = SFX_BASE / category
-    category_dir.mkdir(parents=True, exist_ok=True)
-    
-    # Generate the tone
-    audio = generate_tone(frequency, duration_ms)
-    
-    # Export as MP3
-    output_path = category_dir / f"{name}.mp3"
-    audio.export(str(output_path), format="mp3", bitrate="128k")
-    
-    print(f"Generated: {output_path.relative_to(BASE_DIR)}")
-
-
-def main():
+    items = []
+    for sfx in definitions:
+        if not overwrite and sfx_path(sfx) is not None:
+            continue
+        samples = generate_tone(sfx.frequency, sfx.duration_ms, SAMPLE_RATE, sfx.amplitude, sfx.fade_ms)
+        for spec in formats:
+            options = {k: v for k, v in spec.items() if k != "format"}
+            items.append((samples, SFX_BASE / sfx.category / f"{sfx.name}.{spec['format']}", options))
+    return items
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Generate placeholder SFX tones.")
+    parser.add_argument("--manifest", default=str(MANIFEST_PATH),
+                        help="placeholder definitions (default: tools/sfx_placeholders_manifest.json)")
+    parser.add_argument("--category", action="append", metavar="ID",
+                        help="only generate this category (repeatable)")
+    parser.add_argument("--only", action="append", metavar="NAME",
+                        help="only generate this sound, as name or category/name (repeatable)")
+    parser.add_argument("--variants", type=int, metavar="N",
+                        help="variants per sound in the manifest's variant categories (default: from the manifest)")
+    parser.add_argument("--overwrite", action="store_true",
+                        help="replace existing (authored) sounds with placeholder tones too")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
     """Generate all placeholder SFX files."""
+    args = parse_args(argv)
+    definitions, formats, variants = load_manifest(args.manifest)
+    if args.variants is not None:
+        variants["count"] = args.variants
+    definitions = select(definitions, args.category, args.only)
+    if not definitions:
+        print("No placeholder SFX matched.")
+        return 1
+
     print("Generating placeholder SFX files...")
     print(f"Base directory: {BASE_DIR}")
     print(f"SFX directory: {SFX_BASE}\n")
-    
-    # Create base SFX directory if it doesn't exist
-    SFX_BASE.mkdir(parents=True, exist_ok=True)
-    
-    # Generate all SFX files
-    for category, name, frequency, duration in SFX_DEFINITIONS:
-        try:
-            generate_sfx_file(category, name, frequency, duration)
-        except Exception as e:
-            print(f"Error generating {category}/{name}.mp3: {e}")
-    
-    print(f"\nDone! Generated {len(SFX_DEFINITIONS)} placeholder SFX files.")
+
+    items = batch_items(definitions, formats, args.overwrite)
+    encode_batch(items, sample_rate=SAMPLE_RATE)
+    for _, output_path, _ in items:
+        print(f"Generated: {output_path.relative_to(BASE_DIR)}")
+    skipped = len(definitions) - len({path.with_suffix("") for _, path, _ in items})
+    if skipped:
+        print(f"Kept {skipped} existing sounds (use --overwrite to replace them)")
+    # Variants come from the files now on disk, so they follow authored sounds
+    extra = []
+    if variants["count"] > 0:
+        extra = variant_items(variant_sources(definitions, variants), formats, variants)
+    encode_batch(extra, sample_rate=SAMPLE_RATE)
+    if extra:
+        print(f"Generated {len(extra)} variant files ({variants['count']} per sound in "
+              f"{', '.join(variants['categories'])})")
+
+    print(f"\nSFX manifest: {write_manifest()} sounds listed")
+    print(f"Done! Generated {len(items)} placeholder SFX files.")
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
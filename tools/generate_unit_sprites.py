@@ -13,188 +13,16 @@ Reference Style Characteristics:
 - Clear dark outlines
 """
 
-from PIL import Image, ImageDraw
+from PIL import ImageDraw
 import os
 
+from sprite_kit import (EYE_DARK, EYE_WHITE, HAIR_BROWN, HAIR_DARK, HAIR_GRAY, HAIR_LIGHT, OUTLINE, SIZE, SKIN_LIGHT,
+                        SKIN_MID, SKIN_SHADOW, WHITE, chibi_body_layer, chibi_head_layer, compose, layer_cache_info,
+                        shadow_layer)
+
 # Output directory
 OUTPUT_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "assets", "sprites", "characters")
 
-# Sprite size - 32x32 for tactical game
-SIZE = 32
-
-# Common colors
-OUTLINE = (25, 25, 35)           # Dark outline
-SKIN_LIGHT = (255, 213, 170)     # Light skin tone
-SKIN_MID = (235, 185, 145)       # Mid skin tone
-SKIN_SHADOW = (200, 150, 115)    # Shadow skin tone
-HAIR_DARK = (50, 40, 35)         # Dark hair
-HAIR_BROWN = (100, 70, 50)       # Brown hair
-HAIR_LIGHT = (180, 150, 110)     # Light/blonde hair
-HAIR_GRAY = (120, 120, 130)      # Gray hair
-WHITE = (255, 255, 255)
-EYE_WHITE = (255, 255, 255)
-EYE_DARK = (30, 30, 40)
-
-
-def create_base_image():
-    """Create a transparent 32x32 image."""
-    return Image.new("RGBA", (SIZE, SIZE), (0, 0, 0, 0))
-
-
-def draw_shadow(draw, cx=16, width=12, y=30):
-    """Draw ground shadow ellipse for 3/4 top-down grounding."""
-    shadow_color = (0, 0, 0, 60)
-    draw.ellipse(
-        (cx - width // 2, y - 2, cx + width // 2, y + 1),
-        fill=shadow_color
-    )
-
-
-def draw_chibi_body_topdown(draw, colors, cx=16):
-    """
-    Draw a chibi body from 3/4 top-down perspective.
-    The body is SHORT and SQUAT to match reference style.
-    Feet are visible and positioned to show ground plane.
-    """
-    # === FEET (bottom-most, showing ground plane) ===
-    # Feet are small ovals at the bottom, spread slightly
-    # Left foot
-    draw.ellipse((cx - 6, 27, cx - 2, 30), fill=colors.get("shoes", colors["primary"]))
-    draw.ellipse((cx - 6, 27, cx - 2, 29), fill=OUTLINE)  # Top outline
-    # Right foot
-    draw.ellipse((cx + 2, 27, cx + 6, 30), fill=colors.get("shoes", colors["primary"]))
-    draw.ellipse((cx + 2, 27, cx + 6, 29), fill=OUTLINE)  # Top outline
-    
-    # === LEGS (very short, mostly hidden by body) ===
-    # Left leg stub
-    draw.rectangle((cx - 5, 24, cx - 2, 28), fill=colors.get("pants", colors["secondary"]))
-    # Right leg stub  
-    draw.rectangle((cx + 2, 24, cx + 5, 28), fill=colors.get("pants", colors["secondary"]))
-    
-    # === TORSO (compact, rounded) ===
-    # Main body - wider than tall for chibi look
-    draw.ellipse((cx - 8, 17, cx + 8, 27), fill=colors["primary"])
-    # Body outline
-    draw.arc((cx - 8, 17, cx + 8, 27), 30, 150, fill=OUTLINE, width=1)
-    
-    # Chest/uniform detail
-    if "secondary" in colors:
-        draw.ellipse((cx - 5, 19, cx + 5, 25), fill=colors["secondary"])
-    
-    # === ARMS (small, at sides) ===
-    # Left arm - small oval
-    draw.ellipse((cx - 10, 19, cx - 6, 25), fill=colors["primary"])
-    draw.arc((cx - 10, 19, cx - 6, 25), 90, 270, fill=OUTLINE, width=1)
-    # Left hand
-    draw.ellipse((cx - 9, 23, cx - 6, 26), fill=SKIN_MID)
-    
-    # Right arm - small oval
-    draw.ellipse((cx + 6, 19, cx + 10, 25), fill=colors["primary"])
-    draw.arc((cx + 6, 19, cx + 10, 25), 270, 90, fill=OUTLINE, width=1)
-    # Right hand
-    draw.ellipse((cx + 6, 23, cx + 9, 26), fill=SKIN_MID)
-
-
-def draw_chibi_head_topdown(draw, hair_color, hair_style="short", cx=16, accessories=None):
-    """
-    Draw a chibi head from 3/4 top-down perspective.
-    Head is LARGE relative to body.
-    TOP OF HEAD is clearly visible (key for top-down look).
-    """
-    accessories = accessories or {}
-    
-    # === HEAD BASE (large oval) ===
-    # Head takes up significant vertical space
-    head_top = 3
-    head_bottom = 18
-    head_left = cx - 9
-    head_right = cx + 9
-    
-    # Main head shape
-    draw.ellipse((head_left, head_top, head_right, head_bottom), fill=SKIN_LIGHT)
-    
-    # Face shadow (lower portion for 3D effect)
-    draw.ellipse((head_left + 2, head_top + 8, head_right - 2, head_bottom - 1), fill=SKIN_MID)
-    
-    # === HAIR (TOP OF HEAD - crucial for top-down view) ===
-    # Hair covers the top portion of the head, clearly visible from above
-    
-    if hair_style == "short":
-        # Short spiky hair - visible from above
-        draw.ellipse((head_left - 1, head_top - 2, head_right + 1, head_top + 9), fill=hair_color)
-        # Spiky bits on top (visible from above)
-        draw.polygon([(cx - 6, head_top + 2), (cx - 4, head_top - 3), (cx - 2, head_top + 2)], fill=hair_color)
-        draw.polygon([(cx - 2, head_top + 1), (cx, head_top - 4), (cx + 2, head_top + 1)], fill=hair_color)
-        draw.polygon([(cx + 2, head_top + 2), (cx + 4, head_top - 3), (cx + 6, head_top + 2)], fill=hair_color)
-        # Top-down visible hair surface
-        draw.ellipse((head_left + 1, head_top - 1, head_right - 1, head_top + 7), fill=hair_color)
-        
-    elif hair_style == "military":
-        # Short buzz cut - flat on top
-        draw.ellipse((head_left, head_top - 1, head_right, head_top + 8), fill=hair_color)
-        # Flat top surface (key for top-down)
-        draw.rectangle((head_left + 2, head_top, head_right - 2, head_top + 5), fill=hair_color)
-        
-    elif hair_style == "ponytail":
-        # Hair with ponytail visible from above
-        draw.ellipse((head_left - 1, head_top - 1, head_right + 1, head_top + 9), fill=hair_color)
-        # Top surface
-        draw.ellipse((head_left + 1, head_top, head_right - 1, head_top + 6), fill=hair_color)
-        # Side hair fringes
-        draw.rectangle((head_left - 1, head_top + 6, head_left + 2, head_top + 12), fill=hair_color)
-        draw.rectangle((head_right - 2, head_top + 6, head_right + 1, head_top + 12), fill=hair_color)
-        # Ponytail (visible behind/to side from top-down)
-        draw.ellipse((head_right - 2, head_top + 2, head_right + 4, head_top + 10), fill=hair_color)
-        
-    elif hair_style == "bald":
-        # Bald/very short - shows skin on top
-        draw.ellipse((head_left + 1, head_top, head_right - 1, head_top + 5), fill=SKIN_LIGHT)
-        # Slight shadow on top
-        draw.arc((head_left + 2, head_top + 1, head_right - 2, head_top + 4), 0, 180, fill=SKIN_MID)
-    
-    elif hair_style == "helmet":
-        # For heavy armor - helmet instead of hair
-        pass  # Helmet drawn separately in character function
-    
-    # === FACE ===
-    # Eyes - simple dots or small shapes
-    eye_y = head_top + 10
-    # Left eye
-    draw.rectangle((cx - 5, eye_y, cx - 3, eye_y + 2), fill=EYE_WHITE)
-    draw.rectangle((cx - 4, eye_y, cx - 3, eye_y + 2), fill=EYE_DARK)
-    draw.point((cx - 4, eye_y), fill=WHITE)  # Shine
-    
-    # Right eye
-    draw.rectangle((cx + 3, eye_y, cx + 5, eye_y + 2), fill=EYE_WHITE)
-    draw.rectangle((cx + 3, eye_y, cx + 4, eye_y + 2), fill=EYE_DARK)
-    draw.point((cx + 4, eye_y), fill=WHITE)  # Shine
-    
-    # Mouth (optional simple line)
-    draw.line((cx - 2, head_top + 14, cx + 2, head_top + 14), fill=SKIN_SHADOW, width=1)
-    
-    # === HEAD OUTLINE (only lower face, not covered by hair) ===
-    # Draw outline only on the chin/jaw area (bottom arc from ~45 to ~135 degrees)
-    draw.arc((head_left, head_top, head_right, head_bottom), 30, 150, fill=OUTLINE, width=1)
-    
-    # === ACCESSORIES ===
-    if accessories.get("goggles"):
-        # Goggles on forehead
-        draw.rectangle((head_left + 2, head_top + 5, head_right - 2, head_top + 8), fill=(60, 60, 70))
-        draw.rectangle((head_left + 3, head_top + 6, cx - 2, head_top + 7), fill=(100, 200, 230))
-        draw.rectangle((cx + 2, head_top + 6, head_right - 3, head_top + 7), fill=(100, 200, 230))
-        
-    if accessories.get("headband"):
-        # Medical headband
-        draw.rectangle((head_left + 1, head_top + 6, head_right - 1, head_top + 8), fill=WHITE)
-        draw.rectangle((cx - 1, head_top + 6, cx + 1, head_top + 8), fill=(255, 50, 50))
-        
-    if accessories.get("visor"):
-        # Tech visor/glasses
-        draw.rectangle((head_left + 2, eye_y - 1, head_right - 2, eye_y + 2), fill=(60, 60, 80))
-        draw.rectangle((head_left + 3, eye_y, cx - 2, eye_y + 1), fill=(150, 200, 255))
-        draw.rectangle((cx + 2, eye_y, head_right - 3, eye_y + 1), fill=(150, 200, 255))
-
-
 # =============================================================================
 # OFFICER SPRITES
 # =============================================================================
@@ -204,9 +32,6 @@ def generate_captain():
     Captain - Command leader with officer's cap
     Gold/yellow uniform, authoritative look
     """
-    img = create_base_image()
-    draw = ImageDraw.Draw(img)
-    
     colors = {
         "primary": (200, 160, 50),       # Gold uniform
         "secondary": (170, 130, 30),     # Darker gold details
@@ -215,9 +40,9 @@ def generate_captain():
         "accent": (255, 210, 60),        # Bright gold
     }
     
-    draw_shadow(draw)
-    draw_chibi_body_topdown(draw, colors)
-    draw_chibi_head_topdown(draw, HAIR_DARK, "military")
+    img = compose(SIZE, shadow_layer(SIZE), chibi_body_layer(SIZE, colors),
+                  chibi_head_layer(SIZE, HAIR_DARK, "military"))
+    draw = ImageDraw.Draw(img)
     
     cx = 16
     # === CAPTAIN'S CAP (visible from top-down) ===
@@ -252,9 +77,6 @@ def generate_scout():
     Scout - Agile recon specialist with tactical gear
     Green camouflage, goggles, radio antenna
     """
-    img = create_base_image()
-    draw = ImageDraw.Draw(img)
-    
     colors = {
         "primary": (70, 100, 70),        # Forest green
         "secondary": (55, 80, 55),       # Darker green
@@ -263,9 +85,9 @@ def generate_scout():
         "accent": (140, 190, 140),       # Light green
     }
     
-    draw_shadow(draw)
-    draw_chibi_body_topdown(draw, colors)
-    draw_chibi_head_topdown(draw, HAIR_BROWN, "short", accessories={"goggles": True})
+    img = compose(SIZE, shadow_layer(SIZE), chibi_body_layer(SIZE, colors),
+                  chibi_head_layer(SIZE, HAIR_BROWN, "short", accessories={"goggles": True}))
+    draw = ImageDraw.Draw(img)
     
     cx = 16
     # === TACTICAL VEST (visible from above) ===
@@ -290,9 +112,6 @@ def generate_tech():
     Tech - Engineer with tools and tech visor
     Teal/cyan uniform, utility belt, backpack
     """
-    img = create_base_image()
-    draw = ImageDraw.Draw(img)
-    
     colors = {
         "primary": (50, 130, 140),       # Teal
         "secondary": (35, 100, 110),     # Darker teal
@@ -301,9 +120,9 @@ def generate_tech():
         "accent": (100, 220, 235),       # Bright cyan
     }
     
-    draw_shadow(draw)
-    draw_chibi_body_topdown(draw, colors)
-    draw_chibi_head_topdown(draw, HAIR_GRAY, "short", accessories={"visor": True})
+    img = compose(SIZE, shadow_layer(SIZE), chibi_body_layer(SIZE, colors),
+                  chibi_head_layer(SIZE, HAIR_GRAY, "short", accessories={"visor": True}))
+    draw = ImageDraw.Draw(img)
     
     cx = 16
     # === UTILITY SUIT DETAILS ===
@@ -334,9 +153,6 @@ def generate_medic():
     Medic - Field medic with medical cross and kit
     Magenta/purple uniform, white cross, med bag
     """
-    img = create_base_image()
-    draw = ImageDraw.Draw(img)
-    
     colors = {
         "primary": (170, 70, 130),       # Magenta
         "secondary": (140, 50, 105),     # Darker magenta
@@ -345,9 +161,9 @@ def generate_medic():
         "accent": (255, 255, 255),       # White
     }
     
-    draw_shadow(draw)
-    draw_chibi_body_topdown(draw, colors)
-    draw_chibi_head_topdown(draw, HAIR_LIGHT, "ponytail", accessories={"headband": True})
+    img = compose(SIZE, shadow_layer(SIZE), chibi_body_layer(SIZE, colors),
+                  chibi_head_layer(SIZE, HAIR_LIGHT, "ponytail", accessories={"headband": True}))
+    draw = ImageDraw.Draw(img)
     
     cx = 16
     # === MEDICAL CROSS ON CHEST ===
@@ -380,9 +196,6 @@ def generate_sniper():
     Sniper - Long-range precision marksman with hood and scope
     Dark slate blue/gray stealth suit, tactical hood, targeting monocle
     """
-    img = create_base_image()
-    draw = ImageDraw.Draw(img)
-    
     colors = {
         "primary": (70, 75, 90),         # Dark slate blue-gray
         "secondary": (55, 58, 72),       # Darker slate
@@ -396,7 +209,8 @@ def generate_sniper():
         "dark_metal": (65, 68, 78),      # Dark metal
     }
     
-    draw_shadow(draw)
+    img = compose(SIZE, shadow_layer(SIZE))
+    draw = ImageDraw.Draw(img)
     
     cx = 16
     
@@ -528,9 +342,6 @@ def generate_heavy():
     Heavy - Armored tank with helmet and heavy armor
     Orange-red armor, bulky silhouette, protective helmet
     """
-    img = create_base_image()
-    draw = ImageDraw.Draw(img)
-    
     colors = {
         "primary": (170, 85, 50),        # Orange-red armor
         "secondary": (140, 65, 35),      # Darker orange
@@ -541,7 +352,8 @@ def generate_heavy():
         "dark_metal": (80, 80, 90),      # Dark metal
     }
     
-    draw_shadow(draw, width=14)  # Wider shadow for bulky character
+    img = compose(SIZE, shadow_layer(SIZE, width=14))  # Wider shadow for bulky character
+    draw = ImageDraw.Draw(img)
     
     cx = 16
     
@@ -616,9 +428,6 @@ def generate_enemy_basic():
     Basic Enemy - Standard hostile unit
     Red/dark color scheme, menacing but simple design
     """
-    img = create_base_image()
-    draw = ImageDraw.Draw(img)
-    
     colors = {
         "primary": (140, 50, 50),         # Dark red
         "secondary": (110, 35, 35),       # Darker red
@@ -627,9 +436,9 @@ def generate_enemy_basic():
         "accent": (200, 80, 80),          # Bright red
     }
     
-    draw_shadow(draw)
-    draw_chibi_body_topdown(draw, colors)
-    draw_chibi_head_topdown(draw, (40, 35, 30), "military")
+    img = compose(SIZE, shadow_layer(SIZE), chibi_body_layer(SIZE, colors),
+                  chibi_head_layer(SIZE, (40, 35, 30), "military"))
+    draw = ImageDraw.Draw(img)
     
     cx = 16
     # === HOSTILE MARKINGS ===
@@ -659,9 +468,6 @@ def generate_enemy_heavy():
     Heavy Enemy - Armored hostile tank
     Dark armor with red accents, bulky and threatening
     """
-    img = create_base_image()
-    draw = ImageDraw.Draw(img)
-    
     colors = {
         "primary": (60, 55, 55),          # Dark gray armor
         "secondary": (45, 40, 40),        # Darker gray
@@ -672,7 +478,8 @@ def generate_enemy_heavy():
         "dark_metal": (50, 45, 45),       # Dark metal
     }
     
-    draw_shadow(draw, width=14)
+    img = compose(SIZE, shadow_layer(SIZE, width=14))
+    draw = ImageDraw.Draw(img)
     
     cx = 16
     
@@ -771,6 +578,9 @@ def main():
     
     print("=" * 50)
     print(f"All {len(sprites)} sprites generated successfully!")
+    reused = sum(info.hits for info in layer_cache_info().values())
+    drawn = sum(info.misses for info in layer_cache_info().values())
+    print(f"Shared layers: {drawn} drawn, {reused} reused")
     print(f"Output directory: {OUTPUT_DIR}")
     print("\nKey style features:")
     print("  - 3/4 top-down perspective (view from above)")
@@ -1,123 +1,206 @@
-from PIL import Image, ImageDraw, ImageFilter, ImageEnhance
+#!/usr/bin/env python3
+"""
+Generate the navigation wormhole sprite for Last Light Odyssey.
+The spiral/accretion model is evaluated as NumPy arrays over the whole pixel
+grid and handed to PIL in one fromarray call, so render time scales with the
+pixel count and high-DPI sizes (512-1024 px) take a fraction of a second.
+
+With --frames N it also renders a rotating animation: every frame offsets the
+spiral's twist angle, all frames are evaluated as one (frames, height, width)
+array, and they are packed into a sprite sheet next to a JSON frame list and a
+SpriteFrames resource for AnimatedSprite2D.
+"""
+
+import argparse
+import json
 import math
-import random
+import time
+from pathlib import Path
+
+import numpy as np
+from PIL import Image, ImageFilter
+
+BASE_DIR = Path(__file__).parent.parent
+OUTPUT_PATH = BASE_DIR / "assets" / "sprites" / "navigation" / "wormhole.png"
+SHEET_PATH = BASE_DIR / "assets" / "sprites" / "navigation" / "wormhole_sheet.png"
+
+# Parameters for the wormhole
+ARMS = 2  # 2 main arms
+HORIZON = 0.25  # Event horizon radius as a fraction of the sprite radius
+NOISE_SEED = 7
+
+# Blur radius at the original 64 px size; scaled with the sprite so every
+# size has the same look
+BASE_SIZE = 64
+BASE_BLUR = 0.5
+
+# Animation defaults; one loop turns the spiral by one arm spacing, after
+# which the two-armed pattern repeats exactly
+DEFAULT_FRAMES = 16
+DEFAULT_FPS = 12.0
+
+
+def wormhole_field(size=(64, 64), seed=NOISE_SEED):
+    """Render the wormhole as an (height, width, 4) uint8 RGBA array."""
+    return wormhole_frames(size, np.zeros(1), seed)[0]
+
+
+def frame_rotations(frame_count):
+    """Twist offsets (radians) of a seamless ``frame_count``-frame rotation loop."""
+    return np.arange(frame_count) * (2.0 * np.pi / ARMS / frame_count)
+
+
+def wormhole_frames(size=(64, 64), rotations=None, seed=NOISE_SEED):
+    """Render one frame per twist offset as a (frames, height, width, 4) uint8 array.
+
+    The pixel geometry, radial gradient and noise are shared by all frames;
+    only the spiral term is evaluated per frame, in one broadcast pass.
+    """
+    rotations = frame_rotations(DEFAULT_FRAMES) if rotations is None else np.asarray(rotations, dtype=np.float64)
+    width, height = size
+    center_x, center_y = width / 2, height / 2
+    max_radius = width / 2 - 1
+    horizon_radius = max_radius * HORIZON
+
+    dx = np.arange(width, dtype=np.float64)[None, :] - center_x
+    dy = np.arange(height, dtype=np.float64)[:, None] - center_y
+    dist = np.hypot(dx, dy)
+    angle = np.arctan2(dy, dx)
+
+    # 1. Accretion disk: logarithmic spiral, twisting faster near the horizon
+    norm_dist = (dist - horizon_radius) / (max_radius - horizon_radius)
+    twist = angle + 1.5 / np.maximum(norm_dist + 0.1, 1e-6)
+    twist = twist[None, :, :] - rotations[:, None, None]
+    # Sharpen the arms (sin mapped to 0..1, cubed) into distinct streaks
+    spiral_intensity = ((np.sin(twist * ARMS) + 1.0) / 2.0) ** 3
+
+    # 2. Radial gradient, brighter near the horizon (capped as a glow)
+    radial_brightness = np.minimum(2.0, 1.0 / np.maximum(norm_dist + 0.2, 1e-6))
+
+    # 3. Noise/texture
+    noise = np.random.default_rng(seed).uniform(0.8, 1.2, dist.shape)
+    intensity = spiral_intensity * radial_brightness * noise
+
+    # 4. Color ramp: White (Hot) -> Cyan -> Purple -> Blue (Cold/Edge)
+    conditions = [intensity > 1.5, intensity > 0.8, intensity > 0.4]
+    t_cyan = (intensity - 0.8) / 0.7
+    t_purple = (intensity - 0.4) / 0.4
+    r = np.select(conditions, [255.0, 255.0 * t_cyan, 180.0 * (1.0 - t_purple)], 80.0 * intensity)
+    g = np.select(conditions, [255.0, 255.0, 255.0 * t_purple], 0.0)
+    b = np.select(conditions, [255.0, 255.0, 255.0], 180.0 * intensity + 50.0)
 
-def create_wormhole_sprite(output_path, size=(64, 64)):
+    # 5. Alpha: solid near the horizon, soft circular mask at the outermost edge
+    alpha = np.floor(255.0 * np.minimum(1.0, intensity))
+    edge = norm_dist > 0.9
+    alpha[:, edge] = np.floor(alpha[:, edge] * (1.0 - norm_dist[edge]) / 0.1)
+
+    rgba = np.stack([r, g, b, alpha], axis=-1)
+
+    # 6. Event horizon (the void): pure black with an anti-aliased edge
+    inside = dist < horizon_radius
+    rgba[:, inside] = 0.0
+    rgba[:, inside, 3] = np.where(dist[inside] > horizon_radius - 1.0,
+                                  np.floor(255.0 * (horizon_radius - dist[inside])), 255.0)
+    rgba[:, ~inside & (dist > max_radius)] = 0.0
+
+    return np.clip(rgba, 0.0, 255.0).astype(np.uint8)
+
+
+def create_wormhole_sprite(output_path=OUTPUT_PATH, size=(64, 64), seed=NOISE_SEED):
     print(f"Generating wormhole sprite at size {size}...")
-    
-    # Create a new image with transparency
-    img = Image.new('RGBA', size, (0, 0, 0, 0))
-    pixels = img.load()
-    
-    center_x, center_y = size[0] / 2, size[1] / 2
-    max_radius = size[0] / 2 - 1
-    
-    # Parameters for the wormhole
-    rotation_speed = 8.0  # High rotation for tight spiral
-    arms = 2 # 2 main arms
-    
-    for x in range(size[0]):
-        for y in range(size[1]):
-            dx = x - center_x
-            dy = y - center_y
-            dist = math.sqrt(dx*dx + dy*dy)
-            angle = math.atan2(dy, dx)
-            
-            # 1. Event Horizon (The Void)
-            # Sharp black circle in the middle
-            horizon_radius = max_radius * 0.25
-            if dist < horizon_radius:
-                # Anti-aliased edge for the hole
-                alpha = 255
-                if dist > horizon_radius - 1.0:
-                    alpha = int(255 * (horizon_radius - dist))
-                
-                # Pure black
-                pixels[x, y] = (0, 0, 0, alpha)
-                continue
-                
-            if dist > max_radius:
-                continue
-
-            # Normalized distance from horizon to edge (0 to 1)
-            norm_dist = (dist - horizon_radius) / (max_radius - horizon_radius)
-            
-            # 2. Accretion Disk (The Swirl)
-            
-            # Logarithmic spiral effect
-            # As we get closer to the horizon, velocity increases (angle twists more)
-            twist = angle + (1.0 / (norm_dist + 0.1)) * 1.5
-            
-            # Base brightness from spiral arms
-            # sin produces -1 to 1. Map to 0 to 1
-            spiral_val = math.sin(twist * arms)
-            spiral_intensity = (spiral_val + 1) / 2
-            
-            # Sharpen the arms to make them distinct streaks
-            spiral_intensity = pow(spiral_intensity, 3.0)
-            
-            # 3. Radial Gradient (Brighter near horizon)
-            # Brightness falls off as we go out
-            radial_brightness = 1.0 / (norm_dist + 0.2)
-            radial_brightness = min(2.0, radial_brightness) # Cap/Glow
-            
-            # 4. Noise/Texture
-            noise = random.uniform(0.8, 1.2)
-            
-            # Combine
-            total_intensity = spiral_intensity * radial_brightness * noise
-            
-            # 5. Coloring
-            # Spectrum: White (Hot) -> Cyan -> Purple -> Blue (Cold/Edge)
-            
-            r, g, b = 0, 0, 0
-            
-            if total_intensity > 1.5:
-                # White hot
-                r, g, b = 255, 255, 255
-            elif total_intensity > 0.8:
-                # Cyan/Bright Blue
-                # Interp between White and Cyan
-                t = (total_intensity - 0.8) / 0.7
-                r = int(0 + 255 * t)
-                g = 255
-                b = 255
-            elif total_intensity > 0.4:
-                # Purple/Pink
-                # Interp between Cyan and Purple
-                t = (total_intensity - 0.4) / 0.4
-                r = int(180 * (1-t))
-                g = int(0 + 255 * t)
-                b = 255
-            else:
-                # Deep Blue/Violet
-                r = int(80 * total_intensity)
-                g = 0
-                b = int(180 * total_intensity + 50)
-
-            # 6. Alpha Calculation
-            # Solid near horizon, fades out at edge
-            alpha = int(255 * min(1.0, total_intensity))
-            
-            # Soft circular mask at outermost edge
-            if norm_dist > 0.9:
-                edge_fade = (1.0 - norm_dist) / 0.1
-                alpha = int(alpha * edge_fade)
-                
-            # Clamping
-            r = min(255, max(0, r))
-            g = min(255, max(0, g))
-            b = min(255, max(0, b))
-            
-            pixels[x, y] = (r, g, b, alpha)
+    start = time.perf_counter()
 
+    img = Image.fromarray(wormhole_field(size, seed), "RGBA")
     # Apply a light blur to smooth the noise
-    img = img.filter(ImageFilter.GaussianBlur(0.5))
-    
-    # Save
+    img = img.filter(ImageFilter.GaussianBlur(BASE_BLUR * size[0] / BASE_SIZE))
+
     img.save(output_path)
-    print(f"Saved to {output_path}")
+    print(f"Saved to {output_path} ({(time.perf_counter() - start) * 1000:.0f} ms)")
+
+
+# ============================================================================
+# SPRITE SHEET
+# ============================================================================
+
+def res_path(path):
+    """Godot res:// path of a file inside the project."""
+    return "res://" + Path(path).resolve().relative_to(BASE_DIR.resolve()).as_posix()
+
+
+def sprite_frames_tres(texture_path, rects, fps, loop=True):
+    """SpriteFrames resource text: one AtlasTexture per frame rect of the sheet."""
+    lines = [f'[gd_resource type="SpriteFrames" load_steps={len(rects) + 2} format=3]', "",
+             f'[ext_resource type="Texture2D" path="{texture_path}" id="1_sheet"]', ""]
+    for i, (x, y, w, h) in enumerate(rects):
+        lines += [f'[sub_resource type="AtlasTexture" id="AtlasTexture_{i}"]', 'atlas = ExtResource("1_sheet")',
+                  f"region = Rect2({x}, {y}, {w}, {h})", ""]
+    frames = ", ".join(f'{{\n"duration": 1.0,\n"texture": SubResource("AtlasTexture_{i}")\n}}'
+                       for i in range(len(rects)))
+    lines += ["[resource]", "animations = [{", f'"frames": [{frames}],', f'"loop": {str(loop).lower()},',
+              '"name": &"default",', f'"speed": {float(fps)}', "}]", ""]
+    return "\n".join(lines)
+
+
+def create_wormhole_sheet(output_path=SHEET_PATH, size=(64, 64), frame_count=DEFAULT_FRAMES,
+                          fps=DEFAULT_FPS, seed=NOISE_SEED, columns=None):
+    """Render a rotating wormhole sprite sheet plus <sheet>.json and <sheet>.tres frame data."""
+    print(f"Generating {frame_count}-frame wormhole sheet at size {size}...")
+    start = time.perf_counter()
+    width, height = size
+    columns = columns or math.ceil(math.sqrt(frame_count))
+    rows = math.ceil(frame_count / columns)
+
+    frames = wormhole_frames(size, frame_rotations(frame_count), seed)
+    blur = ImageFilter.GaussianBlur(BASE_BLUR * width / BASE_SIZE)
+    sheet = Image.new("RGBA", (columns * width, rows * height), (0, 0, 0, 0))
+    rects = []
+    for i, frame in enumerate(frames):
+        x, y = (i % columns) * width, (i // columns) * height
+        # Frames are blurred separately so nothing bleeds across cells
+        sheet.paste(Image.fromarray(frame, "RGBA").filter(blur), (x, y))
+        rects.append((x, y, width, height))
+
+    output_path = Path(output_path)
+    sheet.save(output_path)
+    metadata = {
+        "image": output_path.name,
+        "frame_size": [width, height],
+        "columns": columns,
+        "rows": rows,
+        "fps": fps,
+        "loop": True,
+        "frames": [{"x": x, "y": y, "w": w, "h": h} for x, y, w, h in rects],
+    }
+    with open(output_path.with_suffix(".json"), "w", encoding="utf-8") as f:
+        json.dump(metadata, f, indent=2)
+        f.write("\n")
+    try:
+        texture_path = res_path(output_path)
+    except ValueError:
+        texture_path = output_path.name  # Outside the project: relative to the .tres
+    output_path.with_suffix(".tres").write_text(sprite_frames_tres(texture_path, rects, fps), encoding="utf-8")
+    print(f"Saved to {output_path} (+ .json, .tres) ({(time.perf_counter() - start) * 1000:.0f} ms)")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Generate the navigation wormhole sprite.")
+    parser.add_argument("-o", "--output", default=str(OUTPUT_PATH),
+                        help="output PNG (default: assets/sprites/navigation/wormhole.png)")
+    parser.add_argument("--size", type=int, default=64, help="sprite width and height in pixels (default: %(default)s)")
+    parser.add_argument("--seed", type=int, default=NOISE_SEED, help="noise seed (default: %(default)s)")
+    parser.add_argument("--frames", type=int, metavar="N",
+                        help=f"render an N-frame rotating sprite sheet instead (e.g. {DEFAULT_FRAMES}); "
+                             f"-o then defaults to assets/sprites/navigation/wormhole_sheet.png")
+    parser.add_argument("--fps", type=float, default=DEFAULT_FPS, help="sheet animation speed (default: %(default)s)")
+    parser.add_argument("--columns", type=int, help="frames per sheet row (default: square-ish grid)")
+    return parser.parse_args(argv)
+
 
 if __name__ == "__main__":
-    output_file = r'c:\Users\arman\Documents\Godot\Projects\Last Light Odyssey\assets\sprites\navigation\wormhole.png'
-    create_wormhole_sprite(output_file, size=(64, 64))
+    args = parse_args()
+    if args.frames:
+        output = args.output if args.output != str(OUTPUT_PATH) else SHEET_PATH
+        create_wormhole_sheet(output, size=(args.size, args.size), frame_count=args.frames,
+                              fps=args.fps, seed=args.seed, columns=args.columns)
+    else:
+        create_wormhole_sprite(args.output, size=(args.size, args.size), seed=args.seed)
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Event-scheduled music sequencer for the Last Light Odyssey audio tools.
+A track is a list of note events (pitch, start, length, envelope, instrument)
+loaded from a JSON data file. Events are rendered straight into a
+preallocated float mix buffer, one vectorized slice per note, either for the
+whole track or block by block with bounded memory. Looping tracks can be
+rendered seamlessly: the music past the loop end is crossfaded into the head.
+"""
+
+import json
+import re
+from collections import namedtuple
+
+import numpy as np
+
+from audio_dsp import DEFAULT_BLOCK_SIZE, SAMPLE_RATE, WAVEFORMS, adsr_envelope, adsr_envelope_block
+from audio_dsp import equal_power_fades, oscillate
+
+# One scheduled note; times are in seconds, frequency in Hz
+NoteEvent = namedtuple("NoteEvent", "start length freq amp instrument")
+
+# Sound of a note: waveform, level, optional ADSR envelope (seconds, applied
+# over each note's length) and optional tremolo ({"rate": Hz, "depth": 0..1},
+# locked to track time so sustained notes pulse together)
+Instrument = namedtuple("Instrument", "waveform amp envelope tremolo")
+
+# Notes up to this long reuse a cached whole-note envelope; longer ones are
+# evaluated per block so streamed renders stay bounded
+CACHED_ENVELOPE_SECONDS = 10.0
+
+NOTE_NAMES = {"C": 0, "D": 2, "E": 4, "F": 5, "G": 7, "A": 9, "B": 11}
+_NOTE_RE = re.compile(r"^([A-G])([#b]?)(-?\d+)$")
+
+
+def note_frequency(pitch):
+    """Frequency in Hz of a note name ("A4", "C#5", "Bb2") or a number (already Hz)."""
+    if isinstance(pitch, (int, float)):
+        return float(pitch)
+    match = _NOTE_RE.match(pitch)
+    if not match:
+        raise ValueError(f"Invalid pitch '{pitch}' (expected e.g. A4, C#5, Bb2 or a frequency)")
+    name, accidental, octave = match.groups()
+    semitone = NOTE_NAMES[name] + {"#": 1, "b": -1, "": 0}[accidental]
+    midi = 12 * (int(octave) + 1) + semitone
+    return 440.0 * 2.0 ** ((midi - 69) / 12)
+
+
+def fade_gain(t, duration, fade_in, fade_out):
+    """Linear fade-in/fade-out gain for a clip of ``duration`` seconds."""
+    gain = np.ones_like(t)
+    if fade_in > 0:
+        np.minimum(gain, t / fade_in, out=gain)
+    if fade_out > 0:
+        np.minimum(gain, (duration - t) / fade_out, out=gain)
+    return np.clip(gain, 0.0, 1.0, out=gain)
+
+
+class Track:
+    """A sequenced track: instruments, note events and a master fade.
+
+    Events are kept sorted by start time; render() and render_blocks() mix
+    only the events that overlap each buffer, so cost scales with the number
+    of sounding notes rather than with the track length. For looping tracks
+    the events continue ``loop_crossfade`` seconds past ``duration`` to supply
+    the tail that render_loop_blocks() folds into the head.
+    """
+
+    def __init__(self, name, duration, instruments, events, fade_in=0.0, fade_out=0.0,
+                 gain=1.0, sample_rate=SAMPLE_RATE, loop_crossfade=0.0, loop=False):
+        self.name = name
+        self.duration = duration
+        self.instruments = instruments
+        self.events = sorted(events, key=lambda ev: ev.start)
+        self.fade_in = fade_in
+        self.fade_out = fade_out
+        self.gain = gain
+        self.sample_rate = sample_rate
+        self.num_samples = int(sample_rate * duration)
+        self.loop_crossfade = loop_crossfade
+        self.loop = loop
+        for ev in self.events:
+            if ev.instrument not in instruments:
+                raise ValueError(f"Track '{name}': unknown instrument '{ev.instrument}'")
+        self._starts = np.array([int(round(ev.start * sample_rate)) for ev in self.events], dtype=np.int64)
+        self._lengths = np.array([int(round(ev.length * sample_rate)) for ev in self.events], dtype=np.int64)
+        self._ends = self._starts + self._lengths
+
+    def render(self):
+        """Render the whole track into one float buffer."""
+        out = np.zeros(self.num_samples)
+        self.render_into(out, 0)
+        return out
+
+    def blocks(self, block_size=DEFAULT_BLOCK_SIZE):
+        """render_loop_blocks() for a track loaded for looping, else render_blocks()."""
+        return self.render_loop_blocks(block_size) if self.loop else self.render_blocks(block_size)
+
+    def render_blocks(self, block_size=DEFAULT_BLOCK_SIZE):
+        """Yield the track in blocks of ``block_size`` samples (memory does not grow with length)."""
+        for start in range(0, self.num_samples, block_size):
+            out = np.zeros(min(block_size, self.num_samples - start))
+            self.render_into(out, start)
+            yield out
+
+    def render_loop_blocks(self, block_size=DEFAULT_BLOCK_SIZE):
+        """Yield exactly ``num_samples`` samples that loop without a seam.
+
+        The ``loop_crossfade`` seconds rendered past the loop end are mixed
+        into the head with an equal-power crossfade, so the sample after the
+        last one is the music's natural continuation. The master fade is
+        skipped, since a loop must not dip.
+        """
+        crossfade = int(round(self.loop_crossfade * self.sample_rate))
+        tail = self.render_into(np.zeros(crossfade), self.num_samples, fade=False)
+        fade_in, fade_out = equal_power_fades(crossfade)
+        for start in range(0, self.num_samples, block_size):
+            out = np.zeros(min(block_size, self.num_samples - start))
+            self.render_into(out, start, fade=False)
+            if start < crossfade:
+                n = min(len(out), crossfade - start)
+                out[:n] *= fade_in[start:start + n]
+                out[:n] += tail[start:start + n] * fade_out[start:start + n]
+            yield out
+
+    def loop_metadata(self):
+        """Loop points (in samples) for a render_loop_blocks() render."""
+        return {
+            "name": self.name,
+            "sample_rate": self.sample_rate,
+            "length_samples": self.num_samples,
+            "loop_start": 0,
+            "loop_end": self.num_samples,
+            "crossfade_samples": int(round(self.loop_crossfade * self.sample_rate)),
+        }
+
+    def render_into(self, out, start, fade=True):
+        """Mix samples ``start:start + len(out)`` of the track into ``out`` (in place)."""
+        end = start + len(out)
+        # Events are sorted by start, so only the ones before the block end can overlap
+        candidates = np.arange(np.searchsorted(self._starts, end, side="left"))
+        sr = self.sample_rate
+        for i in candidates[self._ends[candidates] > start]:
+            ev = self.events[i]
+            inst = self.instruments[ev.instrument]
+            s = max(self._starts[i], start)
+            e = min(self._ends[i], end)
+            offset = s - self._starts[i]
+
+            # Every note starts at phase zero
+            phase = np.arange(offset, offset + (e - s), dtype=np.float64)
+            phase *= ev.freq / sr
+            voice = oscillate(phase, ev.freq, inst.waveform, sr)
+            voice *= ev.amp * inst.amp
+            if inst.envelope:
+                length = int(self._lengths[i])
+                if length <= CACHED_ENVELOPE_SECONDS * sr:
+                    voice *= adsr_envelope(length, sample_rate=sr, **inst.envelope)[offset:offset + (e - s)]
+                else:
+                    voice *= adsr_envelope_block(length, offset, e - s, sample_rate=sr, **inst.envelope)
+            if inst.tremolo:
+                depth = inst.tremolo["depth"]
+                t = np.arange(s, e, dtype=np.float64) / sr
+                voice *= np.sin(2 * np.pi * inst.tremolo["rate"] * t) * depth + (1.0 - depth)
+            out[s - start:e - start] += voice
+
+        if fade and (self.fade_in or self.fade_out):
+            t = np.arange(start, end, dtype=np.float64) / sr
+            out *= fade_gain(t, self.duration, self.fade_in, self.fade_out)
+        if self.gain != 1.0:
+            out *= self.gain
+        return out
+
+
+def _expand_pattern(pattern, duration):
+    """Expand a repeating pattern into events.
+
+    ``notes`` is cycled every ``step`` seconds from ``start`` until ``until``
+    (default: the end of the track); ``null`` entries are rests.
+    """
+    step = float(pattern["step"])
+    length = float(pattern.get("length", step))
+    until = float(pattern.get("until", duration))
+    notes = pattern["notes"]
+    events = []
+    time = float(pattern.get("start", 0.0))
+    index = 0
+    while time < until - 1e-9:
+        pitch = notes[index % len(notes)]
+        if pitch is not None:
+            events.append(NoteEvent(time, min(length, until - time), note_frequency(pitch),
+                                    float(pattern.get("amp", 1.0)), pattern["instrument"]))
+        time += step
+        index += 1
+    return events
+
+
+def load_track(path, duration=None, sample_rate=SAMPLE_RATE, loop=False):
+    """Load a track data file; ``duration`` overrides the file's length.
+
+    The file lists ``instruments`` by name, single ``events`` and repeating
+    ``patterns`` (see _expand_pattern); patterns fill the chosen duration.
+    With ``loop``, events are laid out ``loop.crossfade`` seconds further
+    for render_loop_blocks(); ``loop=None`` loops if the file has a "loop" section.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    if loop is None:
+        loop = "loop" in data
+    loop_crossfade = float(data.get("loop", {}).get("crossfade", 0.0)) if loop else 0.0
+    track_duration = float(duration if duration is not None else data["duration"])
+    duration = track_duration + loop_crossfade
+
+    instruments = {}
+    for name, spec in data["instruments"].items():
+        waveform = spec.get("waveform", "sine")
+        if waveform not in WAVEFORMS:
+            raise ValueError(f"{path}: unknown waveform '{waveform}' for instrument '{name}'")
+        instruments[name] = Instrument(waveform, float(spec.get("amp", 1.0)), spec.get("envelope"),
+                                       spec.get("tremolo"))
+
+    events = []
+    for ev in data.get("events", []):
+        start = float(ev.get("start", 0.0))
+        length = float(ev["length"]) if "length" in ev else duration - start
+        events.append(NoteEvent(start, length, note_frequency(ev["pitch"]),
+                                float(ev.get("amp", 1.0)), ev["instrument"]))
+    for pattern in data.get("patterns", []):
+        events.extend(_expand_pattern(pattern, duration))
+
+    return Track(data.get("name", path), track_duration, instruments, events,
+                 fade_in=float(data.get("fade_in", 0.0)), fade_out=float(data.get("fade_out", 0.0)),
+                 gain=float(data.get("gain", 1.0)), sample_rate=sample_rate, loop_crossfade=loop_crossfade,
+                 loop=loop)
@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+Pack the tactical character and object sprites into texture atlases.
+Sprites are placed with MaxRects (best short side fit) on the smallest
+power-of-two page that holds them, spilling onto more pages past --max-size.
+Each sprite is padded and its edge pixels extruded outwards so filtering or
+sub-pixel camera offsets never sample a neighbour.
+
+Outputs (in assets/sprites/atlas by default):
+    <name>_<page>.png        atlas pages
+    <name>.json              rect index keyed by the source sprite's res:// path
+    <category>/<sprite>.tres one AtlasTexture per sprite; a drop-in Texture2D
+                             for the original PNG (e.g. in preload())
+
+Usage:
+    python tools/pack_sprite_atlas.py
+    python tools/pack_sprite_atlas.py assets/sprites/objects --name objects --padding 1
+"""
+
+import argparse
+import json
+import math
+import os
+import time
+from collections import namedtuple
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+BASE_DIR = Path(__file__).parent.parent
+SPRITES_DIR = BASE_DIR / "assets" / "sprites"
+DEFAULT_SOURCES = (SPRITES_DIR / "characters", SPRITES_DIR / "objects")
+OUTPUT_DIR = SPRITES_DIR / "atlas"
+
+DEFAULT_NAME = "tactical"
+DEFAULT_MAX_SIZE = 2048
+DEFAULT_PADDING = 2
+DEFAULT_EXTRUDE = 1
+
+Rect = namedtuple("Rect", "x y w h")
+# One packed sprite: ``rect`` is the sprite's own pixels on atlas page ``page``
+Placement = namedtuple("Placement", "source page rect")
+
+
+def res_path(path):
+    """Godot res:// path of a file inside the project."""
+    return "res://" + Path(path).resolve().relative_to(BASE_DIR.resolve()).as_posix()
+
+
+def resource_path(path, start):
+    """res:// path of ``path``, or its path relative to ``start`` outside the project."""
+    try:
+        return res_path(path)
+    except ValueError:
+        return Path(os.path.relpath(path, start)).as_posix()
+
+
+# ============================================================================
+# MAXRECTS PACKING
+# ============================================================================
+
+def _contains(outer, inner):
+    return (outer.x <= inner.x and outer.y <= inner.y and
+            inner.x + inner.w <= outer.x + outer.w and inner.y + inner.h <= outer.y + outer.h)
+
+
+def _split(free, used):
+    """Free rectangles left after placing ``used``, pruned of contained ones."""
+    result = []
+    for rect in free:
+        if (used.x >= rect.x + rect.w or used.x + used.w <= rect.x or
+                used.y >= rect.y + rect.h or used.y + used.h <= rect.y):
+            result.append(rect)
+            continue
+        # Keep the maximal parts of ``rect`` on each side of ``used``
+        if used.x > rect.x:
+            result.append(Rect(rect.x, rect.y, used.x - rect.x, rect.h))
+        if used.x + used.w < rect.x + rect.w:
+            result.append(Rect(used.x + used.w, rect.y, rect.x + rect.w - used.x - used.w, rect.h))
+        if used.y > rect.y:
+            result.append(Rect(rect.x, rect.y, rect.w, used.y - rect.y))
+        if used.y + used.h < rect.y + rect.h:
+            result.append(Rect(rect.x, used.y + used.h, rect.w, rect.y + rect.h - used.y - used.h))
+    return [rect for i, rect in enumerate(result)
+            if not any(j != i and _contains(other, rect) and (other != rect or j < i)
+                       for j, other in enumerate(result))]
+
+
+def maxrects_pack(sizes, width, height):
+    """Place ``(w, h)`` boxes in a width x height bin in the given order.
+
+    Returns ``{index: (x, y)}`` for every box that fits; boxes that do not fit
+    are skipped so the caller can put them on another page.
+    """
+    free = [Rect(0, 0, width, height)]
+    positions = {}
+    for index, (w, h) in enumerate(sizes):
+        best = None
+        for rect in free:
+            if w <= rect.w and h <= rect.h:
+                # Best short side fit, ties broken by the long side
+                score = (min(rect.w - w, rect.h - h), max(rect.w - w, rect.h - h))
+                if best is None or score < best[0]:
+                    best = (score, rect)
+        if best is None:
+            continue
+        used = Rect(best[1].x, best[1].y, w, h)
+        positions[index] = (used.x, used.y)
+        free = _split(free, used)
+    return positions
+
+
+def page_sizes(max_size):
+    """Power-of-two page sizes up to ``max_size``, smallest area (then squarest) first."""
+    sides = [1 << n for n in range(int(math.log2(max_size)) + 1)]
+    pairs = [(w, h) for w in sides for h in sides if h <= w <= 2 * h]
+    return sorted(pairs, key=lambda pair: (pair[0] * pair[1], pair[0] - pair[1]))
+
+
+def pack_pages(sizes, max_size=DEFAULT_MAX_SIZE, padding=DEFAULT_PADDING):
+    """Assign every box to a page; returns ``(page sizes, [(page, x, y) per box])``.
+
+    Each box reserves ``padding`` pixels after it and every page keeps a
+    ``padding`` margin at its top-left, so boxes never touch each other or
+    the page edge. Boxes are packed largest first.
+    """
+    cells = [(w + padding, h + padding) for w, h in sizes]
+    too_big = [i for i, (w, h) in enumerate(cells) if max(w, h) > max_size - padding]
+    if too_big:
+        w, h = sizes[too_big[0]]
+        raise ValueError(f"Box {w}x{h} does not fit a {max_size}x{max_size} page with {padding} px padding")
+
+    remaining = sorted(range(len(sizes)), key=lambda i: (max(cells[i]), cells[i][0] * cells[i][1]), reverse=True)
+    pages = []
+    placements = [None] * len(sizes)
+    while remaining:
+        batch = [cells[i] for i in remaining]
+        area = sum(w * h for w, h in batch)
+        widest = max(w for w, _ in batch) + padding
+        tallest = max(h for _, h in batch) + padding
+        for width, height in page_sizes(max_size):
+            if width * height < area or width < widest or height < tallest:
+                continue
+            positions = maxrects_pack(batch, width - padding, height - padding)
+            if len(positions) == len(batch):
+                break
+        else:
+            # Nothing holds the rest: fill a full-size page and carry on
+            width = height = max_size
+            positions = maxrects_pack(batch, width - padding, height - padding)
+        for slot, (x, y) in positions.items():
+            placements[remaining[slot]] = (len(pages), x + padding, y + padding)
+        pages.append((width, height))
+        remaining = [index for slot, index in enumerate(remaining) if slot not in positions]
+    return pages, placements
+
+
+# ============================================================================
+# ATLAS BUILDING
+# ============================================================================
+
+def collect_sprites(sources=DEFAULT_SOURCES):
+    """PNG files in ``sources`` (files or directories), in a stable order."""
+    paths = []
+    for source in map(Path, sources):
+        paths.extend(sorted(source.glob("*.png")) if source.is_dir() else [source])
+    return paths
+
+
+def build_atlas(paths, max_size=DEFAULT_MAX_SIZE, padding=DEFAULT_PADDING, extrude=DEFAULT_EXTRUDE):
+    """Pack the images at ``paths``; returns ``(page images, placements)``.
+
+    Every sprite occupies a cell of its size plus ``extrude`` pixels on each
+    side, filled by repeating its edge pixels.
+    """
+    sprites = [np.asarray(Image.open(path).convert("RGBA")) for path in paths]
+    sizes = [(sprite.shape[1] + 2 * extrude, sprite.shape[0] + 2 * extrude) for sprite in sprites]
+    for path, (w, h) in zip(paths, sizes):
+        if max(w, h) + 2 * padding > max_size:
+            raise ValueError(f"Sprite {Path(path).name} ({w}x{h} with extrusion) does not fit a "
+                             f"{max_size}x{max_size} page with {padding} px padding")
+    pages, slots = pack_pages(sizes, max_size, padding)
+
+    canvases = [np.zeros((height, width, 4), dtype=np.uint8) for width, height in pages]
+    placements = []
+    for path, sprite, (page, x, y) in zip(paths, sprites, slots):
+        cell = np.pad(sprite, ((extrude, extrude), (extrude, extrude), (0, 0)), mode="edge")
+        canvases[page][y:y + cell.shape[0], x:x + cell.shape[1]] = cell
+        rect = Rect(x + extrude, y + extrude, sprite.shape[1], sprite.shape[0])
+        placements.append(Placement(Path(path), page, rect))
+    return [Image.fromarray(canvas, "RGBA") for canvas in canvases], placements
+
+
+def atlas_texture_tres(texture_path, rect):
+    """AtlasTexture resource text for one region of an atlas page."""
+    return "\n".join([
+        '[gd_resource type="AtlasTexture" load_steps=2 format=3]', "",
+        f'[ext_resource type="Texture2D" path="{texture_path}" id="1_atlas"]', "",
+        "[resource]", 'atlas = ExtResource("1_atlas")',
+        f"region = Rect2({rect.x}, {rect.y}, {rect.w}, {rect.h})", "",
+    ])
+
+
+def write_atlas(paths, output_dir=OUTPUT_DIR, name=DEFAULT_NAME, max_size=DEFAULT_MAX_SIZE,
+                padding=DEFAULT_PADDING, extrude=DEFAULT_EXTRUDE, tres=True):
+    """Pack ``paths`` and write the pages, the JSON index and (optionally) .tres files."""
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    pages, placements = build_atlas(paths, max_size, padding, extrude)
+
+    page_paths = [output_dir / f"{name}_{i}.png" for i in range(len(pages))]
+    for page, page_path in zip(pages, page_paths):
+        page.save(page_path)
+
+    index = {
+        "pages": [{"image": path.name, "size": list(page.size)} for path, page in zip(page_paths, pages)],
+        "padding": padding,
+        "extrude": extrude,
+        "sprites": {},
+    }
+    for placement in placements:
+        entry = {"page": placement.page, **placement.rect._asdict()}
+        if tres:
+            tres_path = output_dir / placement.source.parent.name / f"{placement.source.stem}.tres"
+            tres_path.parent.mkdir(exist_ok=True)
+            texture_path = resource_path(page_paths[placement.page], tres_path.parent)
+            tres_path.write_text(atlas_texture_tres(texture_path, placement.rect), encoding="utf-8")
+            entry["texture"] = resource_path(tres_path, output_dir)
+        index["sprites"][resource_path(placement.source, output_dir)] = entry
+    with open(output_dir / f"{name}.json", "w", encoding="utf-8") as f:
+        json.dump(index, f, indent=2)
+        f.write("\n")
+    return pages, placements
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Pack tactical sprites into power-of-two texture atlases.")
+    parser.add_argument("sources", nargs="*", default=[str(p) for p in DEFAULT_SOURCES],
+                        help="sprite directories or PNG files (default: assets/sprites/characters and objects)")
+    parser.add_argument("-o", "--output-dir", default=str(OUTPUT_DIR),
+                        help="where pages, index and .tres files go (default: assets/sprites/atlas)")
+    parser.add_argument("--name", default=DEFAULT_NAME, help="atlas file name prefix (default: %(default)s)")
+    parser.add_argument("--max-size", type=int, default=DEFAULT_MAX_SIZE,
+                        help="largest page side, a power of two (default: %(default)s)")
+    parser.add_argument("--padding", type=int, default=DEFAULT_PADDING,
+                        help="empty pixels between sprites and around the page edge (default: %(default)s)")
+    parser.add_argument("--extrude", type=int, default=DEFAULT_EXTRUDE,
+                        help="pixels of repeated edge around each sprite (default: %(default)s)")
+    parser.add_argument("--no-tres", action="store_true", help="write only the pages and the JSON index")
+    args = parser.parse_args(argv)
+    if args.max_size & (args.max_size - 1) or args.max_size <= 0:
+        parser.error(f"--max-size must be a power of two, got {args.max_size}")
+    return args
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    start = time.perf_counter()
+    paths = collect_sprites(args.sources)
+    pages, placements = write_atlas(paths, args.output_dir, args.name, args.max_size,
+                                    args.padding, args.extrude, tres=not args.no_tres)
+    used = sum(p.rect.w * p.rect.h for p in placements)
+    total = sum(page.size[0] * page.size[1] for page in pages)
+    print(f"Packed {len(placements)} sprites into {len(pages)} page(s): "
+          + ", ".join(f"{w}x{h}" for w, h in (page.size for page in pages)))
+    print(f"Occupancy {used / total:.0%}; output in {os.path.relpath(args.output_dir)} "
+          f"({(time.perf_counter() - start) * 1000:.0f} ms)")
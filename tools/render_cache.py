@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Content-addressed cache for rendered audio assets.
+Encoded files are stored under a hash of everything that affects their
+content, so unchanged assets are restored (or skipped) instead of re-rendered.
+"""
+
+import filecmp
+import hashlib
+import inspect
+import json
+import os
+import shutil
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache")
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+def source_digest(obj):
+    """Hash the source code of a function, class or module."""
+    return hashlib.sha256(inspect.getsource(obj).encode("utf-8")).hexdigest()
+
+
+class RenderCache:
+    """Size-bounded LRU cache of encoded files keyed by content hash.
+
+    Entry recency is tracked with file mtimes, which are refreshed on every
+    hit, so eviction removes the least recently used entries first.
+    """
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.skipped = 0
+        os.makedirs(cache_dir, exist_ok=True)
+
+    @staticmethod
+    def key(**parts):
+        """Build a cache key from JSON-serializable render parameters."""
+        blob = json.dumps(parts, sort_keys=True, default=str)
+        return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+    def _entry_path(self, key, ext):
+        return os.path.join(self.cache_dir, key[:2], key + ext)
+
+    def status(self, key, dest):
+        """Classify ``dest`` without touching the cache or counters.
+
+        Returns "current" (dest already matches the cached entry), "cached"
+        (restorable from the cache) or "missing" (needs a render).
+        """
+        entry = self._entry_path(key, os.path.splitext(dest)[1])
+        if not os.path.exists(entry):
+            return "missing"
+        if os.path.exists(dest) and filecmp.cmp(entry, dest, shallow=False):
+            return "current"
+        return "cached"
+
+    def contains(self, key, ext):
+        """Whether an entry with extension ``ext`` is cached under ``key``."""
+        return os.path.exists(self._entry_path(key, ext))
+
+    def lookup(self, key, ext):
+        """Path of the cached entry for ``key`` (refreshing its recency), or None."""
+        entry = self._entry_path(key, ext)
+        if not os.path.exists(entry):
+            return None
+        os.utime(entry)
+        return entry
+
+    def restore(self, key, dest):
+        """Restore a cached entry to ``dest``; returns False on a miss.
+
+        If ``dest`` already holds identical content it is left untouched.
+        """
+        entry = self._entry_path(key, os.path.splitext(dest)[1])
+        if not os.path.exists(entry):
+            self.misses += 1
+            return False
+        self.hits += 1
+        os.utime(entry)
+        if os.path.exists(dest) and filecmp.cmp(entry, dest, shallow=False):
+            self.skipped += 1
+            return True
+        os.makedirs(os.path.dirname(dest) or ".", exist_ok=True)
+        shutil.copyfile(entry, dest)
+        return True
+
+    def store(self, key, src):
+        """Copy a freshly encoded file into the cache under ``key``."""
+        entry = self._entry_path(key, os.path.splitext(src)[1])
+        os.makedirs(os.path.dirname(entry), exist_ok=True)
+        tmp = entry + ".tmp"
+        shutil.copyfile(src, tmp)
+        os.replace(tmp, entry)
+
+    def evict(self):
+        """Delete least recently used entries until the cache fits ``max_bytes``."""
+        entries = []
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                path = os.path.join(root, name)
+                stat = os.stat(path)
+                entries.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            os.remove(path)
+            total -= size
+            removed += 1
+        return removed
+
+    def report(self):
+        """One-line hit/miss summary."""
+        return (f"Cache: {self.hits} hit(s) ({self.skipped} already up to date), "
+                f"{self.misses} miss(es)")
@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""
+Shared sprite toolkit for the character generators.
+Common pieces (ground shadows, chibi body and head templates) are drawn once
+per distinct set of arguments, memoized as read-only RGBA arrays and
+composited with a vectorized alpha-over, so bulk generation of dozens of
+characters reuses the layers instead of redrawing them. Character-specific
+details are then drawn on top of the composite with ImageDraw as before.
+"""
+
+import functools
+
+import numpy as np
+from PIL import Image, ImageDraw
+
+# Sprite size - 32x32 for tactical units (bosses use 64x64)
+SIZE = 32
+
+# Common colors
+OUTLINE = (25, 25, 35)           # Dark outline
+SKIN_LIGHT = (255, 213, 170)     # Light skin tone
+SKIN_MID = (235, 185, 145)       # Mid skin tone
+SKIN_SHADOW = (200, 150, 115)    # Shadow skin tone
+HAIR_DARK = (50, 40, 35)         # Dark hair
+HAIR_BROWN = (100, 70, 50)       # Brown hair
+HAIR_LIGHT = (180, 150, 110)     # Light/blonde hair
+HAIR_GRAY = (120, 120, 130)      # Gray hair
+WHITE = (255, 255, 255)
+BLACK = (0, 0, 0)
+EYE_WHITE = (255, 255, 255)
+EYE_DARK = (30, 30, 40)
+
+
+def create_base_image(size=SIZE):
+    """Create a transparent size x size image."""
+    return Image.new("RGBA", (size, size), (0, 0, 0, 0))
+
+
+# ============================================================================
+# LAYER CACHE
+# ============================================================================
+
+class _FrozenDict(tuple):
+    """Hashable stand-in for a dict argument of a cached layer."""
+
+
+def _freeze(value):
+    if isinstance(value, dict):
+        return _FrozenDict(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _thaw(value):
+    if isinstance(value, _FrozenDict):
+        return {key: _thaw(item) for key, item in value}
+    return value
+
+
+_LAYER_CACHES = []
+
+
+def cached_layer(draw_fn):
+    """Memoize ``draw_fn(draw, *args, **kwargs)`` as a layer builder.
+
+    The returned ``layer(size, *args, **kwargs)`` draws onto a transparent
+    size x size canvas the first time it sees a set of arguments and returns
+    the result as a read-only (size, size, 4) uint8 array; later calls return
+    the same array. Dict arguments (color palettes, accessories) are frozen
+    for the cache key and handed to ``draw_fn`` as dicts again.
+    """
+    @functools.lru_cache(maxsize=256)
+    def render(size, args, kwargs):
+        img = create_base_image(size)
+        draw_fn(ImageDraw.Draw(img), *map(_thaw, args), **{key: _thaw(value) for key, value in kwargs})
+        rgba = np.asarray(img).copy()
+        rgba.flags.writeable = False
+        return rgba
+
+    @functools.wraps(draw_fn)
+    def layer(size, *args, **kwargs):
+        return render(size, tuple(map(_freeze, args)), tuple(sorted((k, _freeze(v)) for k, v in kwargs.items())))
+
+    layer.cache_info = render.cache_info
+    layer.cache_clear = render.cache_clear
+    _LAYER_CACHES.append((draw_fn.__name__, render))
+    return layer
+
+
+def layer_cache_info():
+    """``{draw function name: lru_cache info}`` for every cached layer."""
+    return {name: render.cache_info() for name, render in _LAYER_CACHES}
+
+
+# ============================================================================
+# COMPOSITING
+# ============================================================================
+
+def alpha_over(dst, src):
+    """Composite RGBA array ``src`` over ``dst`` in place (straight alpha).
+
+    Opaque source pixels are copied and transparent ones skipped, so layers
+    drawn with solid colors composite exactly like drawing them in order;
+    only translucent pixels go through the blend.
+    """
+    alpha = src[..., 3]
+    opaque = alpha == 255
+    dst[opaque] = src[opaque]
+    blend = (alpha > 0) & ~opaque
+    if not blend.any():
+        return dst
+    s = src[blend].astype(np.float64)
+    d = dst[blend].astype(np.float64)
+    sa = s[:, 3:] / 255.0
+    da = d[:, 3:] / 255.0 * (1.0 - sa)
+    out_a = sa + da
+    rgb = (s[:, :3] * sa + d[:, :3] * da) / np.maximum(out_a, 1e-12)
+    dst[blend] = np.clip(np.rint(np.concatenate([rgb, out_a * 255.0], axis=1)), 0, 255).astype(np.uint8)
+    return dst
+
+
+def compose(size, *layers):
+    """Composite ``layers`` (bottom first) into a new, editable size x size image."""
+    rgba = np.zeros((size, size, 4), dtype=np.uint8)
+    for layer in layers:
+        alpha_over(rgba, layer)
+    return Image.fromarray(rgba, "RGBA")
+
+
+# ============================================================================
+# SHADOWS
+# ============================================================================
+
+def draw_shadow(draw, cx=16, width=12, y=30, depth=(2, 1), alpha=60):
+    """Draw ground shadow ellipse for 3/4 top-down grounding.
+
+    ``depth`` is how far the ellipse reaches above and below ``y``.
+    """
+    shadow_color = (0, 0, 0, alpha)
+    draw.ellipse(
+        (cx - width // 2, y - depth[0], cx + width // 2, y + depth[1]),
+        fill=shadow_color
+    )
+
+
+shadow_layer = cached_layer(draw_shadow)
+
+
+# ============================================================================
+# CHIBI TEMPLATES (3/4 top-down)
+# ============================================================================
+
+def draw_chibi_body_topdown(draw, colors, cx=16):
+    """
+    Draw a chibi body from 3/4 top-down perspective.
+    The body is SHORT and SQUAT to match reference style.
+    Feet are visible and positioned to show ground plane.
+    """
+    # === FEET (bottom-most, showing ground plane) ===
+    # Feet are small ovals at the bottom, spread slightly
+    # Left foot
+    draw.ellipse((cx - 6, 27, cx - 2, 30), fill=colors.get("shoes", colors["primary"]))
+    draw.ellipse((cx - 6, 27, cx - 2, 29), fill=OUTLINE)  # Top outline
+    # Right foot
+    draw.ellipse((cx + 2, 27, cx + 6, 30), fill=colors.get("shoes", colors["primary"]))
+    draw.ellipse((cx + 2, 27, cx + 6, 29), fill=OUTLINE)  # Top outline
+
+    # === LEGS (very short, mostly hidden by body) ===
+    # Left leg stub
+    draw.rectangle((cx - 5, 24, cx - 2, 28), fill=colors.get("pants", colors["secondary"]))
+    # Right leg stub
+    draw.rectangle((cx + 2, 24, cx + 5, 28), fill=colors.get("pants", colors["secondary"]))
+
+    # === TORSO (compact, rounded) ===
+    # Main body - wider than tall for chibi look
+    draw.ellipse((cx - 8, 17, cx + 8, 27), fill=colors["primary"])
+    # Body outline
+    draw.arc((cx - 8, 17, cx + 8, 27), 30, 150, fill=OUTLINE, width=1)
+
+    # Chest/uniform detail
+    if "secondary" in colors:
+        draw.ellipse((cx - 5, 19, cx + 5, 25), fill=colors["secondary"])
+
+    # === ARMS (small, at sides) ===
+    # Left arm - small oval
+    draw.ellipse((cx - 10, 19, cx - 6, 25), fill=colors["primary"])
+    draw.arc((cx - 10, 19, cx - 6, 25), 90, 270, fill=OUTLINE, width=1)
+    # Left hand
+    draw.ellipse((cx - 9, 23, cx - 6, 26), fill=SKIN_MID)
+
+    # Right arm - small oval
+    draw.ellipse((cx + 6, 19, cx + 10, 25), fill=colors["primary"])
+    draw.arc((cx + 6, 19, cx + 10, 25), 270, 90, fill=OUTLINE, width=1)
+    # Right hand
+    draw.ellipse((cx + 6, 23, cx + 9, 26), fill=SKIN_MID)
+
+
+def draw_chibi_head_topdown(draw, hair_color, hair_style="short", cx=16, accessories=None):
+    """
+    Draw a chibi head from 3/4 top-down perspective.
+    Head is LARGE relative to body.
+    TOP OF HEAD is clearly visible (key for top-down look).
+    """
+    accessories = accessories or {}
+
+    # === HEAD BASE (large oval) ===
+    # Head takes up significant vertical space
+    head_top = 3
+    head_bottom = 18
+    head_left = cx - 9
+    head_right = cx + 9
+
+    # Main head shape
+    draw.ellipse((head_left, head_top, head_right, head_bottom), fill=SKIN_LIGHT)
+
+    # Face shadow (lower portion for 3D effect)
+    draw.ellipse((head_left + 2, head_top + 8, head_right - 2, head_bottom - 1), fill=SKIN_MID)
+
+    # === HAIR (TOP OF HEAD - crucial for top-down view) ===
+    # Hair covers the top portion of the head, clearly visible from above
+
+    if hair_style == "short":
+        # Short spiky hair - visible from above
+        draw.ellipse((head_left - 1, head_top - 2, head_right + 1, head_top + 9), fill=hair_color)
+        # Spiky bits on top (visible from above)
+        draw.polygon([(cx - 6, head_top + 2), (cx - 4, head_top - 3), (cx - 2, head_top + 2)], fill=hair_color)
+        draw.polygon([(cx - 2, head_top + 1), (cx, head_top - 4), (cx + 2, head_top + 1)], fill=hair_color)
+        draw.polygon([(cx + 2, head_top + 2), (cx + 4, head_top - 3), (cx + 6, head_top + 2)], fill=hair_color)
+        # Top-down visible hair surface
+        draw.ellipse((head_left + 1, head_top - 1, head_right - 1, head_top + 7), fill=hair_color)
+
+    elif hair_style == "military":
+        # Short buzz cut - flat on top
+        draw.ellipse((head_left, head_top - 1, head_right, head_top + 8), fill=hair_color)
+        # Flat top surface (key for top-down)
+        draw.rectangle((head_left + 2, head_top, head_right - 2, head_top + 5), fill=hair_color)
+
+    elif hair_style == "ponytail":
+        # Hair with ponytail visible from above
+        draw.ellipse((head_left - 1, head_top - 1, head_right + 1, head_top + 9), fill=hair_color)
+        # Top surface
+        draw.ellipse((head_left + 1, head_top, head_right - 1, head_top + 6), fill=hair_color)
+        # Side hair fringes
+        draw.rectangle((head_left - 1, head_top + 6, head_left + 2, head_top + 12), fill=hair_color)
+        draw.rectangle((head_right - 2, head_top + 6, head_right + 1, head_top + 12), fill=hair_color)
+        # Ponytail (visible behind/to side from top-down)
+        draw.ellipse((head_right - 2, head_top + 2, head_right + 4, head_top + 10), fill=hair_color)
+
+    elif hair_style == "bald":
+        # Bald/very short - shows skin on top
+        draw.ellipse((head_left + 1, head_top, head_right - 1, head_top + 5), fill=SKIN_LIGHT)
+        # Slight shadow on top
+        draw.arc((head_left + 2, head_top + 1, head_right - 2, head_top + 4), 0, 180, fill=SKIN_MID)
+
+    elif hair_style == "helmet":
+        # For heavy armor - helmet instead of hair
+        pass  # Helmet drawn separately in character function
+
+    # === FACE ===
+    # Eyes - simple dots or small shapes
+    eye_y = head_top + 10
+    # Left eye
+    draw.rectangle((cx - 5, eye_y, cx - 3, eye_y + 2), fill=EYE_WHITE)
+    draw.rectangle((cx - 4, eye_y, cx - 3, eye_y + 2), fill=EYE_DARK)
+    draw.point((cx - 4, eye_y), fill=WHITE)  # Shine
+
+    # Right eye
+    draw.rectangle((cx + 3, eye_y, cx + 5, eye_y + 2), fill=EYE_WHITE)
+    draw.rectangle((cx + 3, eye_y, cx + 4, eye_y + 2), fill=EYE_DARK)
+    draw.point((cx + 4, eye_y), fill=WHITE)  # Shine
+
+    # Mouth (optional simple line)
+    draw.line((cx - 2, head_top + 14, cx + 2, head_top + 14), fill=SKIN_SHADOW, width=1)
+
+    # === HEAD OUTLINE (only lower face, not covered by hair) ===
+    # Draw outline only on the chin/jaw area (bottom arc from ~45 to ~135 degrees)
+    draw.arc((head_left, head_top, head_right, head_bottom), 30, 150, fill=OUTLINE, width=1)
+
+    # === ACCESSORIES ===
+    if accessories.get("goggles"):
+        # Goggles on forehead
+        draw.rectangle((head_left + 2, head_top + 5, head_right - 2, head_top + 8), fill=(60, 60, 70))
+        draw.rectangle((head_left + 3, head_top + 6, cx - 2, head_top + 7), fill=(100, 200, 230))
+        draw.rectangle((cx + 2, head_top + 6, head_right - 3, head_top + 7), fill=(100, 200, 230))
+
+    if accessories.get("headband"):
+        # Medical headband
+        draw.rectangle((head_left + 1, head_top + 6, head_right - 1, head_top + 8), fill=WHITE)
+        draw.rectangle((cx - 1, head_top + 6, cx + 1, head_top + 8), fill=(255, 50, 50))
+
+    if accessories.get("visor"):
+        # Tech visor/glasses
+        draw.rectangle((head_left + 2, eye_y - 1, head_right - 2, eye_y + 2), fill=(60, 60, 80))
+        draw.rectangle((head_left + 3, eye_y, cx - 2, eye_y + 1), fill=(150, 200, 255))
+        draw.rectangle((cx + 2, eye_y, head_right - 3, eye_y + 1), fill=(150, 200, 255))
+
+
+chibi_body_layer = cached_layer(draw_chibi_body_topdown)
+chibi_head_layer = cached_layer(draw_chibi_head_topdown)
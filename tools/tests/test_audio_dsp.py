@@ -0,0 +1,168 @@
+"""audio_dsp: envelopes, wavetable bands, phase continuity across blocks and loudness gating."""
+
+import numpy as np
+import pytest
+
+from audio_dsp import (SAMPLE_RATE, SILENCE_DB, OscillatorBank, PhaseState, Wavetable, adsr_envelope,
+                       adsr_envelope_block, analyze_loudness, equal_power_fades, iter_blocks,
+                       normalization_gain, oscillator_engine, retrigger_envelope, set_oscillator_engine,
+                       stage_envelope)
+
+
+@pytest.fixture(params=["math", "wavetable"])
+def engine(request):
+    previous = oscillator_engine()
+    set_oscillator_engine(request.param)
+    yield request.param
+    set_oscillator_engine(*previous)
+
+
+def tone(freq, seconds, amp=1.0):
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    return amp * np.sin(2 * np.pi * freq * t)
+
+
+# ============================================================================
+# ENVELOPES
+# ============================================================================
+
+def test_adsr_stages():
+    env = adsr_envelope(SAMPLE_RATE, attack=0.1, decay=0.1, sustain_level=0.5, release=0.2)
+    assert env.shape == (SAMPLE_RATE,)
+    assert env[0] == 0.0
+    assert env[int(0.1 * SAMPLE_RATE)] == pytest.approx(1.0)
+    assert env[int(0.5 * SAMPLE_RATE)] == pytest.approx(0.5)
+    assert env[-1] == pytest.approx(0.0, abs=1e-4)
+    assert not env.flags.writeable
+
+
+def test_adsr_short_clip_drops_sustain_then_release():
+    env = adsr_envelope(1000, attack=0.01, decay=0.01, sustain_level=0.5, release=1.0)
+    # 441 + 441 attack/decay samples leave 118 for the release and none for the sustain
+    assert env.max() == pytest.approx(1.0)
+    assert env[882] == pytest.approx(0.5)
+    assert env[-1] < 0.01
+
+
+def test_adsr_block_matches_whole_envelope():
+    whole = adsr_envelope(20000, attack=0.05, decay=0.1, sustain_level=0.6, release=0.1, curve="exponential")
+    blocks = [adsr_envelope_block(20000, start, min(3000, 20000 - start), attack=0.05, decay=0.1,
+                                  sustain_level=0.6, release=0.1, curve="exponential")
+              for start in range(0, 20000, 3000)]
+    np.testing.assert_allclose(np.concatenate(blocks), whole, rtol=0, atol=1e-12)
+
+
+def test_stage_envelope_holds_last_level():
+    env = stage_envelope(1000, ((0.001, 1.0), (0.001, 0.25)), sample_rate=10000)
+    assert env[10] == pytest.approx(1.0)
+    assert np.all(env[20:] == 0.25)
+
+
+def test_retrigger_envelope_restarts_every_note():
+    t = np.arange(SAMPLE_RATE) / SAMPLE_RATE
+    env = retrigger_envelope(t, 4.0, ((0.01, 1.0), (0.1, 0.0)))
+    starts = np.arange(4) * SAMPLE_RATE // 4
+    np.testing.assert_allclose(env[starts], 0.0, atol=1e-9)
+    np.testing.assert_allclose(env[starts + int(0.01 * SAMPLE_RATE)], 1.0, atol=1e-3)
+
+
+def test_equal_power_fades():
+    fade_in, fade_out = equal_power_fades(512)
+    assert fade_in[0] == 0.0 and fade_out[0] == 1.0
+    np.testing.assert_allclose(fade_in ** 2 + fade_out ** 2, 1.0)
+
+
+# ============================================================================
+# WAVETABLES
+# ============================================================================
+
+def highest_harmonic(table):
+    spectrum = np.abs(np.fft.rfft(table))
+    return np.flatnonzero(spectrum > 1e-6 * spectrum.max()).max()
+
+
+@pytest.mark.parametrize("waveform", ["saw", "square", "triangle"])
+def test_wavetable_bands_stay_below_nyquist(waveform):
+    table = Wavetable(waveform)
+    size = table.size
+    for freq in (20.0, 55.0, 440.0, 1000.0, 2999.0, 8000.0, 15000.0):
+        band = table.band(freq)
+        harmonics = highest_harmonic(table.tables[band, 1:1 + size])
+        assert harmonics * freq < SAMPLE_RATE / 2, (freq, band)
+
+
+def test_wavetable_band_selection():
+    table = Wavetable("saw")
+    freqs = np.array([1.0, 20.0, 30.0, 40.0, 41.0, 1000.0, 1e6])
+    bands = table.band(freqs)
+    assert list(bands[:5]) == [0, 1, 1, 2, 2]
+    assert np.all(np.diff(bands) >= 0)
+    assert bands[-1] == len(table.tables) - 1
+    # Lower bands keep more harmonics
+    assert highest_harmonic(table.tables[0, 1:-2]) > highest_harmonic(table.tables[-1, 1:-2])
+    assert len(Wavetable("sine").tables) == 1
+
+
+def test_wavetable_rejects_unknown_waveform():
+    with pytest.raises(ValueError, match="Unknown waveform 'noise'"):
+        Wavetable("noise")
+
+
+# ============================================================================
+# PHASE CONTINUITY
+# ============================================================================
+
+def bank_for(t):
+    return (OscillatorBank()
+            .add(200 + 800 * t, 0.5)
+            .add(110, 0.3, "saw", phase=0.25)
+            .add(55 + 5 * np.sin(2 * np.pi * 3 * t), 0.2, "square"))
+
+
+@pytest.mark.parametrize("block_size", [4096, 1000, 1])
+def test_phase_state_continues_banks_across_blocks(engine, block_size):
+    num_samples = 9000
+    whole = bank_for(np.arange(num_samples) / SAMPLE_RATE).render_mix(np.arange(num_samples) / SAMPLE_RATE)
+    blocks = []
+    with PhaseState() as state:
+        for _, t in iter_blocks(num_samples, block_size):
+            state.begin_block()
+            blocks.append(bank_for(t).render_mix(t))
+    np.testing.assert_allclose(np.concatenate(blocks), whole, rtol=0, atol=1e-8)
+
+
+# ============================================================================
+# LOUDNESS
+# ============================================================================
+
+def test_full_scale_1khz_sine_is_about_minus_3_lufs():
+    stats = analyze_loudness(tone(1000.0, 2.0))
+    assert stats.peak == pytest.approx(1.0, abs=1e-4)
+    assert stats.rms == pytest.approx(np.sqrt(0.5), rel=1e-3)
+    assert stats.loudness == pytest.approx(-3.0, abs=0.1)
+
+
+def test_silence_is_gated_out():
+    loud = tone(1000.0, 1.0, amp=0.5)
+    padded = np.concatenate([loud, np.zeros(4 * SAMPLE_RATE)])
+    assert analyze_loudness(np.zeros(SAMPLE_RATE)).loudness == SILENCE_DB
+    # Ungated, 4 s of silence would pull the level down ~7 dB; only the gating
+    # blocks straddling the tone's end still count
+    assert analyze_loudness(padded).rms < analyze_loudness(loud).rms / 2
+    assert analyze_loudness(padded).loudness == pytest.approx(analyze_loudness(loud).loudness, abs=1.0)
+
+
+def test_relative_gate_ignores_quiet_passages():
+    loud = tone(1000.0, 2.0, amp=0.5)
+    quiet = tone(1000.0, 2.0, amp=0.5 * 10 ** (-20 / 20))
+    mixed = analyze_loudness(np.concatenate([loud, quiet])).loudness
+    assert mixed == pytest.approx(analyze_loudness(loud).loudness, abs=0.5)
+
+
+def test_normalization_gain_targets_loudness_and_respects_peak():
+    samples = tone(1000.0, 1.0, amp=0.1)
+    stats = analyze_loudness(samples)
+    gain = normalization_gain(stats, -18.0)
+    assert analyze_loudness(samples * gain).loudness == pytest.approx(-18.0, abs=0.05)
+    assert normalization_gain(stats, 0.0, peak_ceiling=0.5) == pytest.approx(0.5 / stats.peak)
+    assert normalization_gain(analyze_loudness(np.zeros(100)), -18.0) == 1.0
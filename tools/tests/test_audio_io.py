@@ -0,0 +1,81 @@
+"""audio_io: PCM conversion, clipping and WAV headers."""
+
+import struct
+import wave
+
+import numpy as np
+import pytest
+
+from audio_io import WavWriter, output_format, to_pcm, wav_header, write_wav
+
+SAMPLES = np.array([0.0, 0.5, -0.5, 1.0, -1.0, 1.5, -1.5])
+
+
+def test_s16_scales_and_clips():
+    pcm = np.frombuffer(to_pcm(SAMPLES, "s16"), dtype="<i2")
+    assert list(pcm) == [0, 16383, -16383, 32767, -32767, 32767, -32768]
+
+
+def test_s24_packs_three_bytes_per_sample():
+    data = to_pcm(SAMPLES, "s24")
+    assert len(data) == 3 * len(SAMPLES)
+    # Sign-extend every 3-byte little-endian value back to int32
+    raw = np.frombuffer(data, dtype=np.uint8).reshape(-1, 3)
+    ints = [int.from_bytes(bytes(row), "little", signed=True) for row in raw]
+    assert ints == [0, 4194303, -4194303, 8388607, -8388607, 8388607, -8388608]
+
+
+def test_f32_clips_to_full_scale():
+    pcm = np.frombuffer(to_pcm(SAMPLES, "f32"), dtype="<f4")
+    np.testing.assert_array_equal(pcm, np.clip(SAMPLES, -1.0, 1.0))
+
+
+def test_gain_is_applied_before_clipping():
+    pcm = np.frombuffer(to_pcm([0.25, 0.75], "s16", gain=2.0), dtype="<i2")
+    assert list(pcm) == [16383, 32767]
+
+
+def test_unknown_sample_format():
+    with pytest.raises(ValueError, match="Unknown sample format 's8'"):
+        to_pcm(SAMPLES, "s8")
+    with pytest.raises(ValueError, match="Unknown sample format 's8'"):
+        wav_header(0, sample_format="s8")
+
+
+@pytest.mark.parametrize("sample_format, width, format_tag", [("s16", 2, 1), ("s24", 3, 1), ("f32", 4, 3)])
+def test_wav_header_fields(sample_format, width, format_tag):
+    header = wav_header(1000 * width, 22050, sample_format)
+    assert len(header) == 44
+    riff, riff_size, wave_id, fmt, fmt_size, tag, channels, rate, byte_rate, align, bits, data, size = \
+        struct.unpack("<4sI4s4sIHHIIHH4sI", header)
+    assert (riff, wave_id, fmt, data) == (b"RIFF", b"WAVE", b"fmt ", b"data")
+    assert riff_size == 36 + 1000 * width and size == 1000 * width
+    assert (fmt_size, tag, channels, rate) == (16, format_tag, 1, 22050)
+    assert (byte_rate, align, bits) == (22050 * width, width, 8 * width)
+
+
+@pytest.mark.parametrize("sample_format", ["s16", "s24"])
+def test_write_wav_reads_back(tmp_path, sample_format):
+    path = tmp_path / "tone.wav"
+    samples = np.sin(np.linspace(0, 20, 5000))
+    write_wav(str(path), samples, 32000, sample_format)
+    with wave.open(str(path), "rb") as f:
+        assert f.getnchannels() == 1
+        assert f.getframerate() == 32000
+        assert f.getnframes() == len(samples)
+        assert f.readframes(len(samples)) == to_pcm(samples, sample_format)
+
+
+def test_wav_writer_matches_write_wav(tmp_path):
+    samples = np.sin(np.linspace(0, 50, 10000)) * 1.2
+    write_wav(str(tmp_path / "whole.wav"), samples, gain=0.9)
+    with WavWriter(str(tmp_path / "blocks.wav"), gain=0.9) as out:
+        for start in range(0, len(samples), 3000):
+            out.write(samples[start:start + 3000])
+    assert (tmp_path / "blocks.wav").read_bytes() == (tmp_path / "whole.wav").read_bytes()
+
+
+def test_output_format_from_extension():
+    assert output_format("music/title.OGG") == "ogg"
+    with pytest.raises(ValueError, match="Cannot encode 'clip.flac'"):
+        output_format("clip.flac")
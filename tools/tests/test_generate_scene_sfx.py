@@ -0,0 +1,19 @@
+"""Scene SFX rendering: streamed renders must match the one-shot render."""
+
+import numpy as np
+import pytest
+
+import generate_scene_sfx as scene_sfx
+
+ASSETS, _ = scene_sfx.load_manifest()
+
+
+@pytest.mark.parametrize("block_size", [4096, 1000])
+@pytest.mark.parametrize("asset", ASSETS, ids=lambda asset: f"{asset.subdir}/{asset.name}")
+def test_streamed_render_matches_buffered(asset, block_size):
+    buffered = scene_sfx.render_sfx(asset)
+    scene_sfx.seed_noise(scene_sfx.asset_seed(asset.subdir, asset.name))
+    streamed = np.concatenate(list(scene_sfx.generate_sample_blocks(
+        asset.duration, asset.generator, asset.envelope, block_size)))
+    assert streamed.shape == buffered.shape
+    np.testing.assert_allclose(streamed, buffered, rtol=0, atol=1e-9)
@@ -0,0 +1,44 @@
+"""Placeholder SFX variants: one seeded bank per sound, same length, ending on 0."""
+
+import numpy as np
+
+import generate_sfx_placeholders as placeholders
+
+SFX = placeholders.PlaceholderSFX("combat", "shoot", 440.0, 300, 0.5, 10.0)
+VARIANTS = {**placeholders.DEFAULT_VARIANTS, "count": 6}
+
+
+def source():
+    return placeholders.generate_tone(SFX.frequency, SFX.duration_ms, amplitude=0.5, fade_ms=5)
+
+
+def test_variants_keep_length_and_end_on_zero():
+    src = source()
+    bank = placeholders.generate_variants(src, SFX, VARIANTS)
+    assert bank.shape == (6, len(src))
+    assert np.all(bank[:, -1] == 0.0)
+    # Every variant differs from the source and from the others
+    assert len({row.tobytes() for row in bank}) == 6
+    assert not np.any(np.all(np.isclose(bank, src), axis=1))
+
+
+def test_variants_are_seeded():
+    src = source()
+    bank = placeholders.generate_variants(src, SFX, VARIANTS)
+    np.testing.assert_array_equal(placeholders.generate_variants(src, SFX, VARIANTS), bank)
+    reseeded = placeholders.generate_variants(src, SFX, {**VARIANTS, "seed": 8})
+    assert not np.allclose(reseeded, bank)
+
+
+def test_noise_layer_follows_the_source_level():
+    src = np.concatenate([source(), np.zeros(4410)])
+    quiet = placeholders.generate_variants(src, SFX, {**VARIANTS, "noise": 0.0})
+    noisy = placeholders.generate_variants(src, SFX, VARIANTS)
+    assert not np.allclose(noisy, quiet)
+    # Silence in the source stays silent
+    assert np.all(noisy[:, -2000:] == 0.0)
+
+
+def test_trimmed_starts_fade_in_from_zero():
+    bank = placeholders.generate_variants(source(), SFX, {**VARIANTS, "trim_ms": 50.0})
+    np.testing.assert_array_equal(bank[:, 0], 0.0)
@@ -0,0 +1,87 @@
+"""music_sequencer: note parsing, block rendering and seamless loop crossfades."""
+
+import json
+
+import numpy as np
+import pytest
+
+from music_sequencer import load_track, note_frequency
+
+SAMPLE_RATE = 8000
+
+TRACK = {
+    "name": "test_loop",
+    "duration": 2.0,
+    "fade_in": 0.5,
+    "fade_out": 0.5,
+    "loop": {"crossfade": 0.25},
+    "instruments": {
+        "pad": {"waveform": "triangle", "envelope": {"attack": 0.1, "decay": 0.1, "sustain_level": 0.8,
+                                                     "release": 0.2}},
+        "drone": {"waveform": "sine", "tremolo": {"rate": 1.5, "depth": 0.3}},
+    },
+    "events": [{"instrument": "drone", "pitch": "A2", "amp": 0.3}],
+    "patterns": [{"instrument": "pad", "notes": ["C4", None, "E4", "G4"], "step": 0.3, "amp": 0.4}],
+}
+
+
+@pytest.fixture
+def track_path(tmp_path):
+    path = tmp_path / "test_loop.json"
+    path.write_text(json.dumps(TRACK), encoding="utf-8")
+    return path
+
+
+def render_loop(track, block_size=1024):
+    return np.concatenate(list(track.render_loop_blocks(block_size)))
+
+
+def test_note_frequency():
+    assert note_frequency("A4") == pytest.approx(440.0)
+    assert note_frequency("C#5") == pytest.approx(note_frequency("Db5"))
+    assert note_frequency("A3") == pytest.approx(220.0)
+    assert note_frequency(123.5) == 123.5
+    with pytest.raises(ValueError, match="Invalid pitch 'H2'"):
+        note_frequency("H2")
+
+
+def test_render_blocks_match_render(track_path):
+    track = load_track(track_path, sample_rate=SAMPLE_RATE)
+    whole = track.render()
+    assert len(whole) == 2 * SAMPLE_RATE
+    np.testing.assert_allclose(np.concatenate(list(track.render_blocks(999))), whole, rtol=0, atol=1e-12)
+
+
+def test_loop_follows_data_file(track_path):
+    assert load_track(track_path, sample_rate=SAMPLE_RATE, loop=None).loop
+    assert not load_track(track_path, sample_rate=SAMPLE_RATE).loop
+
+
+def test_loop_render_length_and_metadata(track_path):
+    track = load_track(track_path, sample_rate=SAMPLE_RATE, loop=True)
+    crossfade = int(0.25 * SAMPLE_RATE)
+    assert track.loop_metadata()["crossfade_samples"] == crossfade
+    assert track.loop_metadata()["loop_end"] == track.num_samples == 2 * SAMPLE_RATE
+    looped = render_loop(track)
+    assert len(looped) == track.num_samples
+    np.testing.assert_allclose(render_loop(track, 333), looped, rtol=0, atol=1e-12)
+
+
+def test_loop_crossfade_covers_exactly_the_head(track_path):
+    track = load_track(track_path, sample_rate=SAMPLE_RATE, loop=True)
+    crossfade = int(0.25 * SAMPLE_RATE)
+    looped = render_loop(track)
+    unfaded = track.render_into(np.zeros(track.num_samples + crossfade), 0, fade=False)
+    # Past the crossfade the loop is the plain track without its master fade
+    np.testing.assert_allclose(looped[crossfade:], unfaded[crossfade:track.num_samples], rtol=0, atol=1e-12)
+    assert not np.allclose(looped[:crossfade], unfaded[:crossfade])
+    # Wrapping around continues the music past the loop end: the head starts on the tail alone
+    assert looped[0] == pytest.approx(unfaded[track.num_samples])
+
+
+def test_loop_without_crossfade_is_the_unfaded_track(track_path):
+    track = load_track(track_path, sample_rate=SAMPLE_RATE, loop=True)
+    track.loop_crossfade = 0.0
+    looped = render_loop(track)
+    np.testing.assert_allclose(looped, track.render_into(np.zeros(track.num_samples), 0, fade=False),
+                               rtol=0, atol=1e-12)
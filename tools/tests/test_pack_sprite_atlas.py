@@ -0,0 +1,116 @@
+"""pack_sprite_atlas: MaxRects placement, padding and atlas output."""
+
+import json
+import random
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from pack_sprite_atlas import Rect, build_atlas, maxrects_pack, pack_pages, page_sizes, write_atlas
+
+
+def overlaps(a, b):
+    return a.x < b.x + b.w and b.x < a.x + a.w and a.y < b.y + b.h and b.y < a.y + a.h
+
+
+def random_sizes(count, seed=7, low=4, high=48):
+    rng = random.Random(seed)
+    return [(rng.randint(low, high), rng.randint(low, high)) for _ in range(count)]
+
+
+def test_maxrects_places_boxes_inside_the_bin_without_overlap():
+    sizes = random_sizes(60)
+    positions = maxrects_pack(sizes, 256, 256)
+    rects = [Rect(x, y, *sizes[i]) for i, (x, y) in positions.items()]
+    assert len(rects) == len(sizes)
+    for rect in rects:
+        assert rect.x >= 0 and rect.y >= 0 and rect.x + rect.w <= 256 and rect.y + rect.h <= 256
+    for i, a in enumerate(rects):
+        for b in rects[i + 1:]:
+            assert not overlaps(a, b)
+
+
+def test_maxrects_skips_boxes_that_do_not_fit():
+    positions = maxrects_pack([(32, 32), (40, 8), (8, 16)], 40, 32)
+    assert set(positions) == {0, 2}
+
+
+def test_maxrects_fills_an_exact_grid():
+    positions = maxrects_pack([(16, 16)] * 16, 64, 64)
+    assert sorted(positions.values()) == [(x, y) for x in range(0, 64, 16) for y in range(0, 64, 16)]
+
+
+def test_page_sizes_are_power_of_two_and_ordered():
+    sizes = page_sizes(256)
+    assert sizes[0] == (1, 1) and sizes[-1] == (256, 256)
+    assert all(w & (w - 1) == 0 and h & (h - 1) == 0 and h <= w <= 2 * h for w, h in sizes)
+    areas = [w * h for w, h in sizes]
+    assert areas == sorted(areas)
+
+
+@pytest.mark.parametrize("padding", [0, 1, 3])
+def test_pack_pages_keeps_padding_between_boxes_and_edges(padding):
+    sizes = random_sizes(80)
+    pages, placements = pack_pages(sizes, max_size=128, padding=padding)
+    assert len(pages) > 1
+    by_page = {}
+    for (w, h), (page, x, y) in zip(sizes, placements):
+        width, height = pages[page]
+        assert x >= padding and y >= padding
+        assert x + w + padding <= width and y + h + padding <= height
+        by_page.setdefault(page, []).append(Rect(x - padding, y - padding, w + padding, h + padding))
+    # Growing every box by the padding on one side must still leave no overlap
+    for rects in by_page.values():
+        for i, a in enumerate(rects):
+            for b in rects[i + 1:]:
+                assert not overlaps(a, b)
+
+
+def test_pack_pages_uses_the_smallest_page():
+    # Two 28 px boxes plus padding after each and the page margin: 2 + 2 * 30 = 62
+    pages, _ = pack_pages([(28, 28)] * 4, max_size=1024, padding=2)
+    assert pages == [(64, 64)]
+    pages, _ = pack_pages([(30, 30)] * 4, max_size=1024, padding=2)
+    assert pages == [(128, 128)]
+
+
+def test_pack_pages_rejects_oversized_boxes():
+    with pytest.raises(ValueError, match="does not fit a 64x64 page"):
+        pack_pages([(63, 10)], max_size=64, padding=2)
+
+
+@pytest.fixture
+def sprites(tmp_path):
+    paths = []
+    rng = np.random.default_rng(3)
+    for i, (w, h) in enumerate([(10, 12), (5, 5), (16, 8), (3, 20)]):
+        path = tmp_path / "src" / f"sprite_{i}.png"
+        path.parent.mkdir(exist_ok=True)
+        Image.fromarray(rng.integers(0, 256, (h, w, 4), dtype=np.uint8), "RGBA").save(path)
+        paths.append(path)
+    return paths
+
+
+def test_build_atlas_copies_sprites_and_extrudes_edges(sprites):
+    pages, placements = build_atlas(sprites, max_size=64, padding=2, extrude=1)
+    for placement in placements:
+        page = np.asarray(pages[placement.page])
+        source = np.asarray(Image.open(placement.source).convert("RGBA"))
+        r = placement.rect
+        np.testing.assert_array_equal(page[r.y:r.y + r.h, r.x:r.x + r.w], source)
+        # The extruded border repeats the edge pixels
+        np.testing.assert_array_equal(page[r.y - 1, r.x:r.x + r.w], source[0])
+        np.testing.assert_array_equal(page[r.y:r.y + r.h, r.x + r.w], source[:, -1])
+
+
+def test_write_atlas_index(sprites, tmp_path):
+    out = tmp_path / "atlas"
+    pages, placements = write_atlas(sprites, out, name="test", max_size=64)
+    index = json.loads((out / "test.json").read_text(encoding="utf-8"))
+    assert [page["image"] for page in index["pages"]] == [f"test_{i}.png" for i in range(len(pages))]
+    assert len(index["sprites"]) == len(sprites)
+    for placement in placements:
+        tres = (out / "src" / f"{placement.source.stem}.tres").read_text(encoding="utf-8")
+        r = placement.rect
+        assert f"region = Rect2({r.x}, {r.y}, {r.w}, {r.h})" in tres
@@ -0,0 +1,85 @@
+"""render_cache: key stability, restore and LRU eviction."""
+
+import os
+
+import pytest
+
+import generate_scene_sfx as scene_sfx
+from audio_dsp import oscillator_engine, set_oscillator_engine
+from render_cache import RenderCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return RenderCache(str(tmp_path / "cache"), max_bytes=1000)
+
+
+def write(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    return str(path)
+
+
+def test_key_ignores_argument_order():
+    assert RenderCache.key(a=1, b={"x": [1, 2], "y": 0.5}) == RenderCache.key(b={"y": 0.5, "x": [1, 2]}, a=1)
+    assert RenderCache.key(a=1, b=2) != RenderCache.key(a=1, b=3)
+    assert len(RenderCache.key(a=1)) == 64
+
+
+def test_asset_keys_are_stable_and_distinct():
+    assets, _ = scene_sfx.load_manifest()
+    keys = [scene_sfx.render_cache_key(asset) for asset in assets]
+    assert keys == [scene_sfx.render_cache_key(asset) for asset in assets]
+    assert len(set(keys)) == len(keys)
+
+
+def test_asset_key_covers_oscillator_engine():
+    asset = scene_sfx.load_manifest()[0][0]
+    previous = oscillator_engine()
+    try:
+        set_oscillator_engine("wavetable", "linear")
+        linear = scene_sfx.render_cache_key(asset)
+        set_oscillator_engine("wavetable", "cubic")
+        assert scene_sfx.render_cache_key(asset) != linear
+    finally:
+        set_oscillator_engine(*previous)
+
+
+def test_output_keys_cover_the_encoder(monkeypatch):
+    asset = scene_sfx.load_manifest()[0][0]
+    keys = [key for _, _, key in scene_sfx.asset_outputs(asset)]
+    digest = scene_sfx.source_digest
+    monkeypatch.setattr(scene_sfx, "source_digest",
+                        lambda obj: "changed" if obj is scene_sfx.audio_io else digest(obj))
+    assert [key for _, _, key in scene_sfx.asset_outputs(asset)] != keys
+
+
+def test_store_and_restore(cache, tmp_path):
+    src = write(tmp_path / "out" / "beam.mp3", b"encoded")
+    dest = str(tmp_path / "assets" / "beam.mp3")
+    assert cache.status("k1", dest) == "missing"
+    assert not cache.restore("k1", dest)
+
+    cache.store("k1", src)
+    assert cache.contains("k1", ".mp3") and not cache.contains("k1", ".ogg")
+    assert cache.status("k1", dest) == "cached"
+    assert cache.restore("k1", dest)
+    assert open(dest, "rb").read() == b"encoded"
+    assert cache.status("k1", dest) == "current"
+
+    # Identical content is left in place
+    assert cache.restore("k1", dest)
+    assert (cache.hits, cache.misses, cache.skipped) == (2, 1, 1)
+
+
+def test_evict_removes_least_recently_used(cache, tmp_path):
+    for i, key in enumerate(["aa1", "bb2", "cc3"]):
+        cache.store(key, write(tmp_path / f"{key}.wav", bytes(400)))
+        os.utime(cache.lookup(key, ".wav"), (1000 + i, 1000 + i))
+    # A hit refreshes the oldest entry, so the second one goes first
+    assert cache.lookup("aa1", ".wav")
+    assert cache.evict() == 1
+    assert cache.contains("aa1", ".wav")
+    assert not cache.contains("bb2", ".wav")
+    assert cache.contains("cc3", ".wav")
+    assert cache.evict() == 0
@@ -0,0 +1,77 @@
+"""sdf_raster: distance primitives, combinators and (supersampled) rasterization."""
+
+import numpy as np
+import pytest
+
+from sdf_raster import (band, canvas, capsule, circle, ellipse, fill, interior, intersect, outline,
+                        rasterize, rounded_rect, subtract, union)
+
+RED = (255, 0, 0)
+BLUE = (0, 0, 255, 128)
+
+
+def test_canvas_samples_pixel_centres():
+    x, y = canvas((3, 2))
+    assert x.shape == (1, 3) and y.shape == (2, 1)
+    assert list(x.ravel()) == [0, 1, 2] and list(y.ravel()) == [0, 1]
+    x, y = canvas((3, 2), supersample=4)
+    assert x.shape == (1, 12) and y.shape == (8, 1)
+    np.testing.assert_allclose(x.reshape(3, 4).mean(axis=1), [0, 1, 2], atol=1e-6)
+    assert x.max() < 2.5 and x.min() > -0.5
+
+
+def test_primitive_signs_and_distances():
+    assert circle(np.float64(5), 5, (5, 5), 3) == -3
+    assert circle(np.float64(9), 5, (5, 5), 3) == pytest.approx(1)
+    px = np.array([8.0, 5.0, 6.0])
+    py = np.array([5.0, 7.0, 5.0])
+    d = ellipse(px, py, (5, 5), (3, 2))
+    np.testing.assert_allclose(d[:2], 0.0, atol=1e-12)
+    assert d[2] < 0
+    assert capsule(np.float64(5), 3, (0, 0), (10, 0), 1) == pytest.approx(2)
+    assert capsule(np.float64(-2), 0, (0, 0), (10, 0), 1) == pytest.approx(1)
+    assert rounded_rect(np.float64(0), 0, (0, 0), (4, 2)) == pytest.approx(-2)
+    assert rounded_rect(np.float64(7), 6, (0, 0), (4, 2)) == pytest.approx(5)
+    # Rounded corners pull the corner distance in
+    assert rounded_rect(np.float64(4), 2, (0, 0), (4, 2), radius=1) > 0
+
+
+def test_combinators():
+    a = np.array([-1.0, 2.0, -3.0])
+    b = np.array([1.0, -2.0, -1.0])
+    assert list(union(a, b)) == [-1, -2, -3]
+    assert list(intersect(a, b)) == [1, 2, -1]
+    assert list(subtract(a, b)) == [-1, 2, 1]
+
+
+def test_bands():
+    d = np.array([-3.0, -1.5, -1.0, 0.0, 0.5])
+    assert list(fill(d)) == [True, True, True, True, False]
+    assert list(outline(d, 1.0)) == [False, False, True, True, False]
+    assert list(interior(d, 1.0)) == [True, True, False, False, False]
+    assert list(band(d, -0.5, 1.0)) == [False, False, False, True, True]
+
+
+def test_rasterize_matches_per_pixel_loop():
+    def paint(x, y):
+        disc = circle(x, y, (7, 6), 4.5)
+        return [(fill(disc), RED), (interior(disc, 1.0), BLUE)]
+
+    rgba = rasterize(paint, (16, 12))
+    assert rgba.shape == (12, 16, 4) and rgba.dtype == np.uint8
+    for py in range(12):
+        for px in range(16):
+            dist = np.hypot(px - 7, py - 6) - 4.5
+            expected = BLUE if dist < -1.0 else RED + (255,) if dist <= 0 else (0, 0, 0, 0)
+            assert tuple(rgba[py, px]) == expected, (px, py)
+
+
+def test_supersampling_antialiases_edges():
+    def paint(x, y):
+        return [(fill(x - 1.0), RED)]
+
+    # Column 1 is half covered: the edge sits on its centre
+    rgba = rasterize(paint, (3, 2), supersample=4)
+    assert list(rgba[0, :, 3]) == [255, 128, 0]
+    assert tuple(rgba[0, 1, :3]) == RED
+    assert tuple(rgba[0, 2]) == (0, 0, 0, 0)